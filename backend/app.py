@@ -1,25 +1,189 @@
-from flask import Flask
-from flask import request, abort, jsonify, send_from_directory
+from flask import Flask, Response
+from flask import request, abort, jsonify, send_from_directory, copy_current_request_context, stream_with_context
 
-from backend.matrix import AugmentedMatrix
+from backend.budget import BudgetExceeded, SolveBudget
+from backend.blocks import density, find_blocks, solve_by_blocks
+from backend.engine_selection import ENGINES, select_engine
+from backend.jobs import JobQueue
+from backend.lu_cache import LUCache
+from backend.result_cache import FileCacheBackend, MemoryCacheBackend, ResultCache, canonical_key
+from backend.sessions import EliminationSession, SessionStore
+from backend.single_flight import SingleFlight
+from backend.step_log_store import StepLog, StepLogStore
+from backend.streaming import CONTENT_FORMATS, STREAM_FORMATS, encode_event, encode_row_deltas, stream_events
+from backend.structure import classify_structure
+from backend.matrix import AugmentedMatrix, Matrix
+from backend.numeric_matrix import NumericAugmentedMatrix, NumericMatrix
 
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
+import os
+import tempfile
 
 
 app = Flask(__name__, static_folder="../frontend/dist", static_url_path='')
 
+# Largest number of rows, or columns, of an augmented matrix
+app.config["MAX_MATRIX_DIMENSION"] = 2000
+
+# Thresholds, in number of coefficient matrix entries, used to pick an
+# engine when a request does not ask for one. See select_engine().
+app.config["STEP_LOG_MAX_ENTRIES"] = 100
+app.config["EXACT_MAX_ENTRIES"] = 2500
+app.config["EXACT_MAX_ENTRIES_NON_INTEGER"] = 900
+
+# Largest number of LU factorizations of coefficient matrices kept for the
+# "exact" engine, 0 turns the cache off
+app.config["LU_CACHE_SIZE"] = 128
+
+# Cache of /system-of-equations responses. The backend is either "memory",
+# "file" (kept in RESULT_CACHE_DIRECTORY) or "off". A TTL of 0 keeps
+# results forever.
+app.config["RESULT_CACHE_BACKEND"] = "memory"
+app.config["RESULT_CACHE_MAX_BYTES"] = 64 * 1024 * 1024
+app.config["RESULT_CACHE_TTL"] = 3600
+app.config["RESULT_CACHE_DIRECTORY"] = os.path.join(app.instance_path, "result_cache")
+
+# Systems that split into independent blocks of variables are solved one
+# block at a time by the "exact" and "numeric" engines, as long as at most
+# BLOCK_MAX_DENSITY of their coefficient entries are non-zero, 0 turns this
+# off. Blocks of at least BLOCK_PARALLEL_MIN_ENTRIES entries are solved in
+# a pool of BLOCK_WORKERS processes, as many as there are CPUs if None.
+app.config["BLOCK_MAX_DENSITY"] = 0.5
+app.config["BLOCK_PARALLEL_MIN_ENTRIES"] = 10000
+app.config["BLOCK_WORKERS"] = None
+
+# Systems solved by the "step-logged" engine are kept for SESSION_TTL
+# seconds, up to SESSION_MAX_COUNT of them taking up to SESSION_MAX_BYTES,
+# so that a gauss-jordan-elimination request sending back their "solveId"
+# only runs the upward phase, and edits to them only redo the steps that
+# depend on the edited entries. A SESSION_MAX_COUNT of 0 turns sessions
+# off, a SESSION_TTL of 0 keeps them until they are evicted.
+app.config["SESSION_MAX_COUNT"] = 64
+app.config["SESSION_TTL"] = 600
+app.config["SESSION_MAX_BYTES"] = 64 * 1024 * 1024
+
+# How Fraction engines pick the pivot row of each column, unless a request
+# asks for one of Matrix.PIVOT_STRATEGIES as "pivotStrategy". The default
+# "pedagogical" strategy gives steps that are easy to follow by hand,
+# "smallest_bit_size" keeps the Fractions of the steps small, and
+# "markowitz" keeps sparse matrices sparse.
+app.config["PIVOT_STRATEGY"] = "pedagogical"
+
+# Steps of "paged" responses are kept for GET /solves/<id>/steps, up to
+# STEP_LOG_MAX_COUNT of them in memory, with a copy of the whole matrix
+# every STEP_LOG_CHECKPOINT_INTERVAL steps. Step logs evicted from memory
+# spill to STEP_LOG_SPILL_DIRECTORY, whose oldest files are removed past
+# STEP_LOG_SPILL_MAX_BYTES, 0 turns spilling off. A page holds
+# STEP_PAGE_SIZE steps by default, STEP_PAGE_MAX_SIZE at most.
+app.config["STEP_LOG_MAX_COUNT"] = 32
+app.config["STEP_LOG_CHECKPOINT_INTERVAL"] = 32
+app.config["STEP_LOG_SPILL_DIRECTORY"] = os.path.join(tempfile.gettempdir(), "matrix_solver_step_logs")
+app.config["STEP_LOG_SPILL_MAX_BYTES"] = 256 * 1024 * 1024
+app.config["STEP_PAGE_SIZE"] = 20
+app.config["STEP_PAGE_MAX_SIZE"] = 200
+
+# Systems sent to POST /jobs are solved by JOB_WORKERS worker processes,
+# as many as there are CPUs if None, with up to JOB_MAX_QUEUE_DEPTH jobs
+# queued or running at once. Finished jobs are kept for JOB_TTL seconds.
+app.config["JOB_WORKERS"] = 2
+app.config["JOB_MAX_QUEUE_DEPTH"] = 16
+app.config["JOB_TTL"] = 600
+
+# Limits on a single solve, checked after every pivot, see
+# backend.budget.SolveBudget. A solve that reaches one answers with the
+# steps done so far and why it stopped under "stopped", rather than tying
+# up a worker. Requests may ask for tighter limits as a "budget" of
+# "maxSeconds", "maxRowOps" and "maxEntryBits". None is no limit. Being
+# checked per pivot, a row operation limit may be overshot by up to one
+# row operation for every row of the matrix.
+app.config["SOLVE_MAX_SECONDS"] = None
+app.config["SOLVE_MAX_ROW_OPS"] = None
+app.config["SOLVE_MAX_ENTRY_BITS"] = None
+
+# Any of the above can be overridden through environment variables,
+# such as FLASK_EXACT_MAX_ENTRIES=10000
+app.config.from_prefixed_env()
+
+lu_cache = LUCache(maxsize=app.config["LU_CACHE_SIZE"])
+
+
+def create_result_cache():
+    backend = app.config["RESULT_CACHE_BACKEND"]
+    max_bytes = app.config["RESULT_CACHE_MAX_BYTES"]
+
+    if backend == "memory":
+        backend = MemoryCacheBackend(max_bytes=max_bytes)
+    elif backend == "file":
+        backend = FileCacheBackend(app.config["RESULT_CACHE_DIRECTORY"], max_bytes=max_bytes)
+    elif backend == "off":
+        return None
+    else:
+        raise ValueError(f"Invalid result cache backend: {backend}")
+
+    return ResultCache(backend, ttl=app.config["RESULT_CACHE_TTL"] or None)
+
+
+result_cache = create_result_cache()
+
+# Identical systems being solved at the same time are only solved once
+single_flight = SingleFlight()
+
+sessions = SessionStore(
+    maxsize=app.config["SESSION_MAX_COUNT"], ttl=app.config["SESSION_TTL"] or None,
+    max_bytes=app.config["SESSION_MAX_BYTES"]
+)
+
+
+def create_step_log_store():
+    spill_backend = None
+    if app.config["STEP_LOG_SPILL_MAX_BYTES"]:
+        spill_backend = FileCacheBackend(
+            app.config["STEP_LOG_SPILL_DIRECTORY"], max_bytes=app.config["STEP_LOG_SPILL_MAX_BYTES"]
+        )
+
+    return StepLogStore(maxsize=app.config["STEP_LOG_MAX_COUNT"], spill_backend=spill_backend)
+
+
+step_logs = create_step_log_store()
+
+# Worker processes are only started once the first job is submitted
+jobs = JobQueue(
+    max_workers=app.config["JOB_WORKERS"], max_queue_depth=app.config["JOB_MAX_QUEUE_DEPTH"],
+    ttl=app.config["JOB_TTL"] or None
+)
+
+# Only started once a large enough block needs it
+block_executor = None
+
+
+def get_block_executor() -> ProcessPoolExecutor:
+    global block_executor
+
+    if block_executor is None:
+        block_executor = ProcessPoolExecutor(max_workers=app.config["BLOCK_WORKERS"])
+
+    return block_executor
+
+
+@app.before_request
+def check_request_body():
+    # Every POST endpoint reads its fields from a JSON object
+    if request.method == "POST" and not isinstance(request.get_json(silent=True), dict):
+        abort(400, description="Request body must be a JSON object")
+
 
 # Helper functions
-def is_valid_matrix_dimensions(m: str, n: str) -> bool:
+def is_valid_matrix_dimensions(m: str, n: str, max_dimension: int = 10) -> bool:
 
     if not m.isnumeric() or not n.isnumeric():
         return False
 
     try:
-        if not int(m) > 0 or not int(m) <= 10:
+        if not int(m) > 0 or not int(m) <= max_dimension:
             # Invalid m
             return False
-        elif not int(n) > 1 or not int(n) <= 10:
+        elif not int(n) > 1 or not int(n) <= max_dimension:
             # Invalid n
             return False
         else:
@@ -75,15 +239,761 @@ def process_constant_matrix_data(data: dict, m: int) -> list:
     return user_matrix_data
 
 
-def solve_system_of_equations(matrix):
-    if request.json["method"] == "gaussian-elimination":
-        matrix.gaussian_elimination()
+def get_constant_matrix(m: int) -> list:
+    """
+    Returns the m by k constant matrix of the request. It is either given
+    as "constMatrix", a list of m rows, or as "constVectors", a list of k
+    constant vectors of m entries each that are solved all at once.
+    """
+
+    if "constVectors" not in request.json:
+        constant_matrix = request.json.get("constMatrix")
+    else:
+        constant_vectors = request.json["constVectors"]
+
+        if not isinstance(constant_vectors, list) or not constant_vectors:
+            abort(400, description="Invalid Matrix Values")
+
+        if any(not isinstance(vector, list) or len(vector) != m for vector in constant_vectors):
+            abort(400, description="Invalid Matrix Values")
+
+        # Each vector becomes a column of the constant matrix
+        constant_matrix = [list(row) for row in zip(*constant_vectors)]
+
+    if not isinstance(constant_matrix, list) or len(constant_matrix) != m:
+        abort(400, description="Invalid Matrix Values")
+
+    if any(not isinstance(row, list) or len(row) != len(constant_matrix[0]) for row in constant_matrix) or not constant_matrix[0]:
+        abort(400, description="Invalid Matrix Values")
+
+    return constant_matrix
+
+
+def get_system() -> tuple:
+    """
+    Validated system of the request, as (coefficient matrix, constant
+    matrix, m, n) with every entry as a Fraction, n counting the columns of
+    both matrices.
+    """
+
+    coefficient_matrix = request.json.get("matrix")
+
+    m = request.json.get("m")
+    n = request.json.get("n")
+
+    if not is_valid_matrix_dimensions(str(m), str(n), app.config["MAX_MATRIX_DIMENSION"]):
+        # Invalid dimensions
+        abort(400, description="Invalid Matrix Dimensions")
+
+    m, n = int(m), int(n)
+
+    constant_matrix = get_constant_matrix(m)
+    num_constant_columns = len(constant_matrix[0])
+
+    # At least one column has to be left for the coefficient matrix
+    if n - num_constant_columns < 1:
+        abort(400, description="Invalid Matrix Dimensions")
+
+    if not isinstance(coefficient_matrix, list) or len(coefficient_matrix) != m:
+        abort(400, description="Invalid Matrix Values")
+
+    try:
+        for i, row in enumerate(coefficient_matrix):
+            if not isinstance(row, list) or len(row) != n - num_constant_columns:
+                abort(400, description="Invalid Matrix Values")
+
+            for j, num in enumerate(row):
+                coefficient_matrix[i][j] = Fraction(num)
+
+        for i, row in enumerate(constant_matrix):
+            for j, num in enumerate(row):
+                constant_matrix[i][j] = Fraction(num)
+    except (TypeError, ValueError, ZeroDivisionError):
+        # Invalid Entry
+        abort(400, description="Invalid Matrix Values")
+
+    return coefficient_matrix, constant_matrix, m, n
+
+
+def fits_float(matrix: list) -> bool:
+    """ Whether every entry of matrix can be turned into a float without overflowing. """
+
+    try:
+        for row in matrix:
+            for entry in row:
+                float(entry)
+    except OverflowError:
+        return False
+
+    return True
+
+
+def get_engine(coefficient_matrix: list, m: int, n: int, constant_matrix: list = None) -> tuple:
+    """
+    n being the number of columns of the coefficient matrix. A requested
+    engine is only used if it is no slower than the one that would have
+    been picked, so that the size limits of the engines always hold.
+    Systems with entries out of the range of a float can not be solved by
+    the "numeric" engine, whether it was requested or picked.
+    """
+
+    engine = request.json.get("engine", "auto")
+
+    if engine != "auto" and engine not in ENGINES:
+        abort(400, description="Invalid solving engine")
+
+    selected_engine, reason = select_engine(
+        coefficient_matrix, m, n,
+        step_log_max_entries=app.config["STEP_LOG_MAX_ENTRIES"],
+        exact_max_entries=app.config["EXACT_MAX_ENTRIES"],
+        exact_max_entries_non_integer=app.config["EXACT_MAX_ENTRIES_NON_INTEGER"]
+    )
+
+    if engine != "auto" and ENGINES.index(engine) < ENGINES.index(selected_engine):
+        # ENGINES go from the slowest to the fastest
+        abort(400, description=f"The {engine} engine can not be used for a {m}x{n} matrix: {reason}")
+
+    if engine == "auto":
+        engine = selected_engine
+    else:
+        reason = "requested"
+
+    if engine == "numeric" and not (fits_float(coefficient_matrix) and fits_float(constant_matrix or [])):
+        abort(400, description="Entries too large for the numeric engine")
+
+    return engine, reason
+
+
+def get_pivot_strategy() -> str:
+    pivot_strategy = request.json.get("pivotStrategy", app.config["PIVOT_STRATEGY"])
+
+    # Anything but a string could be unhashable
+    if not isinstance(pivot_strategy, str) or pivot_strategy not in Matrix.PIVOT_STRATEGIES:
+        abort(400, description="Invalid pivot strategy")
+
+    return pivot_strategy
+
+
+def get_budget() -> SolveBudget:
+    """
+    Limits of the "budget" of the request, each capped by the one set
+    for the app.
+    """
+
+    budget = request.json.get("budget") or dict()
+    if not isinstance(budget, dict):
+        abort(400, description="Invalid budget")
+
+    limits = []
+    for name, config_name, limit_type in (
+        ("maxSeconds", "SOLVE_MAX_SECONDS", (int, float)),
+        ("maxRowOps", "SOLVE_MAX_ROW_OPS", int),
+        ("maxEntryBits", "SOLVE_MAX_ENTRY_BITS", int)
+    ):
+        limit = budget.get(name)
+        max_limit = app.config[config_name]
+
+        # bool is an int too
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, limit_type) or limit <= 0):
+            abort(400, description=f"Invalid budget {name}")
 
-    elif request.json["method"] == "gauss-jordan-elimination":
-        matrix.gaussian_elimination(gauss_jordan=True)
+        if max_limit is not None:
+            limit = max_limit if limit is None else min(limit, max_limit)
+
+        limits.append(limit)
+
+    return SolveBudget(*limits)
+
+
+def build_augmented_matrix(engine: str, coefficient_matrix: list, constant_matrix: list, m: int, n: int):
+    if engine == "step-logged":
+        return AugmentedMatrix(coefficient_matrix, constant_matrix, dimension=(m, n), log_mode="delta")
+    elif engine == "exact":
+        return AugmentedMatrix(coefficient_matrix, constant_matrix, dimension=(m, n), log_mode="off")
     else:
+        return NumericAugmentedMatrix(coefficient_matrix, constant_matrix, dimension=(m, n), log_mode="off")
+
+
+def get_blocks(matrix, engine: str, structure: str) -> list:
+    """
+    Returns the independent blocks of the coefficient matrix, see
+    find_blocks(), or an empty list if they are not worth looking for.
+    """
+
+    # Steps of the "step-logged" engine are easiest to follow in one pass,
+    # and structured matrices have a faster path already
+    if engine == "step-logged" or structure not in (None, "general"):
+        return []
+
+    # Dense matrices can not hold more than one sizable block
+    if density(matrix.data, matrix.m, matrix.n) > app.config["BLOCK_MAX_DENSITY"]:
+        return []
+
+    return find_blocks(matrix.data, matrix.m, matrix.n)
+
+
+def get_method() -> str:
+    """ Solving "method" of the request. """
+
+    method = request.json.get("method")
+
+    if method not in ("gaussian-elimination", "back-substitution", "gauss-jordan-elimination"):
         abort(400, description="Invalid solving method")
 
+    return method
+
+
+def get_gauss_jordan() -> bool:
+    """ Whether the method of the request needs the matrix in RREF. """
+
+    # Back substitution only needs the matrix in REF, see get_solution()
+    return get_method() == "gauss-jordan-elimination"
+
+
+def solve_system_of_equations(matrix, engine: str, structure: str = None, pivot_strategy: str = "pedagogical",
+                              budget: SolveBudget = None) -> bool:
+    """
+    budget, if given, is expected to be watching matrix already, see
+    SolveBudget.watch().
+
+    Returns:
+        bool: True if the matrix was solved by replaying a cached LU
+                    factorization, False otherwise.
+    """
+
+    gauss_jordan = get_gauss_jordan()
+
+    # Blocks and the LU cache eliminate copies of the matrix, which the
+    # budget has no hold on
+    budgeted = budget is not None and budget.limited
+
+    blocks = get_blocks(matrix, engine, structure) if not budgeted else []
+
+    if len(blocks) > 1:
+        solve_by_blocks(
+            matrix, engine, blocks, gauss_jordan=gauss_jordan, executor=get_block_executor(),
+            parallel_min_entries=app.config["BLOCK_PARALLEL_MIN_ENTRIES"]
+        )
+    elif engine == "numeric":
+        matrix.gaussian_elimination(gauss_jordan=gauss_jordan)
+    elif engine == "exact" and structure in (None, "general") and budgeted:
+        matrix.bareiss_elimination(gauss_jordan=gauss_jordan)
+    elif engine == "exact" and structure in (None, "general"):
+        # Coefficient matrices solved before only need their cached
+        # factorization replayed on the constant matrix
+        factorization = lu_cache.get_or_factorize(matrix.data, (matrix.m, matrix.n))
+        coefficient_rows, constant_rows = factorization.solve(matrix.constant_matrix, gauss_jordan=gauss_jordan)
+
+        matrix.data[:] = coefficient_rows
+        matrix.constant_matrix[:] = constant_rows
+
+        return True
+    else:
+        # Structured matrices take a fast path of their own
+        matrix.gaussian_elimination(gauss_jordan=gauss_jordan, structure=structure, pivot_strategy=pivot_strategy)
+
+    return False
+
+
+def get_row_ops_content(matrix, engine: str, starting_matrix: list, starting_constant_matrix: list,
+                        structure: str = None, lu_replayed: bool = False) -> list:
+    """
+    lu_replayed being whether the matrix was solved by replaying a cached
+    LU factorization, see solve_system_of_equations().
+    """
+
+    if engine == "step-logged":
+        return matrix.action_logger.row_ops_content
+
+    # Engines without a step log only show the starting and final matrix,
+    # as a single step done by the whole engine at once
+    if lu_replayed:
+        row_op_name = "lu_replay"
+    elif engine == "numeric":
+        row_op_name = "numeric_elimination"
+    elif structure in (None, "general"):
+        row_op_name = "bareiss_elimination"
+    else:
+        row_op_name = "structured_elimination"
+    to_str = matrix.action_logger.deepcopy_matrix_to_str
+
+    return [
+        [tuple(["Starting Matrix"]), (row_op_name,)],
+        [starting_matrix, to_str(matrix.data)],
+        [starting_constant_matrix, to_str(matrix.constant_matrix)]
+    ]
+
+
+def get_solution(matrix) -> dict:
+    """
+    Solution of a matrix in REF or RREF through back substitution, with
+    every number as a str. See backend.solution.back_substitution().
+    """
+
+    solution = matrix.solve()
+
+    return {
+        "freeVariables": solution["freeVariables"],
+        "nullspace": [[str(entry) for entry in vector] for vector in solution["nullspace"]],
+        "solutions": [
+            {
+                "consistent": constant_solution["consistent"],
+                "particular": [str(entry) for entry in constant_solution["particular"]] if constant_solution["consistent"] else None
+            }
+            for constant_solution in solution["solutions"]
+        ]
+    }
+
+
+def solve_system(engine: str, structure: str, coefficient_matrix: list, constant_matrix: list, m: int, n: int,
+                 cache_key: str, previous_session: EliminationSession = None, changed_columns: set = None,
+                 pivot_strategy: str = "pedagogical", listener=None, budget: SolveBudget = None) -> dict:
+    """
+    Solves the system, returning the content of the response, with
+    pivot_strategy being one of Matrix.PIVOT_STRATEGIES. An edited
+    copy of the system of previous_session, with changed_columns being the
+    columns of the coefficient matrix with an edited entry, reuses the
+    steps of the session that do not depend on the edits, with the number
+    of them under "stepsReused". listener, if given, is called with every
+    step as it is logged, see MatrixActionLogger.add_listener().
+
+    A solve that goes over budget is stopped at the next pivot, with the
+    steps done so far, no "solution" and why it stopped under "stopped",
+    see get_stopped_content(). Stopped solves are neither cached nor kept
+    as sessions.
+    """
+
+    # Define matrix from validated user data
+    augmented_matrix = build_augmented_matrix(engine, coefficient_matrix, constant_matrix, m, n)
+
+    if listener is not None:
+        augmented_matrix.action_logger.add_listener(listener)
+
+    to_str = augmented_matrix.action_logger.deepcopy_matrix_to_str
+    starting_matrix = to_str(coefficient_matrix)
+    starting_constant_matrix = to_str(constant_matrix)
+
+    if budget is not None and budget.limited:
+        budget.watch(augmented_matrix)
+
+    steps_reused = None
+    stopped = None
+    lu_replayed = False
+
+    try:
+        if previous_session is not None:
+            steps_reused = previous_session.resolve(augmented_matrix, changed_columns, gauss_jordan=get_gauss_jordan())
+
+        # Solve matrix, unless the steps of the previous session did
+        if steps_reused is None:
+            lu_replayed = solve_system_of_equations(augmented_matrix, engine, structure, pivot_strategy, budget=budget)
+    except BudgetExceeded as error:
+        stopped = error
+
+    # The matrix is kept by its session, whose later steps are not part of
+    # this request
+    if listener is not None:
+        augmented_matrix.action_logger.remove_listener(listener)
+
+    # Nor is its budget, see system_of_equations()
+    augmented_matrix.pivot_callback = None
+
+    if stopped is not None:
+        return get_stopped_content(augmented_matrix, engine, starting_matrix, starting_constant_matrix, stopped)
+
+    solved_content = {
+        "rowOperationsContent": get_row_ops_content(
+            augmented_matrix, engine, starting_matrix, starting_constant_matrix, structure, lu_replayed=lu_replayed
+        ),
+        "solution": get_solution(augmented_matrix)
+    }
+
+    # Systems left in REF can be turned into RREF later on, see
+    # resume_system(), and edited ones re-solved, see
+    # system_of_equations_changes(). Only the step log of the
+    # "step-logged" engine has steps worth keeping, the other engines are
+    # fast enough to solve again.
+    if sessions.maxsize > 0 and engine == "step-logged":
+        # Keyed by the starting system, as coefficient_matrix has been
+        # eliminated in place along with augmented_matrix by now
+        session = EliminationSession(
+            augmented_matrix, engine, structure,
+            canonical_key(starting_matrix, starting_constant_matrix, None, engine, pivot_strategy),
+            solved_content["rowOperationsContent"], pivot_strategy=pivot_strategy
+        )
+        solved_content = dict(solved_content, solveId=sessions.create(session))
+
+    # Along with the solveId, see get_cached_content()
+    if result_cache is not None:
+        result_cache.set(cache_key, solved_content)
+
+    if previous_session is not None:
+        solved_content["stepsReused"] = steps_reused or 0
+
+    return solved_content
+
+
+def run_job(engine: str, structure: str, coefficient_matrix: list, constant_matrix: list, m: int, n: int,
+            gauss_jordan: bool, pivot_strategy: str, progress) -> dict:
+    """
+    Solves the system of a job in a worker process, see JobQueue.submit(),
+    with progress set as the pivot callback of its matrix. Works like
+    solve_system() without the request, caches and sessions of the app,
+    which live in the process serving requests.
+    """
+
+    augmented_matrix = build_augmented_matrix(engine, coefficient_matrix, constant_matrix, m, n)
+    augmented_matrix.pivot_callback = progress
+
+    to_str = augmented_matrix.action_logger.deepcopy_matrix_to_str
+    starting_matrix = to_str(coefficient_matrix)
+    starting_constant_matrix = to_str(constant_matrix)
+
+    # Independent blocks are not split up, as a worker can not start
+    # processes of its own, and the LU cache of the app is out of reach
+    if engine == "numeric":
+        augmented_matrix.gaussian_elimination(gauss_jordan=gauss_jordan)
+    elif engine == "exact" and structure in (None, "general"):
+        augmented_matrix.bareiss_elimination(gauss_jordan=gauss_jordan)
+    else:
+        augmented_matrix.gaussian_elimination(gauss_jordan=gauss_jordan, structure=structure, pivot_strategy=pivot_strategy)
+
+    return {
+        "rowOperationsContent": get_row_ops_content(augmented_matrix, engine, starting_matrix, starting_constant_matrix, structure),
+        "solution": get_solution(augmented_matrix)
+    }
+
+
+def get_job_content(job_id: str) -> dict:
+    """
+    Status of the job as sent to the client, with the response content of
+    its system once it is "done", see JobQueue.get().
+    """
+
+    job = jobs.get(job_id)
+    if job is None:
+        abort(404, description="Unknown or expired job id")
+
+    job_content = {
+        "jobId": job_id,
+        "status": job["status"],
+        "progress": {"pivotsDone": job["pivotsDone"], "totalPivots": job["totalPivots"]}
+    }
+
+    if job["status"] == "done":
+        engine, engine_reason, structure = job["context"]
+        job_content["result"] = get_response_content(job["result"], engine, engine_reason, structure)
+    elif job["status"] == "failed":
+        job_content["error"] = "Could not solve matrix"
+
+    return job_content
+
+
+def get_flight_key(cache_key: str, budget: SolveBudget) -> str:
+    # Solves with different budgets may stop at different steps, so only
+    # those with the same budget share a solve
+    if not budget.limited:
+        return cache_key
+
+    return f"{cache_key};budget={budget.max_seconds},{budget.max_row_ops},{budget.max_entry_bits}"
+
+
+def get_stopped_content(matrix, engine: str, starting_matrix: list, starting_constant_matrix: list,
+                        stopped: BudgetExceeded) -> dict:
+    """
+    Content of a solve stopped by its budget, with every step logged
+    before it stopped. Engines without a step log only show the starting
+    matrix, as they eliminate a copy of it.
+    """
+
+    if engine == "step-logged":
+        row_ops_content = matrix.action_logger.row_ops_content
+    else:
+        row_ops_content = [[tuple(["Starting Matrix"])], [starting_matrix], [starting_constant_matrix]]
+
+    return {
+        "rowOperationsContent": row_ops_content,
+        "solution": None,
+        "stopped": {
+            "reason": stopped.reason,
+            "description": stopped.description,
+            "pivotsDone": stopped.pivots_done,
+            "totalPivots": min(matrix.m, matrix.n)
+        }
+    }
+
+
+def get_session(coefficient_matrix: list, constant_matrix: list, engine: str, pivot_strategy: str):
+    """
+    Returns the session of the "solveId" sent with a
+    gauss-jordan-elimination request, or None if there is no session for
+    the system of the request.
+    """
+
+    solve_id = request.json.get("solveId")
+    if solve_id is None or get_method() != "gauss-jordan-elimination":
+        return None
+
+    session = sessions.get(solve_id)
+
+    # Sessions of any other system can not be reused
+    if session is None or session.system_key != canonical_key(coefficient_matrix, constant_matrix, None, engine, pivot_strategy):
+        return None
+
+    return session
+
+
+def get_reduced_row_ops_content(session) -> list:
+    # Steps of the upward phase were appended to the log of the REF
+    return session.matrix.action_logger.row_ops_content
+
+
+def get_cached_content(cache_key: str) -> dict:
+    """
+    Content cached under cache_key, or None. Cached content holds the
+    "solveId" of the solve that cached it, which resuming and re-solving
+    edited copies need, for as long as its session is kept. It is None
+    once the session is gone, so that those start from scratch.
+    """
+
+    if result_cache is None:
+        return None
+
+    solved_content = result_cache.get(cache_key)
+
+    if solved_content is not None and solved_content.get("solveId") is not None:
+        if sessions.get(solved_content["solveId"]) is None:
+            solved_content = dict(solved_content, solveId=None)
+
+    return solved_content
+
+
+def resume_system(session: EliminationSession, cache_key: str, solve_id: str) -> dict:
+    """
+    Same as solve_system() for a gauss-jordan-elimination request, from
+    the REF kept by session under solve_id.
+    """
+
+    solved_content = session.reduce(lambda session: {
+        "rowOperationsContent": get_reduced_row_ops_content(session),
+        "solution": get_solution(session.matrix),
+        "solveId": solve_id
+    })
+
+    if result_cache is not None:
+        result_cache.set(cache_key, solved_content)
+
+    return solved_content
+
+
+def get_stream_format() -> str:
+    """ One of STREAM_FORMATS asked for as "stream", None for a plain JSON response. """
+
+    stream_format = request.json.get("stream")
+
+    # Anything but a string could be unhashable
+    if stream_format is not None and (not isinstance(stream_format, str) or stream_format not in STREAM_FORMATS):
+        abort(400, description="Invalid stream format")
+
+    return stream_format
+
+
+def get_content_format() -> str:
+    """ One of CONTENT_FORMATS asked for as "contentFormat", "full" by default. """
+
+    content_format = request.json.get("contentFormat", "full")
+
+    if content_format not in CONTENT_FORMATS:
+        abort(400, description="Invalid content format")
+
+    return content_format
+
+
+def get_step_page(step_log: StepLog, start: int, stop: int) -> dict:
+    stop = min(stop, step_log.num_steps, start + app.config["STEP_PAGE_MAX_SIZE"])
+
+    return {
+        "from": start,
+        "to": stop,
+        "numSteps": step_log.num_steps,
+        "rowOperationsContent": step_log.steps(start, stop)
+    }
+
+
+def jsonify_response_content(response_content: dict, content_format: str):
+    # "row-deltas" responses hold "rowOperationsDeltas" in place of
+    # "rowOperationsContent", see encode_row_deltas()
+    if content_format == "row-deltas":
+        response_content = dict(response_content)
+        response_content["rowOperationsDeltas"] = encode_row_deltas(response_content.pop("rowOperationsContent"))
+
+    # "paged" responses hold the row operation of every step as
+    # "rowOperations", but only the first page of matrices as "stepPage",
+    # with the others kept under the "solveId" for GET /solves/<id>/steps
+    elif content_format == "paged":
+        response_content = dict(response_content)
+        row_ops_content = response_content.pop("rowOperationsContent")
+
+        # Always built from the steps being returned, as the step log kept
+        # under the solveId of a resumed session is that of its REF
+        step_log = StepLog(
+            encode_row_deltas(row_ops_content), checkpoint_interval=app.config["STEP_LOG_CHECKPOINT_INTERVAL"]
+        )
+        response_content["solveId"] = step_logs.create(step_log, response_content["solveId"])
+
+        response_content["rowOperations"] = step_log.row_op_infos
+        response_content["stepPage"] = get_step_page(step_log, 0, app.config["STEP_PAGE_SIZE"])
+
+    return jsonify(response_content)
+
+
+def stream_response(solve, coefficient_matrix: list, constant_matrix: list, build_response, stream_format: str):
+    """
+    Streams the steps of solve(listener) as they are done, followed by
+    the rest of build_response(solved content), see
+    backend.streaming.stream_events().
+    """
+
+    # Invalid solving methods get a 400 rather than an "error" event
+    get_gauss_jordan()
+
+    starting_matrix = [[str(entry) for entry in row] for row in coefficient_matrix]
+    starting_constant_matrix = [[str(entry) for entry in row] for row in constant_matrix]
+
+    # solve runs in a thread of its own, which still needs the request
+    events = stream_events(
+        copy_current_request_context(solve), starting_matrix, starting_constant_matrix, build_response
+    )
+
+    return Response(
+        stream_with_context(encode_event(event, stream_format) for event in events),
+        mimetype=STREAM_FORMATS[stream_format]
+    )
+
+
+def get_response_content(solved_content: dict, engine: str, engine_reason: str, structure: str) -> dict:
+    return {
+        "rowOperationsContent": solved_content["rowOperationsContent"],
+        "solution": solved_content["solution"],
+        "engine": {"name": engine, "reason": engine_reason},
+        "structure": structure,
+        "solveId": solved_content.get("solveId"),
+        "stopped": solved_content.get("stopped")
+    }
+
+
+def apply_changed_entries(coefficient_matrix: list, constant_matrix: list) -> set:
+    """
+    Sets the "changedEntries" of the request, each being a dict of "row",
+    "column" and "value" with the columns of the constant matrix coming
+    after those of the coefficient matrix, as in the augmented matrix.
+
+    Returns:
+        set: Columns of the coefficient matrix with a changed entry
+    """
+
+    num_coefficient_columns = len(coefficient_matrix[0])
+    num_columns = num_coefficient_columns + len(constant_matrix[0])
+    changed_columns = set()
+
+    try:
+        for changed_entry in request.json["changedEntries"]:
+            row, column = changed_entry["row"], changed_entry["column"]
+
+            if not isinstance(row, int) or not isinstance(column, int):
+                abort(400, description="Invalid Matrix Values")
+
+            if not 0 <= row < len(coefficient_matrix) or not 0 <= column < num_columns:
+                abort(400, description="Invalid Matrix Values")
+
+            if column < num_coefficient_columns:
+                coefficient_matrix[row][column] = Fraction(changed_entry["value"])
+                changed_columns.add(column)
+            else:
+                constant_matrix[row][column - num_coefficient_columns] = Fraction(changed_entry["value"])
+    except (KeyError, TypeError, ValueError, ZeroDivisionError):
+        # Invalid Entry
+        abort(400, description="Invalid Matrix Values")
+
+    return changed_columns
+
+
+def get_matrix_data() -> list:
+    """
+    Returns the "matrix" of the request as a list of rows of Fractions,
+    for the endpoints that take a single matrix rather than a system.
+    """
+
+    matrix_data = request.json.get("matrix")
+    max_dimension = app.config["MAX_MATRIX_DIMENSION"]
+
+    if not isinstance(matrix_data, list) or not 0 < len(matrix_data) <= max_dimension:
+        abort(400, description="Invalid Matrix Dimensions")
+
+    if not isinstance(matrix_data[0], list) or not 0 < len(matrix_data[0]) <= max_dimension:
+        abort(400, description="Invalid Matrix Dimensions")
+
+    try:
+        if any(len(row) != len(matrix_data[0]) for row in matrix_data):
+            abort(400, description="Invalid Matrix Values")
+
+        return [[Fraction(entry) for entry in row] for row in matrix_data]
+    except (TypeError, ValueError, ZeroDivisionError):
+        # Invalid Entry
+        abort(400, description="Invalid Matrix Values")
+
+
+def get_matrix_properties(inverse: bool = False) -> dict:
+    """
+    Eliminates the "matrix" of the request once, returning its rank and
+    nullity, along with its determinant if it is square, as byproducts of
+    the elimination. If inverse is set to True, [A | I] is turned into
+    RREF rather than A into REF, which gives the inverse as well.
+    """
+
+    matrix_data = get_matrix_data()
+    m, n = len(matrix_data), len(matrix_data[0])
+
+    if inverse and m != n:
+        abort(400, description="Only square matrices have an inverse")
+
+    engine, engine_reason = get_engine(matrix_data, m, n)
+
+    if inverse:
+        identity = [[Fraction(int(curr_row == curr_column)) for curr_column in range(n)] for curr_row in range(n)]
+
+        if engine == "numeric":
+            matrix = NumericAugmentedMatrix(matrix_data, identity, dimension=(n, 2 * n))
+        else:
+            matrix = AugmentedMatrix(matrix_data, identity, dimension=(n, 2 * n), log_mode="off")
+    elif engine == "numeric":
+        matrix = NumericMatrix(matrix_data, dimension=(m, n))
+    else:
+        matrix = Matrix(matrix_data, dimension=(m, n), log_mode="off")
+
+    # None of the steps are shown, so the "step-logged" engine is no
+    # different from the "exact" one here
+    if engine == "numeric":
+        matrix.gaussian_elimination(gauss_jordan=inverse)
+    else:
+        matrix.bareiss_elimination(gauss_jordan=inverse)
+
+    rank = matrix.rank()
+
+    properties = {
+        "rank": rank,
+        "nullity": n - rank,
+        "determinant": str(matrix.determinant()) if m == n else None,
+        "engine": {"name": engine, "reason": engine_reason}
+    }
+
+    if inverse:
+        properties["inverse"] = None
+        if rank == n:
+            properties["inverse"] = matrix.action_logger.deepcopy_matrix_to_str(matrix.constant_matrix)
+
+    return properties
+
 
 # Routed functions
 @app.route("/")
@@ -116,31 +1026,244 @@ def system_of_equations():
         constant_matrix = process_constant_matrix_data(constant_matrix_data, m)
 
         """
-        # TMP QUICK DEFINITION
-        coefficient_matrix = request.json["matrix"]
-        constant_matrix = request.json["constMatrix"]
-        for i, row in enumerate(coefficient_matrix):
-            for j, num in enumerate(row):
-                coefficient_matrix[i][j] = Fraction(num)
-        
-        for i, row in enumerate(constant_matrix):
-            for j, num in enumerate(row):
-                constant_matrix[i][j] = Fraction(num)
+        coefficient_matrix, constant_matrix, m, n = get_system()
+        num_constant_columns = len(constant_matrix[0])
+
+        # Pick an engine by the size and entries of the coefficient matrix
+        engine, engine_reason = get_engine(coefficient_matrix, m, n - num_constant_columns, constant_matrix)
+
+        # Fraction engines have fast paths for some structures, the
+        # numeric engine is fast enough without them
+        structure = None
+        if engine != "numeric":
+            structure = classify_structure(coefficient_matrix, m, n - num_constant_columns)
+
+        pivot_strategy = get_pivot_strategy()
+        budget = get_budget()
+        stream_format = get_stream_format()
+        content_format = get_content_format()
+
+        cache_key = canonical_key(coefficient_matrix, constant_matrix, get_method(), engine, pivot_strategy)
 
-        m = request.json["m"]
-        n = request.json["n"]
+        def solve(listener=None):
+            # The same system may have been solved before
+            solved_content = get_cached_content(cache_key)
+            if solved_content is not None:
+                return solved_content
 
+            # A system left in REF by an earlier request only needs the
+            # upward phase of gauss-jordan elimination, which the budget has
+            # no hold on, as stopping it would leave the session half reduced
+            session = None
+            if not budget.limited:
+                session = get_session(coefficient_matrix, constant_matrix, engine, pivot_strategy)
 
+            if session is not None:
+                return resume_system(session, cache_key, request.json["solveId"])
 
-        # Define matrix from validated user data
-        augmented_matrix = AugmentedMatrix(coefficient_matrix, constant_matrix, dimension=(m, n))
+            return single_flight.do(
+                get_flight_key(cache_key, budget),
+                lambda: solve_system(
+                    engine, structure, coefficient_matrix, constant_matrix, m, n, cache_key,
+                    pivot_strategy=pivot_strategy, listener=listener, budget=budget
+                )
+            )
 
-        # Solve matrix
-        solve_system_of_equations(augmented_matrix)
+        def build_response(solved_content):
+            return get_response_content(solved_content, engine, engine_reason, structure)
+
+        if stream_format is not None:
+            return stream_response(solve, coefficient_matrix, constant_matrix, build_response, stream_format)
 
         # Return solved data
-        row_ops_content = augmented_matrix.action_logger.row_ops_content
+        return jsonify_response_content(build_response(solve()), content_format)
+
+
+@app.route("/system-of-equations/<solve_id>/changes", methods=["POST"])
+def system_of_equations_changes(solve_id):
+    """
+    Solves the system of an earlier request with a few of its entries
+    changed, given as "changedEntries", see apply_changed_entries(). Steps
+    of the earlier solve that do not depend on the changed entries are
+    reused rather than done again, with their number returned as
+    "stepsReused".
+    """
+
+    session = sessions.get(solve_id)
+    if session is None:
+        abort(404, description="Unknown or expired solve id")
+
+    # Starting system of the session, with the changes on top
+    starting_matrix, starting_constant_matrix = session.row_ops_content[1][0], session.row_ops_content[2][0]
+
+    coefficient_matrix = [[Fraction(entry) for entry in row] for row in starting_matrix]
+    constant_matrix = [[Fraction(entry) for entry in row] for row in starting_constant_matrix]
+    changed_columns = apply_changed_entries(coefficient_matrix, constant_matrix)
+
+    m = len(coefficient_matrix)
+    n = len(coefficient_matrix[0]) + len(constant_matrix[0])
+
+    # Same engine and pivot strategy as the earlier solve, whose steps are
+    # being reused
+    engine = session.engine
+    pivot_strategy = session.pivot_strategy
+
+    structure = classify_structure(coefficient_matrix, m, len(coefficient_matrix[0]))
+
+    budget = get_budget()
+    stream_format = get_stream_format()
+    content_format = get_content_format()
+
+    cache_key = canonical_key(coefficient_matrix, constant_matrix, get_method(), engine, pivot_strategy)
+
+    def solve(listener=None):
+        solved_content = get_cached_content(cache_key)
+
+        if solved_content is not None:
+            # Every step of the cached result was reused
+            return dict(solved_content, stepsReused=len(solved_content["rowOperationsContent"][0]) - 1)
+
+        return single_flight.do(
+            get_flight_key(cache_key, budget),
+            lambda: solve_system(
+                engine, structure, coefficient_matrix, constant_matrix, m, n, cache_key,
+                previous_session=session, changed_columns=changed_columns, pivot_strategy=pivot_strategy,
+                listener=listener, budget=budget
+            )
+        )
+
+    def build_response(solved_content):
+        response_content = get_response_content(solved_content, engine, "previous solve", structure)
+        response_content["stepsReused"] = solved_content.get("stepsReused", 0)
+
+        return response_content
+
+    if stream_format is not None:
+        return stream_response(solve, coefficient_matrix, constant_matrix, build_response, stream_format)
+
+    return jsonify_response_content(build_response(solve()), content_format)
+
+
+@app.route("/solves/<solve_id>/steps", methods=["GET"])
+def solve_steps(solve_id):
+    """
+    Steps "from" up to, but not including, "to" of a "paged" response,
+    STEP_PAGE_SIZE of them if "to" is left out.
+    """
+
+    step_log = step_logs.get(solve_id)
+    if step_log is None:
+        abort(404, description="Unknown or expired solve id")
+
+    try:
+        start = int(request.args.get("from", 0))
+        stop = int(request.args.get("to", start + app.config["STEP_PAGE_SIZE"]))
+    except ValueError:
+        abort(400, description="Invalid step range")
+
+    if not 0 <= start < step_log.num_steps or stop <= start:
+        abort(400, description="Invalid step range")
+
+    return jsonify(get_step_page(step_log, start, stop))
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """
+    Queues a system, sent the same way as to /system-of-equations, to be
+    solved by a worker process, answering right away with its "jobId". Its
+    status, progress and, once done, result are then polled through
+    GET /jobs/<id>, or it is cancelled through DELETE /jobs/<id>.
+    """
+
+    coefficient_matrix, constant_matrix, m, n = get_system()
+    num_constant_columns = len(constant_matrix[0])
+
+    engine, engine_reason = get_engine(coefficient_matrix, m, n - num_constant_columns, constant_matrix)
+
+    structure = None
+    if engine != "numeric":
+        structure = classify_structure(coefficient_matrix, m, n - num_constant_columns)
+
+    job_id = jobs.submit(
+        run_job,
+        (engine, structure, coefficient_matrix, constant_matrix, m, n, get_gauss_jordan(), get_pivot_strategy()),
+        total_pivots=min(m, n - num_constant_columns), context=(engine, engine_reason, structure)
+    )
+
+    if job_id is None:
+        abort(503, description="Too many jobs queued, try again later")
+
+    return jsonify(get_job_content(job_id)), 202
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    return jsonify(get_job_content(job_id))
+
+
+@app.route("/jobs/<job_id>", methods=["DELETE"])
+def delete_job(job_id):
+    """
+    Cancels a job that has not finished yet, a running one stopping at its
+    next pivot, or forgets a finished one along with its result.
+    """
+
+    if not jobs.delete(job_id):
+        abort(404, description="Unknown or expired job id")
+
+    return "", 204
+
+
+@app.route("/determinant", methods=["POST"])
+def determinant():
+    properties = get_matrix_properties()
+
+    if properties["determinant"] is None:
+        abort(400, description="Only square matrices have a determinant")
+
+    return jsonify(properties)
+
+
+@app.route("/rank", methods=["POST"])
+def rank():
+    return jsonify(get_matrix_properties())
+
+
+@app.route("/inverse", methods=["POST"])
+def inverse():
+    # "inverse" is None for singular matrices
+    return jsonify(get_matrix_properties(inverse=True))
+
+
+@app.route("/stats/lu-cache", methods=["GET"])
+def lu_cache_stats():
+    return jsonify(lu_cache.stats)
+
+
+@app.route("/stats/result-cache", methods=["GET"])
+def result_cache_stats():
+    if result_cache is None:
+        abort(404, description="Result cache is off")
+
+    return jsonify(result_cache.stats)
+
+
+@app.route("/stats/single-flight", methods=["GET"])
+def single_flight_stats():
+    return jsonify(single_flight.stats)
+
+
+@app.route("/stats/sessions", methods=["GET"])
+def session_stats():
+    return jsonify(sessions.stats)
+
+
+@app.route("/stats/step-logs", methods=["GET"])
+def step_log_stats():
+    return jsonify(step_logs.stats)
+
 
-        return jsonify({
-            "rowOperationsContent": row_ops_content
-        })
+@app.route("/stats/jobs", methods=["GET"])
+def job_stats():
+    return jsonify(jobs.stats)
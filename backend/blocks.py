@@ -0,0 +1,224 @@
+from backend.matrix import AugmentedMatrix, Matrix
+from backend.numeric_matrix import NumericAugmentedMatrix
+
+from concurrent.futures import Future
+
+import numpy as np
+
+
+def _nonzero_locations(coefficient_matrix):
+    # (row, column) of every non-zero entry, row by row
+    if isinstance(coefficient_matrix, np.ndarray):
+        return zip(*(indices.tolist() for indices in np.nonzero(coefficient_matrix)))
+
+    return (
+        (curr_row, curr_column)
+        for curr_row, row in enumerate(coefficient_matrix)
+        for curr_column, entry in enumerate(row) if entry != 0
+    )
+
+
+def density(coefficient_matrix, m: int, n: int) -> float:
+    """ Fraction of the entries of the coefficient matrix that are non-zero. """
+
+    if m * n == 0:
+        return 0.0
+
+    if isinstance(coefficient_matrix, np.ndarray):
+        return np.count_nonzero(coefficient_matrix) / (m * n)
+
+    return sum(1 for row in coefficient_matrix for entry in row if entry != 0) / (m * n)
+
+
+def find_blocks(coefficient_matrix: list, m: int, n: int) -> list:
+    """
+    Splits the rows and columns of a coefficient matrix into independent
+    blocks, being the connected components of the graph with an edge
+    between row i and column j for every non-zero entry (i, j). Row
+    operations within one block never touch the entries of another, so
+    every block can be eliminated on its own.
+
+    Zero rows and zero columns are not part of any block.
+
+    Returns:
+        list: A (rows, columns) tuple of sorted index lists for each
+                    block, ordered by their first row.
+    """
+
+    # Union-find over m row nodes followed by n column nodes
+    parents = list(range(m + n))
+
+    def find(node):
+        while parents[node] != node:
+            # Path halving
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+
+        return node
+
+    nonzero_rows = set()
+    nonzero_columns = set()
+
+    for curr_row, curr_column in _nonzero_locations(coefficient_matrix):
+        nonzero_rows.add(curr_row)
+        nonzero_columns.add(curr_column)
+
+        row_root, column_root = find(curr_row), find(m + curr_column)
+        if row_root != column_root:
+            parents[column_root] = row_root
+
+    blocks = dict()
+
+    for curr_row in sorted(nonzero_rows):
+        blocks.setdefault(find(curr_row), ([], []))[0].append(curr_row)
+
+    for curr_column in sorted(nonzero_columns):
+        blocks[find(m + curr_column)][1].append(curr_column)
+
+    return sorted(blocks.values())
+
+
+def solve_block(engine: str, coefficient_block: list, constant_block: list, gauss_jordan: bool,
+                record_row_ops: bool = False) -> tuple:
+    """
+    Eliminates a single block with one of the engines of
+    backend.engine_selection. Kept at module level, so that it can be run
+    in a worker process.
+
+    Returns:
+        tuple: (coefficient rows, constant rows, RowOperation records) of
+                    the block once eliminated, with the records only kept
+                    if record_row_ops is set to True.
+    """
+
+    dimension = (len(coefficient_block), len(coefficient_block[0]) + len(constant_block[0]))
+
+    if engine == "numeric":
+        block = NumericAugmentedMatrix(coefficient_block, constant_block, dimension=dimension)
+        block.gaussian_elimination(gauss_jordan=gauss_jordan)
+
+        return block.data.tolist(), block.constant_matrix.tolist(), []
+
+    block = AugmentedMatrix(coefficient_block, constant_block, dimension=dimension,
+                            log_mode="ops" if record_row_ops else "off")
+
+    if engine == "exact":
+        block.bareiss_elimination(gauss_jordan=gauss_jordan)
+    else:
+        block.gaussian_elimination(gauss_jordan=gauss_jordan)
+
+    return block.data, block.constant_matrix, block.action_logger.row_ops
+
+
+def solve_by_blocks(matrix, engine: str, blocks: list, gauss_jordan: bool = False, executor=None,
+                    parallel_min_entries: int = 10000) -> None:
+    """
+    Eliminates an AugmentedMatrix, or NumericAugmentedMatrix, one block of
+    find_blocks() at a time, then moves the rows into REF order. The end
+    result is the same REF or RREF as eliminating the whole matrix with
+    the engine.
+
+    If the action logger of the matrix is enabled, the row operations of
+    each block are replayed on the matrix with the rows of the block, so
+    the step log reads as if every block had been eliminated one after
+    the other in place.
+
+    Args:
+        matrix: The AugmentedMatrix or NumericAugmentedMatrix to eliminate
+        engine (str): One of the engines of backend.engine_selection
+        blocks (list): The blocks of the coefficient matrix, as given by
+                    find_blocks()
+        gauss_jordan (bool, optional): Eliminate into RREF rather than
+                    REF. Default value is False.
+        executor (concurrent.futures.Executor, optional): Where blocks with
+                    at least parallel_min_entries entries are solved,
+                    usually a ProcessPoolExecutor. Every block is solved in
+                    this process if None. Default is None.
+        parallel_min_entries (int, optional): Smallest number of
+                    coefficient entries of a block worth sending to the
+                    executor. Default is 10000.
+    """
+
+    record_row_ops = matrix.action_logger.enabled
+    is_numeric = isinstance(matrix.data, np.ndarray)
+
+    results = []
+    for rows, columns in blocks:
+        coefficient_block = [[matrix.data[row][column] for column in columns] for row in rows]
+        constant_block = [list(matrix.constant_matrix[row]) for row in rows]
+
+        arguments = (engine, coefficient_block, constant_block, gauss_jordan, record_row_ops)
+
+        if executor is not None and len(rows) * len(columns) >= parallel_min_entries:
+            results.append(executor.submit(solve_block, *arguments))
+        else:
+            results.append(solve_block(*arguments))
+
+    for (rows, columns), result in zip(blocks, results):
+        if isinstance(result, Future):
+            result = result.result()
+
+        coefficient_rows, constant_rows, row_ops = result
+
+        if record_row_ops:
+            _replay_block_row_ops(matrix, rows, columns, row_ops, is_numeric)
+        elif is_numeric:
+            matrix.data[np.ix_(rows, columns)] = coefficient_rows
+            matrix.constant_matrix[rows] = constant_rows
+        else:
+            for row, coefficient_row, constant_row in zip(rows, coefficient_rows, constant_rows):
+                for column, entry in zip(columns, coefficient_row):
+                    matrix.data[row][column] = entry
+
+                matrix.constant_matrix[row][:] = constant_row
+
+    _sort_rows_by_pivot(matrix)
+
+
+def _replay_block_row_ops(matrix, rows: list, columns: list, row_ops: list, is_numeric: bool) -> None:
+    # Entries of the block rows outside of the block columns are all 0, so
+    # the row operations only have to visit the block columns. NumPy rows
+    # are added all at once either way.
+    column_range = {} if is_numeric else {"columns": (columns[0], columns[-1] + 1)}
+
+    for row_op in row_ops:
+        if row_op.name == "swap_rows":
+            matrix.swap_rows(rows[row_op.row], rows[row_op.other_row])
+        elif row_op.name == "multiply_row":
+            matrix.multiply_row(rows[row_op.row], row_op.scalar)
+        elif row_op.name == "row_multiple_to_row":
+            matrix.row_multiple_to_row(rows[row_op.row], row_op.scalar, rows[row_op.other_row], **column_range)
+        else:
+            raise ValueError(f"Composite row operation {row_op.name} can not be replayed")
+
+
+def _sort_rows_by_pivot(matrix) -> None:
+    """
+    Orders the rows of an eliminated matrix by the column of their leading
+    entry, with zero rows last, which puts the rows of every block in REF
+    into REF as a whole. Pivot point locations are updated to match.
+    """
+
+    leading_columns = [Matrix._leading_entry_column(row) for row in matrix.data]
+
+    # Zero rows sort after every other row, otherwise keeping their order
+    order = sorted(range(matrix.m), key=lambda row: (leading_columns[row] is None, leading_columns[row] or 0, row))
+
+    # Apply the order with swaps, keeping track of where each row went
+    position = list(range(matrix.m))
+    row_at = list(range(matrix.m))
+
+    for target, row in enumerate(order):
+        curr_row = position[row]
+
+        if curr_row != target:
+            matrix.swap_rows(target, curr_row)
+
+            displaced = row_at[target]
+            row_at[target], row_at[curr_row] = row, displaced
+            position[row], position[displaced] = target, curr_row
+
+    matrix._pivot_point_locations = {
+        target: (target, leading_columns[row])
+        for target, row in enumerate(order) if leading_columns[row] is not None
+    }
@@ -0,0 +1,91 @@
+import time
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, reason: str, description: str, pivots_done: int):
+        """
+        Raised from the pivot callback set by SolveBudget.watch() once a
+        limit of the budget is reached, leaving the matrix as it was after
+        its last pivot.
+
+        Args:
+            reason (str): Limit that was reached, one of SolveBudget.REASONS
+            description (str): Readable description of the limit
+            pivots_done (int): Number of pivots done before stopping
+        """
+
+        super().__init__(description)
+
+        self.reason = reason
+        self.description = description
+        self.pivots_done = pivots_done
+
+
+class SolveBudget():
+    # Limits a solve can be stopped by, as given by BudgetExceeded.reason
+    REASONS = ("time", "rowOps", "entryBits")
+
+    def __init__(self, max_seconds: float = None, max_row_ops: int = None, max_entry_bits: int = None):
+        """
+        Limits on a single elimination, checked cooperatively after every
+        pivot through the pivot callback of the matrix, see
+        Matrix.pivot_callback, in the upward phase of gauss-jordan
+        elimination and the structured fast paths as well. A pivot that is
+        under way always finishes, so a limit may be overshot by up to one
+        pivot's worth of work, max_row_ops included: it is not checked
+        after every row operation, and a pivot takes up to one row
+        operation for every row of the matrix.
+
+        Args:
+            max_seconds (float, optional): Wall time the elimination may
+                        take, no limit if None. Default is None.
+            max_row_ops (int, optional): Row operations the elimination may
+                        take, counted by Matrix.row_op_count and checked
+                        after every pivot, no limit if None. Default is
+                        None.
+            max_entry_bits (int, optional): Bits the numerator and
+                        denominator of any entry may take, see
+                        Matrix.max_entry_bit_length(), no limit if None.
+                        Only Fraction matrices are held to it, as floats do
+                        not grow. Default is None.
+        """
+
+        self.max_seconds = max_seconds
+        self.max_row_ops = max_row_ops
+        self.max_entry_bits = max_entry_bits
+
+    @property
+    def limited(self) -> bool:
+        """ Whether any limit is set. """
+
+        return self.max_seconds is not None or self.max_row_ops is not None or self.max_entry_bits is not None
+
+    def watch(self, matrix, pivot_callback=None) -> None:
+        """
+        Sets the pivot callback of matrix to check every limit of the
+        budget, raising BudgetExceeded once one is reached, with the time
+        counted from now on. pivot_callback, if given, is called after the
+        checks with the number of pivots done, as it would have been as the
+        pivot callback of matrix.
+        """
+
+        deadline = time.monotonic() + self.max_seconds if self.max_seconds is not None else None
+        row_op_count = matrix.row_op_count
+
+        # Floats do not grow
+        check_entry_bits = self.max_entry_bits is not None and hasattr(matrix, "max_entry_bit_length")
+
+        def check(pivots_done):
+            if deadline is not None and time.monotonic() > deadline:
+                raise BudgetExceeded("time", f"Stopped after {self.max_seconds} seconds", pivots_done)
+
+            if self.max_row_ops is not None and matrix.row_op_count - row_op_count > self.max_row_ops:
+                raise BudgetExceeded("rowOps", f"Stopped after {self.max_row_ops} row operations", pivots_done)
+
+            if check_entry_bits and matrix.max_entry_bit_length() > self.max_entry_bits:
+                raise BudgetExceeded("entryBits", f"Stopped once entries took over {self.max_entry_bits} bits", pivots_done)
+
+            if pivot_callback is not None:
+                pivot_callback(pivots_done)
+
+        matrix.pivot_callback = check
@@ -0,0 +1,53 @@
+from fractions import Fraction
+
+
+# Engines that a system of equations can be solved with:
+#
+# - "step-logged": Matrix.gaussian_elimination on Fractions, logging every
+#   row operation. Meant for small matrices students step through.
+# - "exact": Matrix.bareiss_elimination with logging off.
+# - "numeric": NumericMatrix.gaussian_elimination on float64, with
+#   logging off.
+ENGINES = ("step-logged", "exact", "numeric")
+
+
+def select_engine(coefficient_matrix: list, m: int, n: int, step_log_max_entries: int,
+                  exact_max_entries: int, exact_max_entries_non_integer: int) -> tuple:
+    """
+    Picks an engine for a coefficient matrix by its size and the type of
+    its entries.
+
+    Args:
+        coefficient_matrix (list): The list representation of the
+                    coefficient matrix
+        m (int): Number of rows of the coefficient matrix
+        n (int): Number of columns of the coefficient matrix
+        step_log_max_entries (int): Largest number of entries solved with
+                    the "step-logged" engine
+        exact_max_entries (int): Largest number of entries solved with the
+                    "exact" engine when every entry is an integer
+        exact_max_entries_non_integer (int): Largest number of entries
+                    solved with the "exact" engine otherwise, as rows
+                    have to be scaled into integers first
+
+    Returns:
+        tuple: (engine, reason) with reason being a short description
+                    of why the engine was picked
+    """
+
+    num_entries = m * n
+
+    if num_entries <= step_log_max_entries:
+        return "step-logged", f"{m}x{n} has at most {step_log_max_entries} entries, so every step is logged"
+
+    if all(Fraction(entry).denominator == 1 for row in coefficient_matrix for entry in row):
+        entry_type = "integer"
+        max_entries = exact_max_entries
+    else:
+        entry_type = "non-integer"
+        max_entries = exact_max_entries_non_integer
+
+    if num_entries <= max_entries:
+        return "exact", f"{m}x{n} with {entry_type} entries has at most {max_entries} entries, so it is solved exactly"
+
+    return "numeric", f"{m}x{n} with {entry_type} entries has more than {max_entries} entries, so it is solved with floats"
@@ -0,0 +1,241 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Manager
+from threading import Lock
+import secrets
+import time
+
+
+class JobCancelled(Exception):
+    """ Raised from the pivot callback of a running job once it was cancelled. """
+
+
+class JobProgress():
+    def __init__(self, job_id: str, shared_state):
+        """
+        Pivot callback, see Matrix.pivot_callback, of the matrix of a job
+        running in a worker process. Reports the number of pivots done
+        back to the JobQueue, and stops elimination by raising
+        JobCancelled once the job was cancelled.
+
+        Args:
+            job_id (str): Id of the job
+            shared_state: Dict made by a multiprocessing Manager, shared
+                        with the JobQueue, holding the pivots done by every
+                        running job under its id, and True under
+                        ("cancelled", id) for every job cancelled while
+                        running
+        """
+
+        self.job_id = job_id
+        self.shared_state = shared_state
+
+    def __call__(self, pivots_done: int) -> None:
+        if self.shared_state.get(("cancelled", self.job_id)):
+            raise JobCancelled(f"Job {self.job_id} was cancelled")
+
+        self.shared_state[self.job_id] = pivots_done
+
+
+class _Job():
+    __slots__ = ("future", "total_pivots", "context", "cancel_requested", "finished_at")
+
+    def __init__(self, total_pivots: int, context):
+        self.future = None
+        self.total_pivots = total_pivots
+        self.context = context
+        self.cancel_requested = False
+        self.finished_at = None
+
+
+class JobQueue():
+    def __init__(self, max_workers: int = None, max_queue_depth: int = 16, ttl: float = 600):
+        """
+        Runs long solves in a pool of worker processes, away from the
+        threads serving requests, keeping their status, progress and
+        results under random job ids. The pool is only started once the
+        first job is submitted. Safe to share between threads.
+
+        Args:
+            max_workers (int, optional): Number of worker processes, as
+                        many as there are CPUs if None. Default is None.
+            max_queue_depth (int, optional): Largest number of jobs queued
+                        or running at once, later ones being turned away.
+                        Default is 16.
+            ttl (float, optional): Seconds a finished job is kept, forever
+                        if None. Default is 600.
+        """
+
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.ttl = ttl
+
+        self._executor = None
+        self._manager = None
+        self._shared_state = None
+
+        # job id -> _Job
+        self._jobs = dict()
+        self._lock = Lock()
+
+        self.submitted = 0
+        self.rejected = 0
+        self.cancelled = 0
+
+    def submit(self, function, args: tuple, total_pivots: int, context=None) -> str:
+        """
+        Runs function(*args, progress) in a worker process, with progress
+        being the JobProgress of the job, to be set as the pivot callback of
+        the matrix it eliminates. context is kept along with the job, such
+        as whatever is needed to build a response from its result.
+
+        Returns:
+            str: Id of the job, None if the queue is full.
+        """
+
+        with self._lock:
+            self._remove_expired()
+
+            if sum(1 for job in self._jobs.values() if job.finished_at is None) >= self.max_queue_depth:
+                self.rejected += 1
+                return None
+
+            if self._executor is None:
+                self._manager = Manager()
+                self._shared_state = self._manager.dict()
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+            job_id = secrets.token_urlsafe(16)
+            job = _Job(total_pivots, context)
+
+            job.future = self._executor.submit(function, *args, JobProgress(job_id, self._shared_state))
+            self._jobs[job_id] = job
+            self.submitted += 1
+
+            shared_state = self._shared_state
+
+        job.future.add_done_callback(lambda _: self._finish(job_id, job, shared_state))
+
+        return job_id
+
+    def _finish(self, job_id: str, job: _Job, shared_state) -> None:
+        job.finished_at = time.monotonic()
+
+        # Progress of a finished job is its total
+        shared_state.pop(job_id, None)
+        shared_state.pop(("cancelled", job_id), None)
+
+    def get(self, job_id: str) -> dict:
+        """
+        Returns the state of the job as a dict of "status", one of
+        "queued", "running", "done", "failed" or "cancelled", along with
+        "pivotsDone", "totalPivots", "context" and, once done, "result",
+        or None if there is no such job.
+
+        Jobs handed to a worker process are "running", which the pool
+        does for up to one job more than it has workers.
+        """
+
+        with self._lock:
+            self._remove_expired()
+            job = self._jobs.get(job_id)
+
+        if job is None:
+            return None
+
+        future = job.future
+        pivots_done = 0
+        result = None
+
+        if job.cancel_requested or future.cancelled():
+            status = "cancelled"
+        elif future.done():
+            if future.exception() is not None:
+                status = "failed"
+            else:
+                status = "done"
+                result = future.result()
+                pivots_done = job.total_pivots
+        elif future.running():
+            status = "running"
+            pivots_done = self._shared_state.get(job_id, 0)
+        else:
+            status = "queued"
+
+        return {
+            "status": status,
+            "pivotsDone": pivots_done,
+            "totalPivots": job.total_pivots,
+            "context": job.context,
+            "result": result,
+        }
+
+    def delete(self, job_id: str) -> bool:
+        """
+        Cancels the job if it has not finished yet, a running one being
+        stopped at its next pivot, or forgets it along with its result
+        otherwise.
+
+        Returns:
+            bool: False if there is no such job, True otherwise.
+        """
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+
+            if job is None:
+                return False
+
+            if job.future.done():
+                del self._jobs[job_id]
+                return True
+
+            if not job.cancel_requested:
+                job.cancel_requested = True
+                self.cancelled += 1
+
+        # Jobs still queued never start, running ones stop themselves
+        if not job.future.cancel():
+            self._shared_state[("cancelled", job_id)] = True
+
+        return True
+
+    def _remove_expired(self) -> None:
+        if self.ttl is None:
+            return
+
+        now = time.monotonic()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at + self.ttl < now
+        ]
+
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        """ Cancels every queued job and stops the worker processes. """
+
+        with self._lock:
+            executor, manager = self._executor, self._manager
+            self._executor = self._manager = self._shared_state = None
+
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+            manager.shutdown()
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            unfinished = [job for job in self._jobs.values() if job.finished_at is None]
+            running = sum(1 for job in unfinished if job.future.running())
+
+            return {
+                "queued": len(unfinished) - running,
+                "running": running,
+                "finished": len(self._jobs) - len(unfinished),
+                "maxQueueDepth": self.max_queue_depth,
+                "workers": self.max_workers,
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "cancelled": self.cancelled,
+            }
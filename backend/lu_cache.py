@@ -0,0 +1,253 @@
+from backend.matrix import Matrix
+
+from collections import OrderedDict
+from fractions import Fraction
+from hashlib import sha256
+from threading import Lock
+
+
+def coefficient_matrix_key(coefficient_matrix: list) -> str:
+    """
+    Returns a hash of the coefficient matrix, which is the same for any
+    two matrices of equal dimensions and entries, no matter if the entries
+    are given as Fractions, ints or str.
+    """
+
+    digest = sha256()
+    digest.update(f"{len(coefficient_matrix)}x{len(coefficient_matrix[0]) if coefficient_matrix else 0};".encode())
+
+    for row in coefficient_matrix:
+        digest.update(",".join(str(Fraction(entry)) for entry in row).encode())
+        digest.update(b";")
+
+    return digest.hexdigest()
+
+
+def apply_row_ops(row_ops: list, rows: list) -> None:
+    """
+    Performs every RowOperation of row_ops, in order, on rows in place.
+    """
+
+    for row_op in row_ops:
+        if row_op.name == "swap_rows":
+            rows[row_op.row], rows[row_op.other_row] = rows[row_op.other_row], rows[row_op.row]
+        elif row_op.name == "multiply_row":
+            rows[row_op.row] = [entry * row_op.scalar for entry in rows[row_op.row]]
+        elif row_op.name == "row_multiple_to_row":
+            rows[row_op.row] = [
+                entry + row_op.scalar * other_entry
+                for entry, other_entry in zip(rows[row_op.row], rows[row_op.other_row])
+            ]
+        else:
+            raise ValueError(f"Composite row operation {row_op.name} can not be replayed")
+
+
+class LUFactorization():
+    def __init__(self, row_ops: list, upper: list, reduced: list = None, coefficient_matrix: list = None):
+        """
+        LU factorization, with row permutation, of a coefficient matrix A
+        kept in product form. row_ops are the elementary row operations
+        that took A into the REF matrix upper (U), so that E * A = U with E
+        being their product. As E is the inverse of L with the row swaps
+        of P folded in, P * A = L * U.
+
+        Solving for a constant matrix B then only takes replaying row_ops
+        on B (forward substitution), and back substitution with U for the
+        RREF, rather than a whole elimination of [A | B].
+
+        Args:
+            row_ops (list): The RowOperation records taking A into upper
+            upper (list): The list representation of U, a REF matrix
+            reduced (list, optional): The list representation of the RREF
+                        of A. Built when first asked for if not given.
+            coefficient_matrix (list, optional): The list representation
+                        of A, which the RREF is built from by a
+                        fraction-free pass when first asked for. Built
+                        from U by back substitution if not given.
+        """
+
+        self.row_ops = row_ops
+        self.upper = upper
+
+        # (row, column) of each pivot point of U, top to bottom
+        self.pivot_point_locations = []
+        for curr_row, row in enumerate(upper):
+            pivot_column = Matrix._leading_entry_column(row)
+            if pivot_column is None:
+                break
+
+            self.pivot_point_locations.append((curr_row, pivot_column))
+
+        self._reduced = reduced
+        self._coefficient_matrix = coefficient_matrix
+
+    @classmethod
+    def factorize(cls, coefficient_matrix: list, dimension: tuple):
+        """
+        Factorizes a copy of coefficient_matrix with fraction-free (Bareiss)
+        elimination, recording its steps as elementary row operations.
+        """
+
+        data = [[Fraction(entry) for entry in row] for row in coefficient_matrix]
+        matrix = Matrix(data, dimension, log_mode="ops")
+        matrix.bareiss_elimination(gauss_jordan=False)
+
+        # The RREF is only built once a gauss-jordan solve asks for it
+        starting_matrix = [[Fraction(entry) for entry in row] for row in coefficient_matrix]
+
+        return cls(matrix.action_logger.row_ops, matrix.data, coefficient_matrix=starting_matrix)
+
+    @property
+    def reduced(self) -> list:
+        """ RREF of the factorized matrix. """
+
+        if self._reduced is None:
+            coefficient_matrix = self._coefficient_matrix
+
+            if coefficient_matrix is not None:
+                # Back substitution on U takes Fractions with large
+                # denominators, a fraction-free pass on A is a lot faster
+                matrix = Matrix(coefficient_matrix, (len(coefficient_matrix), len(coefficient_matrix[0])), log_mode="off")
+                matrix.bareiss_elimination(gauss_jordan=True)
+                self._reduced = matrix.data
+            else:
+                self._reduced = self.back_substitution(self.upper)
+
+            # A is only needed for the RREF
+            self._coefficient_matrix = None
+
+        return self._reduced
+
+    def forward_substitution(self, constant_matrix: list) -> list:
+        """
+        Returns E * constant_matrix, the constant matrix of [U | E * B].
+        """
+
+        rows = [[Fraction(entry) for entry in row] for row in constant_matrix]
+        apply_row_ops(self.row_ops, rows)
+
+        return rows
+
+    def back_substitution(self, rows: list) -> list:
+        """
+        Returns a copy of rows with the same row operations performed on
+        them as the ones that take U into RREF.
+        """
+
+        rows = [list(row) for row in rows]
+
+        for pivot_row, pivot_column in reversed(self.pivot_point_locations):
+            pivot = self.upper[pivot_row][pivot_column]
+            if pivot != 1:
+                rows[pivot_row] = [entry / pivot for entry in rows[pivot_row]]
+
+            pivot_entries = rows[pivot_row]
+
+            for curr_row in range(pivot_row):
+                # Pivot rows below have already been eliminated, without
+                # changing the pivot column, so U holds the multipliers
+                scalar = self.upper[curr_row][pivot_column]
+                if scalar != 0:
+                    rows[curr_row] = [entry - scalar * pivot_entry for entry, pivot_entry in zip(rows[curr_row], pivot_entries)]
+
+        return rows
+
+    def solve(self, constant_matrix: list, gauss_jordan: bool = False) -> tuple:
+        """
+        Returns the (coefficient matrix, constant matrix) pair of
+        [A | constant_matrix] once turned into REF, or RREF if gauss_jordan
+        is set to True.
+        """
+
+        constant_rows = self.forward_substitution(constant_matrix)
+
+        if gauss_jordan:
+            return [row[:] for row in self.reduced], self.back_substitution(constant_rows)
+
+        return [row[:] for row in self.upper], constant_rows
+
+
+class LUCache():
+    def __init__(self, maxsize: int = 128):
+        """
+        Least recently used cache of LUFactorization objects, keyed by
+        coefficient_matrix_key(). Safe to share between threads.
+
+        Args:
+            maxsize (int, optional): Largest number of factorizations kept,
+                        the least recently used one being evicted to make
+                        room. A maxsize of 0 turns caching off. Default is
+                        128.
+        """
+
+        self.maxsize = maxsize
+
+        self._factorizations = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._factorizations)
+
+    def get(self, key: str):
+        """ Returns the factorization cached under key, or None. """
+
+        with self._lock:
+            factorization = self._factorizations.get(key)
+
+            if factorization is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._factorizations.move_to_end(key)
+
+            return factorization
+
+    def put(self, key: str, factorization: LUFactorization) -> None:
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._factorizations[key] = factorization
+            self._factorizations.move_to_end(key)
+
+            while len(self._factorizations) > self.maxsize:
+                self._factorizations.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_factorize(self, coefficient_matrix: list, dimension: tuple) -> LUFactorization:
+        """
+        Returns the cached factorization of coefficient_matrix, factorizing
+        and caching it first if there is none.
+        """
+
+        key = coefficient_matrix_key(coefficient_matrix)
+
+        factorization = self.get(key)
+        if factorization is None:
+            factorization = LUFactorization.factorize(coefficient_matrix, dimension)
+            self.put(key, factorization)
+
+        return factorization
+
+    def clear(self) -> None:
+        with self._lock:
+            self._factorizations.clear()
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "size": len(self._factorizations),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRatio": self.hits / lookups if lookups else 0.0,
+            }
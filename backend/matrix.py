@@ -1,26 +1,72 @@
 from backend.matrix_action_logger import MatrixActionLogger
-
-# Used for checking if matrices are already in REF or RREF.
-from sympy import Matrix as SympyMatrix
+from backend.row_storage import RationalRow, SparseRow
+from backend.solution import back_substitution
+from backend.structure import bandwidths
 
 from fractions import Fraction
+from math import lcm
 
 
 class Matrix():
-    def __init__(self, data: list, dimension: tuple):
+    # Supported ways of storing the rows of Matrix.data
+    ROW_STORAGES = ("list", "common_denominator", "sparse")
+
+    # Supported ways of picking the pivot row of each column during
+    # gaussian_elimination, mapped to the method that normalizes it.
+    #
+    # - "pedagogical": Favors rows that already have a 1 or -1, then the
+    #   row with the most whole numbers once normalized, so the steps are
+    #   easy to follow by hand. Reads every entry right of the pivot column
+    #   of every candidate row, O(m*n) per pivot.
+    # - "smallest_bit_size": The entry with the smallest numerator and
+    #   denominator, which keeps the Fractions brought in by the row
+    #   operations small. Only reads the pivot column, O(m) per pivot.
+    # - "markowitz": The row with the fewest non-zero entries, which keeps
+    #   the fill-in of sparse matrices down. O(m*n) per pivot, or the number
+    #   of non-zero entries for sparse rows.
+    #
+    # max_entry_bit_length() measures how large the entries got, see
+    # benchmarks/bench_pivot_strategies.py.
+    PIVOT_STRATEGIES = {
+        "pedagogical": "_normalize_pivot",
+        "smallest_bit_size": "_normalize_smallest_pivot",
+        "markowitz": "_normalize_sparsest_pivot",
+    }
+
+    def __init__(self, data: list, dimension: tuple, log_mode: str = "snapshot", row_storage: str = "list"):
         """
         Args:
             data (list): The list representation of a matrix
             dimension (tuple): Contains the m by n dimensions for a matrix
                         in the form of (m, n)
+            log_mode (str, optional): How the action logger stores each
+                        step, see MatrixActionLogger. Default is "snapshot".
+            row_storage (str, optional): Either "list",
+                        "common_denominator" or "sparse". A "list" keeps
+                        each row of data as given. A "common_denominator"
+                        turns each row into a RationalRow, which stores
+                        integer numerators over one shared denominator. A
+                        "sparse" turns each row into a SparseRow, which only
+                        stores its non-zero entries. The engines of
+                        backend.app all keep "list" rows, so the others are
+                        only used by callers that ask for them. Default is
+                        "list".
         """
 
+        if row_storage not in self.ROW_STORAGES:
+            raise ValueError(f"Invalid row storage: {row_storage}")
+
+        if row_storage == "common_denominator":
+            data[:] = [RationalRow(row) for row in data]
+        elif row_storage == "sparse":
+            data[:] = [SparseRow(row) for row in data]
+
         self.data = data
         self.m = dimension[0]
         self.n = dimension[1]
 
         # Set action logger
-        self.action_logger = MatrixActionLogger(self.data)
+        self.action_logger = MatrixActionLogger(self.data, log_mode=log_mode)
 
         # Used to keep track of pivot point locations while turning matrix
         # into REF through gaussian elimination. This way, when performing
@@ -31,6 +77,39 @@ class Matrix():
         # ...
         self._pivot_point_locations = dict()
 
+        # Number of row operations in the action log before each pivot
+        # point was normalized, keyed the same way as
+        # _pivot_point_locations, along with the number once the last
+        # pivot was done under the key after it. Every step before a pivot
+        # can be replayed on an edited matrix whose edits are all to the
+        # right of the pivots before it, see backend.sessions.
+        self._pivot_steps = dict()
+
+        # Product of every constant a row was multiplied by, with a factor
+        # of -1 for every swap. Adding a multiple of one row to another
+        # leaves the determinant alone, so the determinant of the starting
+        # matrix is that of the current one divided by this, see
+        # determinant().
+        self._determinant_scale = Fraction(1)
+
+        # Called with the number of pivots done after every pivot of
+        # gaussian_elimination and bareiss_elimination, structured fast
+        # paths included, so that long eliminations can report their
+        # progress, or be stopped by raising from it. The upward phase of
+        # gauss-jordan elimination calls it again after every pivot it
+        # eliminates above, with the number of pivots unchanged.
+        self.pivot_callback = None
+
+        # Number of row operations done on the matrix, logged or not, with
+        # every row update of bareiss_elimination counted as one, so that
+        # the work done so far can be bounded, see backend.budget.
+        self.row_op_count = 0
+
+        # Integer rows of bareiss_elimination while it runs, which are what
+        # max_entry_bit_length() measures until they are turned back into
+        # Fractions
+        self._bareiss_rows = None
+
     # Elementary Row Operations
     def swap_rows(self, row_1, row_2):
         """
@@ -38,9 +117,11 @@ class Matrix():
         R_1 <-> R_2
         """
         self.data[row_1], self.data[row_2] = self.data[row_2], self.data[row_1]
+        self._determinant_scale = -self._determinant_scale
+        self.row_op_count += 1
 
         # Log action
-        self.action_logger.record_elementary_row_op(row_1, row_2)
+        self.action_logger.record_swap_rows(row_1, row_2)
 
     def multiply_row(self, row, constant):
         """
@@ -50,27 +131,204 @@ class Matrix():
         if constant == 0:
             return
 
-        for i in range(len(self.data[row])):
-            # Avoid -0.0 instances
-            if self.data[row][i] == 0:
-                continue
+        if isinstance(self.data[row], (RationalRow, SparseRow)):
+            self.data[row].scale(constant)
+        else:
+            for i in range(len(self.data[row])):
+                # Avoid -0.0 instances
+                if self.data[row][i] == 0:
+                    continue
+
+                self.data[row][i] *= constant
 
-            self.data[row][i] *= constant
+        self._determinant_scale *= constant
+        self.row_op_count += 1
 
         # Log action
-        self.action_logger.record_elementary_row_op(row, constant)
+        self.action_logger.record_multiply_row(row, constant)
 
-    def row_multiple_to_row(self, row_2, scalar, row_1):
+    def row_multiple_to_row(self, row_2, scalar, row_1, columns: tuple = None):
         """
         Add a multiple of a row to another row:
         R_2:= R_2 + (scalar)*R_1
+
+        columns, a (start, stop) range of columns, can be given when every
+        entry of R_1 outside of it is known to be 0, so that only those
+        columns are visited.
         """
 
-        for i in range(len(self.data[row_2])):
-            self.data[row_2][i] += (scalar * self.data[row_1][i])
+        if isinstance(self.data[row_2], (RationalRow, SparseRow)):
+            self.data[row_2].add_multiple(self.data[row_1], scalar)
+        else:
+            for i in range(*columns) if columns is not None else range(len(self.data[row_2])):
+                self.data[row_2][i] += (scalar * self.data[row_1][i])
+
+        self.row_op_count += 1
 
         # Log action
-        self.action_logger.record_elementary_row_op(row_2, scalar, row_1)
+        self.action_logger.record_row_multiple_to_row(row_2, scalar, row_1)
+
+    # Row Echelon Form Checks
+    def is_echelon(self) -> bool:
+        """
+        Returns True if the matrix is in REF, meaning every leading entry
+        is strictly to the right of the leading entry of the row above it
+        and all zero rows are at the bottom. Leading entries do not need
+        to be 1.
+        """
+
+        last_pivot_column = -1
+        zero_row_found = False
+
+        for row in self.data:
+            pivot_column = self._leading_entry_column(row)
+
+            if pivot_column is None:
+                zero_row_found = True
+                continue
+
+            # Non-zero row under a zero row, or leading entry is not to
+            # the right of the one above it
+            if zero_row_found or pivot_column <= last_pivot_column:
+                return False
+
+            last_pivot_column = pivot_column
+
+        return True
+
+    def is_reduced_echelon(self) -> bool:
+        """
+        Returns True if the matrix is in RREF, meaning it is in REF, every
+        leading entry is 1, and every leading entry is the only non-zero
+        entry in its column.
+        """
+
+        last_pivot_column = -1
+        zero_row_found = False
+
+        for curr_row, row in enumerate(self.data):
+            pivot_column = self._leading_entry_column(row)
+
+            if pivot_column is None:
+                zero_row_found = True
+                continue
+
+            if zero_row_found or pivot_column <= last_pivot_column or row[pivot_column] != 1:
+                return False
+
+            # Entries below the leading entry are covered by the rows
+            # below passing the REF check, so only look above it.
+            for row_above in range(curr_row):
+                if self.data[row_above][pivot_column] != 0:
+                    return False
+
+            last_pivot_column = pivot_column
+
+        return True
+
+    @staticmethod
+    def _leading_entry_column(row) -> int:
+        # Column index of the first non-zero entry, None for a zero row
+        if isinstance(row, SparseRow):
+            return min(row.entries, default=None)
+
+        for column, entry in enumerate(row):
+            if entry != 0:
+                return column
+
+        return None
+
+    def _sorted_pivot_point_locations(self) -> list:
+        """
+        Returns the (row, column) of every pivot point of the matrix, top
+        to bottom, once it is in REF. Found from the leading entries of the
+        rows if elimination did not keep track of them, such as when the
+        matrix was in REF to begin with.
+        """
+
+        if self._pivot_point_locations:
+            return [self._pivot_point_locations[key] for key in sorted(self._pivot_point_locations)]
+
+        pivot_point_locations = []
+        for curr_row, row in enumerate(self.data):
+            pivot_column = self._leading_entry_column(row)
+            if pivot_column is None:
+                break
+
+            pivot_point_locations.append((curr_row, pivot_column))
+
+        return pivot_point_locations
+
+    # Elimination Byproducts
+    def rank(self) -> int:
+        """
+        Number of pivot points of the matrix, turning it into REF through
+        gaussian_elimination() first if it is not in REF already.
+        """
+
+        if not self.is_echelon():
+            self.gaussian_elimination()
+
+        return len(self._sorted_pivot_point_locations())
+
+    def nullity(self) -> int:
+        """ Number of columns without a pivot point, being n - rank. """
+
+        return self.n - self.rank()
+
+    def determinant(self) -> Fraction:
+        """
+        Determinant of the matrix as it was created, found from the REF it
+        was eliminated into. The REF is upper triangular, so its
+        determinant is the product of its diagonal entries, which only
+        differs from the starting one by the row operations that scaled or
+        swapped rows along the way. The matrix is turned into REF through
+        gaussian_elimination() first if it is not in REF already.
+
+        Only row operations done through the methods of the matrix are
+        accounted for, not entries changed in any other way.
+
+        Raises:
+            ValueError: If the matrix is not square.
+        """
+
+        if self.m != self.n:
+            raise ValueError("Only square matrices have a determinant")
+
+        if not self.is_echelon():
+            self.gaussian_elimination()
+
+        determinant = Fraction(1) / self._determinant_scale
+        for curr_row in range(self.n):
+            determinant *= self.data[curr_row][curr_row]
+
+        return determinant
+
+    def inverse(self) -> list:
+        """
+        Inverse of the matrix as it currently is, found by turning
+        [A | I] into RREF, so that I becomes the inverse of A.
+
+        Returns:
+            list: The inverse as a list of rows of Fractions, None if the
+                matrix is singular.
+
+        Raises:
+            ValueError: If the matrix is not square.
+        """
+
+        if self.m != self.n:
+            raise ValueError("Only square matrices have an inverse")
+
+        identity = [[Fraction(int(curr_row == curr_column)) for curr_column in range(self.n)] for curr_row in range(self.n)]
+
+        augmented_matrix = AugmentedMatrix([list(row) for row in self.data], identity, (self.n, 2 * self.n), log_mode="off")
+        augmented_matrix.bareiss_elimination(gauss_jordan=True)
+
+        if augmented_matrix.rank() < self.n:
+            return None
+
+        return augmented_matrix.constant_matrix
 
     # Helper Methods for Gaussian Elimination
     def _eliminate_entries(self, pivot_point_location: tuple, direction: str = "below") -> None:
@@ -119,7 +377,307 @@ class Matrix():
             else:
                 top_pointer += 1
 
-    def _reached_base_case(self, gauss_jordan=False) -> None:
+    def _normalize_pivot(self, pivots_normalized: int, curr_column: int) -> bool:
+        """
+        Turn an entry of curr_column, in the row at pivots_normalized or
+        any row below it, into a 1 and move it into the row at
+        pivots_normalized through row operations.
+
+        Returns:
+            bool: False if there was no possible pivot point within
+                curr_column, True otherwise.
+        """
+
+        # Current entry in the column for pivot point is already 1
+        if self.data[pivots_normalized][curr_column] == 1:
+            return True
+
+        # Used for saving an extra elementary operation if an entry
+        # in the column, under the pivot point has a -1, but there is also
+        # another entry somewhere under that one which has a 1
+        row_with_neg_one = (False, 0)  # (boolean, row index)
+
+        # If a (1 / #)*R_i operation is needed, keep track of
+        # the row that would have the most number of whole numbers
+        # entries after the operation.
+        largest_whole_num_row = (0, 0)  # (row index, num of whole numbers)
+
+        # Used for keeping track of all the values in the current column
+        column_values = set()
+
+        for curr_row in range(pivots_normalized, self.m):
+            row = self.data[curr_row]
+
+            # Ignore entries with 0's
+            if row[curr_column] == 0:
+                column_values.add(0)
+                continue
+
+            # Do a swap rows operation if another row in the matrix
+            # already has a 1 or -1 within the pivot column
+            if curr_row != pivots_normalized and row[curr_column] == 1:
+                # Another row has a 1, so swap with that row
+                self.swap_rows(pivots_normalized, curr_row)
+                return True
+
+            elif row[curr_column] == -1 and row_with_neg_one[0] is False:
+                # Don't perform the swap operation in case there
+                # is another entry within the pivot column that is already
+                # 1 to save a self.multiply_row(X, -1) operation.
+                row_with_neg_one = (True, curr_row)
+
+            # Number of whole numbers that would be in the row if a
+            # (1 / #)*R_i operation took place in the current row
+            num_whole_numbers = self._count_whole_numbers(row, curr_column)
+
+            # Update largest_whole_num_row
+            if num_whole_numbers > largest_whole_num_row[1]:
+                largest_whole_num_row = (curr_row, num_whole_numbers)
+
+            column_values.add(row[curr_column])
+
+        # No row already had a 1, but there was a -1,
+        # so swap rows and multiply row by -1.
+        if row_with_neg_one[0]:
+            self.multiply_row(row_with_neg_one[1], -1)
+
+            # Swap rows if needed
+            if pivots_normalized != row_with_neg_one[1]:
+                self.swap_rows(pivots_normalized, row_with_neg_one[1])
+
+            return True
+
+        # The column consisted of all 0's
+        if column_values == {0}:
+            return False
+
+        # A (1 / #)*R_i operation is needed, so do it on the row that
+        # would have the most number of whole numbers
+        self.multiply_row(largest_whole_num_row[0], Fraction(1, self.data[largest_whole_num_row[0]][curr_column]))
+
+        # Swap the row with the largest whole numbers with the
+        # current pivot row if it is already not that row
+        if largest_whole_num_row[0] != pivots_normalized:
+            self.swap_rows(pivots_normalized, largest_whole_num_row[0])
+
+        return True
+
+    def _normalize_sparsest_pivot(self, pivots_normalized: int, curr_column: int) -> bool:
+        """
+        Fill-reducing alternative to _normalize_pivot. Out of the rows at
+        pivots_normalized or below with a non-zero entry in curr_column, the
+        one with the fewest non-zero entries becomes the pivot row. Every
+        row operation that eliminates with it then adds the fewest new
+        non-zero entries (fill-in) to the rows below, which is the Markowitz
+        criterion with the column order fixed.
+
+        Returns:
+            bool: False if there was no possible pivot point within
+                curr_column, True otherwise.
+        """
+
+        candidate_rows = [
+            curr_row for curr_row in range(pivots_normalized, self.m)
+            if self.data[curr_row][curr_column] != 0
+        ]
+
+        # The column consisted of all 0's
+        if not candidate_rows:
+            return False
+
+        pivot_row = min(candidate_rows, key=lambda curr_row: self._count_nonzeros(self.data[curr_row]))
+        self._move_pivot(pivot_row, pivots_normalized, curr_column)
+
+        return True
+
+    def _normalize_smallest_pivot(self, pivots_normalized: int, curr_column: int) -> bool:
+        """
+        Alternative to _normalize_pivot that keeps coefficient growth
+        down. Out of the rows at pivots_normalized or below with a non-zero
+        entry in curr_column, the one whose entry has the fewest bits, see
+        _entry_bit_length, becomes the pivot row. Its row is divided by the
+        entry, and every other row is eliminated with a multiple of the
+        entry over it, so a small pivot brings in the smallest numerators
+        and denominators. Only curr_column is read.
+
+        Returns:
+            bool: False if there was no possible pivot point within
+                curr_column, True otherwise.
+        """
+
+        pivot_row = None
+        smallest_bit_length = None
+
+        for curr_row in range(pivots_normalized, self.m):
+            entry = self.data[curr_row][curr_column]
+
+            if entry == 0:
+                continue
+
+            bit_length = self._entry_bit_length(entry)
+
+            # Keep the first of equally small entries, saving a swap
+            if smallest_bit_length is None or bit_length < smallest_bit_length:
+                pivot_row, smallest_bit_length = curr_row, bit_length
+
+        # The column consisted of all 0's
+        if pivot_row is None:
+            return False
+
+        self._move_pivot(pivot_row, pivots_normalized, curr_column)
+
+        return True
+
+    def _move_pivot(self, pivot_row: int, pivots_normalized: int, curr_column: int) -> None:
+        # Turn the entry of pivot_row in curr_column into a 1, then swap
+        # pivot_row into the row at pivots_normalized
+        if self.data[pivot_row][curr_column] != 1:
+            self.multiply_row(pivot_row, Fraction(1, self.data[pivot_row][curr_column]))
+
+        if pivot_row != pivots_normalized:
+            self.swap_rows(pivots_normalized, pivot_row)
+
+    @staticmethod
+    def _entry_bit_length(entry) -> int:
+        # Bits taken by the numerator and denominator of an exact entry
+        return entry.numerator.bit_length() + entry.denominator.bit_length()
+
+    def max_entry_bit_length(self) -> int:
+        """
+        Bits taken by the numerator and denominator of the largest entry,
+        constants included, as a measure of how much the entries have
+        grown through elimination.
+        """
+
+        rows = self._bareiss_rows if self._bareiss_rows is not None else self._rows_with_constants()
+
+        return max((self._entry_bit_length(entry) for row in rows for entry in row), default=0)
+
+    @staticmethod
+    def _count_nonzeros(row) -> int:
+        if isinstance(row, SparseRow):
+            return row.num_nonzeros
+
+        return sum(1 for entry in row if entry != 0)
+
+    @staticmethod
+    def _count_whole_numbers(row, curr_column: int) -> int:
+        # Number of entries from curr_column onward that are whole number
+        # multiples of the entry in curr_column
+        pivot = row[curr_column]
+
+        if isinstance(row, SparseRow):
+            # Every zero entry counts, so only visit the non-zero ones
+            nonzero_entries = [entry for column, entry in row.entries.items() if column >= curr_column]
+            num_zeros = len(row) - curr_column - len(nonzero_entries)
+
+            return num_zeros + sum(1 for entry in nonzero_entries if entry % pivot == 0)
+
+        return sum(1 for entry in row[curr_column:] if entry % pivot == 0)
+
+    def _report_pivots(self, pivots_done: int) -> None:
+        if self.pivot_callback is not None:
+            self.pivot_callback(pivots_done)
+
+    def _normalize_diagonal_pivot(self, curr_row: int) -> None:
+        # Turn the non-zero diagonal entry of curr_row into a 1
+        if self.data[curr_row][curr_row] != 1:
+            self.multiply_row(curr_row, Fraction(1, self.data[curr_row][curr_row]))
+
+        self._pivot_point_locations[curr_row] = (curr_row, curr_row)
+
+    def _eliminate_band(self, pivot_row: int, first_row: int, last_row: int, last_column: int) -> None:
+        # Turn the entries of the pivot column, from first_row up to but
+        # not including last_row, into 0's with the normalized pivot at
+        # (pivot_row, pivot_row). Every entry of the pivot row from
+        # last_column onward is known to be 0.
+        for curr_row in range(first_row, last_row):
+            entry = self.data[curr_row][pivot_row]
+
+            if entry != 0:
+                self.row_multiple_to_row(curr_row, -entry, pivot_row, columns=(pivot_row, last_column))
+
+    def _structured_elimination(self, structure: str, gauss_jordan: bool) -> int:
+        """
+        Fast paths of gaussian_elimination for a square matrix with one of
+        the STRUCTURES of backend.structure, other than "general", that
+        only take the row operations the structure needs.
+
+        Every pivot is on the diagonal once done, apart from a "banded"
+        matrix that runs into a zero pivot, as it is eliminated without
+        swapping rows.
+
+        Returns:
+            int: Number of pivots normalized, with the entries below them
+                eliminated.
+        """
+
+        if structure == "diagonal":
+            # Already in RREF once every pivot is normalized
+            for curr_row in range(self.m):
+                self._normalize_diagonal_pivot(curr_row)
+                self._report_pivots(curr_row + 1)
+
+        elif structure == "permuted_identity":
+            # Move the row with the non-zero entry of each column onto the
+            # diagonal, taking at most one swap per row
+            row_of_column = {self._leading_entry_column(row): curr_row for curr_row, row in enumerate(self.data)}
+
+            for curr_column in range(self.n):
+                curr_row = row_of_column[curr_column]
+
+                if curr_row != curr_column:
+                    # The row at curr_column moves to where curr_row was
+                    row_of_column[self._leading_entry_column(self.data[curr_column])] = curr_row
+                    self.swap_rows(curr_column, curr_row)
+
+                self._normalize_diagonal_pivot(curr_column)
+                self._report_pivots(curr_column + 1)
+
+        elif structure == "lower_triangular":
+            # Each pivot row only has its pivot left once it is reached,
+            # so this ends in RREF as well
+            for curr_row in range(self.m):
+                self._normalize_diagonal_pivot(curr_row)
+                self._eliminate_band(curr_row, curr_row + 1, self.m, curr_row + 1)
+                self._report_pivots(curr_row + 1)
+
+        elif structure == "upper_triangular":
+            # Already in REF, so only gauss-jordan elimination gets here.
+            # Going up from the last pivot, each pivot row only has its
+            # pivot left once it is reached.
+            for curr_row in reversed(range(self.m)):
+                self._normalize_diagonal_pivot(curr_row)
+                self._eliminate_band(curr_row, 0, curr_row, curr_row + 1)
+                self._report_pivots(self.m - curr_row)
+
+        elif structure == "banded":
+            lower_bandwidth, upper_bandwidth = bandwidths(self.data)
+
+            for curr_row in range(self.m):
+                if self.data[curr_row][curr_row] == 0:
+                    # Rows have to be swapped from here on
+                    return curr_row
+
+                # Eliminating within the band keeps the upper bandwidth
+                self._normalize_diagonal_pivot(curr_row)
+                self._eliminate_band(
+                    curr_row, curr_row + 1, min(self.m, curr_row + lower_bandwidth + 1),
+                    min(self.n, curr_row + upper_bandwidth + 1)
+                )
+                self._report_pivots(curr_row + 1)
+
+            if gauss_jordan:
+                for curr_row in reversed(range(self.m)):
+                    self._eliminate_band(curr_row, max(0, curr_row - upper_bandwidth), curr_row, curr_row + 1)
+                    self._report_pivots(self.m)
+
+        else:
+            raise ValueError(f"No fast path for structure: {structure}")
+
+        return self.m
+
+    def _finish_elimination(self, gauss_jordan=False) -> None:
         # All possible pivots have been normalized and entries below
         # them have been eliminated
 
@@ -131,197 +689,324 @@ class Matrix():
         if gauss_jordan:
             for key in reversed(sorted(self._pivot_point_locations.keys())):
                 self._eliminate_entries(self._pivot_point_locations[key], direction="above")
+                self._report_pivots(len(self._pivot_point_locations))
                 # End of gauss-jordan elimination, matrix is now in RREF
 
     # Composite Method: Gaussian Elimination
-    def gaussian_elimination(self, pivots_normalized: int = 0, gauss_jordan: bool = False) -> None:
+    def gaussian_elimination(self, gauss_jordan: bool = False, structure: str = None,
+                             pivot_strategy: str = "pedagogical") -> None:
         """
-        Recursive function to normalize all pivot points within the matrix
-        and eliminate all entries below them. This effectively turns the
-        matrix into REF.
+        Normalize all pivot points within the matrix and eliminate all
+        entries below them, one pivot at a time. This effectively turns
+        the matrix into REF.
 
         If gauss_jordan is set to True, then further operations will take
         place, effectively turning the matrix into RREF.
 
         Args:
-            pivots_normalized (int, optional): pivots_normalized is used to
-                keep track of how many pivots have already been normalized
-                for use in the elimination algorithm
-
             gauss_jordan (bool, optional): Performs additional steps to get
                 matrix into RREF. Default value is False.
+            structure (str, optional): Structure of the matrix, as given
+                by backend.structure.classify_structure(). Anything but
+                "general" takes a fast path that only does the row
+                operations the structure needs. Default value is None,
+                treated as "general".
+            pivot_strategy (str, optional): How the pivot row of each
+                column is picked, one of PIVOT_STRATEGIES. Default value
+                is "pedagogical".
         """
 
+        if pivot_strategy not in self.PIVOT_STRATEGIES:
+            raise ValueError(f"Invalid pivot strategy: {pivot_strategy}")
+
         # Before starting any elimination, check to make sure if the matrix is
         # already in the desired REF or RREF. If so, don't do anything.
-        if pivots_normalized == 0:
-            matrix_for_checking = SympyMatrix(self.data.copy())
+        if not gauss_jordan and self.is_echelon():
+            # Already in desired REF
+            return
+        elif gauss_jordan and self.is_reduced_echelon():
+            # Already in desired RREF
+            return
 
-            if not gauss_jordan and matrix_for_checking.is_echelon:
-                # Already in desired REF
-                return
-            elif gauss_jordan and matrix_for_checking == matrix_for_checking.rref()[0]:
-                # Already in desired RREF
+        pivots_normalized = 0
+        curr_column = 0
+
+        if structure is not None and structure != "general":
+            pivots_normalized = curr_column = self._structured_elimination(structure, gauss_jordan)
+
+            if pivots_normalized == self.m:
+                # Every structure but a "banded" one that ran into a zero
+                # pivot is already in the desired REF or RREF
                 return
 
+        normalize_pivot = getattr(self, self.PIVOT_STRATEGIES[pivot_strategy])
+
+        self._eliminate_below_pivots(pivots_normalized, curr_column, normalize_pivot)
+        self._finish_elimination(gauss_jordan=gauss_jordan)
+
+    def _eliminate_below_pivots(self, pivots_normalized: int, curr_column: int, normalize_pivot) -> None:
+        """
+        Normalizes every pivot point from the row at pivots_normalized and
+        curr_column onward, eliminating the entries below each of them,
+        with the rows and columns before them already done.
+        """
+
         # Get the smallest dimension of the matrix
         smallest_dimension = self.m if self.m < self.n else self.n
 
-        # Base case: Last pivot has been normalized
-        if pivots_normalized == smallest_dimension:
-            self._reached_base_case(gauss_jordan=gauss_jordan)
-            return
+        # Stop once the last pivot has been normalized, or there are
+        # no columns left that could hold a pivot point
+        while pivots_normalized < smallest_dimension and curr_column < self.n:
+            steps_before_pivot = len(self.action_logger.row_ops)
 
-        # Not all columns are guaranteed to be iterated through as
-        # the function will recurse once a pivot is normalized
-        # and return afterwards
-        curr_column = pivots_normalized
-
-        # Infinite loop will be broken out of by a return statement, once all
-        # pivots are normalized
-        while True:
-            try:
-                # Current entry in the column for pivot point is already 1
-                if self.data[pivots_normalized][curr_column] == 1:
-                    # Current pivot is normalized,
-                    # so eliminate entries below it
-                    self._eliminate_entries(pivot_point_location=(pivots_normalized, curr_column), direction="below")
-
-                    # Keep track of pivot point location
-                    self._pivot_point_locations[pivots_normalized] = (pivots_normalized, curr_column)
-
-                    # Continue to next pivot
-                    self.gaussian_elimination(pivots_normalized=pivots_normalized + 1, gauss_jordan=gauss_jordan)
-                    return
-            # Base case: There was a zero in the very last
-            # pivot point of the matrix
-            except IndexError:
-                self._reached_base_case(gauss_jordan=gauss_jordan)
-                return
+            if not normalize_pivot(pivots_normalized, curr_column):
+                # There was no possible pivot point within this column
+                # so move on to next column
+                curr_column += 1
+                continue
 
-            # Used for saving an extra elementary operation if an entry
-            # in the column, under the pivot point has a -1, but there is also
-            # another entry somewhere under that one which has a 1
-            row_with_neg_one = (False, 0)  # (boolean, row index)
+            # Current pivot is normalized, so eliminate entries below it
+            self._eliminate_entries(pivot_point_location=(pivots_normalized, curr_column), direction="below")
 
-            # If a (1 / #)*R_i operation is needed, keep track of
-            # the row that would have the most number of whole numbers
-            # entries after the operation.
-            largest_whole_num_row = (0, 0)  # (row index, num of whole numbers)
+            # Keep track of pivot point location
+            self._pivot_point_locations[pivots_normalized] = (pivots_normalized, curr_column)
+            self._pivot_steps[pivots_normalized] = steps_before_pivot
 
-            # Used for keeping track of all the values in the current column
-            column_values = set()
+            # Continue to next pivot
+            pivots_normalized += 1
+            curr_column += 1
 
-            for curr_row, row in enumerate(self.data):
-                # Ignore rows that above the current pivot point
-                if curr_row < pivots_normalized:
-                    continue
+            self._report_pivots(pivots_normalized)
 
-                # Ignore entries with 0's
-                if row[curr_column] == 0:
-                    column_values.add(0)
-                    continue
+        self._pivot_steps[pivots_normalized] = len(self.action_logger.row_ops)
+
+    def reduce_from_echelon(self) -> None:
+        """
+        Upward phase of gauss-jordan elimination on its own, turning a
+        matrix already in REF into RREF without redoing the work below the
+        pivots. Pivots that are not 1, such as those of a matrix that was
+        in REF to begin with, are normalized first.
+        """
+
+        if self.is_reduced_echelon():
+            # Already in RREF
+            return
+        elif not self.is_echelon():
+            raise ValueError("Matrix must be in REF before it can be reduced")
 
-                # Do a swap rows operation if another row in the matrix
-                # already has a 1 or -1 within the pivot column
-                if curr_row != pivots_normalized and row[curr_column] == 1:
-                    # Another row has a 1, so swap with that row
-                    self.swap_rows(pivots_normalized, curr_row)
+        pivot_point_locations = self._sorted_pivot_point_locations()
 
-                    # Current pivot is normalized,
-                    # so eliminate entries below it
-                    self._eliminate_entries(pivot_point_location=(pivots_normalized, curr_column), direction="below")
+        for pivot_row, pivot_column in pivot_point_locations:
+            pivot = self.data[pivot_row][pivot_column]
+            if pivot != 1:
+                self.multiply_row(pivot_row, Fraction(1) / pivot)
 
-                    # Keep track of pivot point location
-                    self._pivot_point_locations[pivots_normalized] = (pivots_normalized, curr_column)
+        for pivot_point_location in reversed(pivot_point_locations):
+            self._eliminate_entries(pivot_point_location, direction="above")
+            self._report_pivots(len(pivot_point_locations))
+            # End of gauss-jordan elimination, matrix is now in RREF
 
-                    # Continue to next pivot
-                    self.gaussian_elimination(pivots_normalized=pivots_normalized + 1, gauss_jordan=gauss_jordan)
-                    return
+    # Composite Method: Fraction-Free (Bareiss) Elimination
+    def bareiss_elimination(self, gauss_jordan: bool = False) -> None:
+        """
+        Alternative exact engine to gaussian_elimination that uses
+        fraction-free (Bareiss) elimination on Python ints. Every entry
+        update takes one exact integer division, and entries stay bounded
+        by the size of the minors of the starting matrix. Rows are only
+        turned back into Fractions once the matrix is in REF or RREF, with
+        every pivot being 1.
+
+        Rational rows are scaled into integer rows beforehand, which does
+        not change their RREF. The RREF is the same as the one from
+        gaussian_elimination, but the row operations taken are not, so the
+        action logger only records the starting and final matrix as a
+        single "bareiss_elimination" step. With an "ops" log, every step is
+        recorded as the elementary row operations it is made of instead,
+        so that they can be replayed on other constant matrices.
+
+        Args:
+            gauss_jordan (bool, optional): Performs additional steps to get
+                matrix into RREF. Default value is False.
+        """
+
+        # Before starting any elimination, check to make sure if the matrix is
+        # already in the desired REF or RREF. If so, don't do anything.
+        if not gauss_jordan and self.is_echelon():
+            # Already in desired REF
+            return
+        elif gauss_jordan and self.is_reduced_echelon():
+            # Already in desired RREF
+            return
 
-                elif row[curr_column] == -1 and row_with_neg_one[0] is False:
-                    # Don't perform the swap operation in case there
-                    # is another entry within the pivot column that is already
-                    # 1 to save a self.multiply_row(X, -1) operation.
-                    row_with_neg_one = (True, curr_row)
+        # Only an "ops" log records the steps taken one by one
+        record_row_ops = self.action_logger.log_mode == "ops"
 
-                # list containing the new whole numbers that would be in
-                # the row if a (1 / #)*R_i operation took place in
-                # the current row
-                new_row_values = list(filter(lambda x: x % row[curr_column] == 0, row[curr_column:]))
+        # Product of the integer scales of the rows, along with a factor
+        # of -1 for every swap, see _determinant_scale
+        determinant_scale = 1
 
-                # Update largest_whole_num_row
-                if len(new_row_values) > largest_whole_num_row[1]:
-                    largest_whole_num_row = (curr_row, len(new_row_values))
+        rows = []
+        for curr_row, row in enumerate(self._rows_with_constants()):
+            row = [Fraction(entry) for entry in row]
+            scale = self._integer_scale(row)
+            determinant_scale *= scale
 
-                column_values.add(row[curr_column])
+            rows.append([entry.numerator * (scale // entry.denominator) for entry in row])
 
-            # No row already had a 1, but there was a -1,
-            # so swap rows, multiply row by -1, and continue to next pivot.
-            if row_with_neg_one[0]:
-                self.multiply_row(row_with_neg_one[1], -1)
+            if record_row_ops and scale != 1:
+                self.action_logger.record_multiply_row(curr_row, scale)
 
-                # Swap rows if needed
-                if pivots_normalized != row_with_neg_one[1]:
-                    self.swap_rows(pivots_normalized, row_with_neg_one[1])
+        width = len(rows[0]) if rows else 0
 
-                # Current pivot is normalized, so eliminate entries below it
-                self._eliminate_entries(pivot_point_location=(pivots_normalized, curr_column), direction="below")
+        pivot_row = 0
+        previous_pivot = 1
 
-                # Keep track of pivot point location
-                self._pivot_point_locations[pivots_normalized] = (pivots_normalized, curr_column)
+        # Left set if the pivot callback raises, as the rows then hold
+        # where the elimination stopped
+        self._bareiss_rows = rows
 
-                # Continue to next pivot
-                self.gaussian_elimination(pivots_normalized=pivots_normalized + 1, gauss_jordan=gauss_jordan)
-                return
+        for curr_column in range(self.n):
+            if pivot_row == self.m:
+                break
 
-            # The column consisted of all 0's
-            if column_values == {0}:
+            # Use the first row with a non-zero entry as the pivot row
+            for curr_row in range(pivot_row, self.m):
+                if rows[curr_row][curr_column] != 0:
+                    break
+            else:
                 # There was no possible pivot point within this column
-                # so move on to next column
-                curr_column += 1
                 continue
 
-            # A (1 / #)*R_i operation is needed, so do it on the row that
-            # would have the most number of whole numbers
-            self.multiply_row(largest_whole_num_row[0], Fraction(1, self.data[largest_whole_num_row[0]][curr_column]))
+            if curr_row != pivot_row:
+                rows[pivot_row], rows[curr_row] = rows[curr_row], rows[pivot_row]
+                determinant_scale = -determinant_scale
+                self.row_op_count += 1
 
-            # Swap the row with the largest whole numbers with the
-            # current pivot row if it is already not that row
-            if largest_whole_num_row[0] != pivots_normalized:
-                self.swap_rows(pivots_normalized, largest_whole_num_row[0])
+                if record_row_ops:
+                    self.action_logger.record_swap_rows(pivot_row, curr_row)
 
-            # Current pivot is normalized, so eliminate entries below it
-            self._eliminate_entries(pivot_point_location=(pivots_normalized, curr_column), direction="below")
+            pivot = rows[pivot_row][curr_column]
+            pivot_entries = rows[pivot_row]
+
+            # For gauss-jordan elimination, rows above the pivot are reduced
+            # in the same pass, which keeps every division exact.
+            for curr_row in range(0 if gauss_jordan else pivot_row + 1, self.m):
+                if curr_row == pivot_row:
+                    continue
+
+                row = rows[curr_row]
+                entry = row[curr_column]
+
+                # Entries left of the pivot column are only non-zero in rows
+                # above the pivot row
+                start_column = 0 if curr_row < pivot_row else curr_column
+
+                for j in range(start_column, width):
+                    row[j] = (pivot * row[j] - entry * pivot_entries[j]) // previous_pivot
+
+                self.row_op_count += 1
+
+                if record_row_ops:
+                    # R_i:= (pivot*R_i - entry*R_pivot_row) / previous_pivot
+                    if pivot != previous_pivot:
+                        self.action_logger.record_multiply_row(curr_row, Fraction(pivot, previous_pivot))
+                    if entry != 0:
+                        self.action_logger.record_row_multiple_to_row(curr_row, Fraction(-entry, previous_pivot), pivot_row)
 
             # Keep track of pivot point location
-            self._pivot_point_locations[pivots_normalized] = (pivots_normalized, curr_column)
+            self._pivot_point_locations[pivot_row] = (pivot_row, curr_column)
 
-            # Continue to next pivot
-            self.gaussian_elimination(pivots_normalized=pivots_normalized + 1, gauss_jordan=gauss_jordan)
-            return
+            previous_pivot = pivot
+            pivot_row += 1
+
+            self._report_pivots(pivot_row)
+
+        self._bareiss_rows = None
+
+        # Turn the pivots into 1's, which is the only time Fractions are used
+        for curr_row, (_, pivot_column) in self._pivot_point_locations.items():
+            pivot = rows[curr_row][pivot_column]
+            rows[curr_row] = [Fraction(entry, pivot) for entry in rows[curr_row]]
+
+            if record_row_ops and pivot != 1:
+                self.action_logger.record_multiply_row(curr_row, Fraction(1, pivot))
+
+        for curr_row in range(len(self._pivot_point_locations), self.m):
+            rows[curr_row] = [Fraction(entry) for entry in rows[curr_row]]
+
+        # Every pivot is a minor of the scaled and swapped starting matrix,
+        # the last one being its determinant once every column has a
+        # pivot. The rows are normalized by then, so tracking each row
+        # update on its own is not needed.
+        self._determinant_scale *= Fraction(determinant_scale, previous_pivot)
+
+        self._set_rows_with_constants(rows)
+
+        # Log action
+        if not record_row_ops:
+            self.action_logger.record_composite_row_op("bareiss_elimination")
+
+    @staticmethod
+    def _integer_scale(row: list) -> int:
+        # Smallest number that turns every Fraction of the row into an
+        # integer, the lcm of its denominators
+        return lcm(*(entry.denominator for entry in row))
+
+    def _rows_with_constants(self) -> list:
+        """
+        Returns every row of the matrix, followed by its constant
+        entries if there are any.
+        """
+
+        return [list(row) for row in self.data]
+
+    def _set_rows_with_constants(self, rows: list) -> None:
+        """ Inverse of self._rows_with_constants(), updates rows in place. """
+
+        for curr_row, row in enumerate(rows):
+            self._replace_row(curr_row, row)
+
+    def _replace_row(self, row: int, entries: list) -> None:
+        # Keep the row storage type of the row
+        if isinstance(self.data[row], RationalRow):
+            self.data[row] = RationalRow(entries)
+        elif isinstance(self.data[row], SparseRow):
+            self.data[row] = SparseRow(entries)
+        else:
+            self.data[row][:] = entries
 
 
 class AugmentedMatrix(Matrix):
-    def __init__(self, coefficient_matrix: list, constant_matrix: list, dimension: tuple):
+    def __init__(self, coefficient_matrix: list, constant_matrix: list, dimension: tuple, log_mode: str = "snapshot",
+                 row_storage: str = "list"):
         """
         Args:
             coefficient_matrix (list): The list representation of
                         the coefficient matrix.
             constant_matrix (list): The list representation of
-                        the constant matrix.
+                        the m by k constant matrix. Each of its k columns
+                        is a separate right-hand side, which are all
+                        solved by the same row operations.
             dimension (tuple): Contains the m by n dimensions for
                         the whole augmented matrix (coefficient matrix +
                         constant matrix in the form of (m, n).
+            log_mode (str, optional): How the action logger stores each
+                        step, see MatrixActionLogger. Default is "snapshot".
+            row_storage (str, optional): How the rows of the coefficient
+                        matrix are stored, see Matrix. Default is "list".
         """
+        # Number of columns of the constant matrix
+        num_constant_columns = len(constant_matrix[0]) if constant_matrix else 1
+
         # Treat coefficient_matrix like Matrix.data
-        super().__init__(coefficient_matrix, dimension=(dimension[0], dimension[1] - 1))
+        super().__init__(coefficient_matrix, dimension=(dimension[0], dimension[1] - num_constant_columns),
+                         log_mode=log_mode, row_storage=row_storage)
 
         self.constant_matrix = constant_matrix
 
         # Used for generating HTML content based off of different
         # methods performed on self.data
-        self.action_logger = MatrixActionLogger(self.data, parent_constant_matrix=self.constant_matrix)
+        self.action_logger = MatrixActionLogger(self.data, parent_constant_matrix=self.constant_matrix, log_mode=log_mode)
 
     def swap_rows(self, row_1, row_2):
         # Perform row operation constant matrix
@@ -333,13 +1018,44 @@ class AugmentedMatrix(Matrix):
         super().swap_rows(row_1, row_2)
 
     def multiply_row(self, row, constant):
-        # Perform row operation constant matrix
-        self.constant_matrix[row][0] *= constant
+        # Perform row operation on every column of constant matrix
+        constant_row = self.constant_matrix[row]
+        for i in range(len(constant_row)):
+            constant_row[i] *= constant
 
         super().multiply_row(row, constant)
 
-    def row_multiple_to_row(self, row_2, integer, row_1):
-        # Perform row operation constant matrix
-        self.constant_matrix[row_2][0] += (integer * self.constant_matrix[row_1][0])
+    def row_multiple_to_row(self, row_2, integer, row_1, columns: tuple = None):
+        # Perform row operation on every column of constant matrix
+        constant_row_2 = self.constant_matrix[row_2]
+        constant_row_1 = self.constant_matrix[row_1]
+        for i in range(len(constant_row_2)):
+            constant_row_2[i] += (integer * constant_row_1[i])
+
+        super().row_multiple_to_row(row_2, integer, row_1, columns=columns)
+
+    def _rows_with_constants(self) -> list:
+        return [list(row) + list(constant_row) for row, constant_row in zip(self.data, self.constant_matrix)]
+
+    def _set_rows_with_constants(self, rows: list) -> None:
+        for curr_row, row in enumerate(rows):
+            self._replace_row(curr_row, row[:self.n])
+            self.constant_matrix[curr_row][:] = row[self.n:]
+
+    def solve(self) -> dict:
+        """
+        Solves the system of equations through back substitution, see
+        backend.solution.back_substitution(). The matrix is only turned
+        into REF first if it is not in REF or RREF already, so none of the
+        entries above the pivots are eliminated.
+
+        Returns:
+            dict: The free variables, null space basis and, for every
+                constant column, whether it is consistent along with a
+                particular solution.
+        """
+
+        if not self.is_echelon():
+            self.gaussian_elimination()
 
-        super().row_multiple_to_row(row_2, integer, row_1)
+        return back_substitution(self.data, self.constant_matrix, self._sorted_pivot_point_locations(), self.n)
@@ -1,9 +1,71 @@
-import inspect
-from copy import deepcopy
+class RowOperation():
+    """
+    Compact record of a single elementary row operation performed on a
+    matrix. Row indices are stored 0-indexed.
+
+    - "swap_rows": R_row <-> R_other_row
+    - "multiply_row": (scalar) * R_row
+    - "row_multiple_to_row": R_row:= R_row + (scalar)*R_other_row
+
+    Any other name is a composite operation performed by a whole
+    elimination engine at once, which may touch every row.
+    """
+
+    __slots__ = ("name", "row", "scalar", "other_row")
+
+    def __init__(self, name: str, row: int, scalar=None, other_row: int = None):
+        self.name = name
+        self.row = row
+        self.scalar = scalar
+        self.other_row = other_row
+
+    def __repr__(self) -> str:
+        return f"RowOperation({self.name!r}, {self.row!r}, {self.scalar!r}, {self.other_row!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RowOperation):
+            return NotImplemented
+
+        return (
+            (self.name, self.row, self.scalar, self.other_row) ==
+            (other.name, other.row, other.scalar, other.other_row)
+        )
+
+    @property
+    def touched_rows(self) -> tuple:
+        """
+        Rows whose entries may change after the row operation, None if
+        every row may change.
+        """
+
+        if self.name == "swap_rows":
+            return (self.row, self.other_row)
+        elif self.name in ("multiply_row", "row_multiple_to_row"):
+            return (self.row,)
+
+        return None
+
+    def to_tuple(self) -> tuple:
+        """
+        Returns the row operation as the tuple of str used by
+        MatrixActionLogger.row_ops_content, with rows 1-indexed.
+        """
+
+        if self.name == "swap_rows":
+            return ("swap_rows", str(self.row + 1), str(self.other_row + 1))
+        elif self.name == "multiply_row":
+            return ("multiply_row", str(self.row + 1), str(self.scalar))
+        elif self.name == "row_multiple_to_row":
+            return ("row_multiple_to_row", str(self.row + 1), str(self.scalar), str(self.other_row + 1))
+        else:
+            return (self.name,)
 
 
 class MatrixActionLogger():
-    def __init__(self, parent_matrix, parent_constant_matrix=None):
+    # Supported ways of storing the steps of the parent matrix
+    LOG_MODES = ("snapshot", "delta", "ops", "off")
+
+    def __init__(self, parent_matrix, parent_constant_matrix=None, log_mode="snapshot"):
         """
         Records the information of different actions/operations performed on
         the "parent" Matrix.data matrix from its different methods.
@@ -14,6 +76,17 @@ class MatrixActionLogger():
             parent_constant_matrix (list, optional): The list representation
                         of the constant matrix if the parent matrix is an
                         augmented one.
+            log_mode (str, optional): Either "snapshot", "delta", "ops" or "off".
+                        A "snapshot" log stores a full copy of the matrix for
+                        every step. A "delta" log only stores the row
+                        operation and the rows it touched, and rebuilds the
+                        snapshots on demand by replaying those rows on top
+                        of the starting matrix. An "ops" log only keeps the
+                        RowOperation records in self.row_ops, for callers
+                        that replay them on other matrices. An "off" log
+                        records nothing, for callers that only want the
+                        final matrix.
+                        Default is "snapshot".
         """
 
         # Reference to the parent Matrix.data
@@ -22,6 +95,15 @@ class MatrixActionLogger():
         # Reference to the parent Matrix.constant_matrix
         self.parent_constant_matrix = parent_constant_matrix
 
+        if log_mode not in self.LOG_MODES:
+            raise ValueError(f"Invalid log mode: {log_mode}")
+
+        self.log_mode = log_mode
+
+        # Checked first thing by every record method, so that recording
+        # costs next to nothing when logging is off.
+        self.enabled = log_mode != "off"
+
         # Tracks the row operations performed on the parent matrix.
         #
         # self.row_ops_content is a List with 3 elements:
@@ -37,57 +119,208 @@ class MatrixActionLogger():
         #
         # - self.row_ops_content[2]: A list containing deep copies of each
         #   state of self.parent_constant_matrix.
+        #
+        # self.row_ops_content is built from the attributes below when
+        # it is accessed.
+
+        # RowOperation records of every row operation performed, in order.
+        self.row_ops = []
+
+        # Used in "snapshot" mode, deep copies of each state of
+        # self.parent_matrix and self.parent_constant_matrix.
+        self._matrix_snapshots = []
+        self._constant_matrix_snapshots = []
+
+        # Used in "delta" mode.
+        #
+        # self.row_deltas is a list with one element per step, each being
+        # a dict that maps a row index to a tuple of (matrix row, constant
+        # matrix row) as they were right after the row operation took place.
+        # The very first step holds every row of the starting matrix.
+        self.row_deltas = []
 
-        self.row_ops_content = [[], [], []]
+        # Functions called with every row operation as it is recorded, see
+        # add_listener().
+        self.listeners = []
 
         # Initialize with the starting matrix.
-        self.update_row_ops_content(tuple(["Starting Matrix"]))
+        if self.enabled:
+            self.update_row_ops_content(range(len(self.parent_matrix)))
+
+    @property
+    def row_ops_content(self) -> list:
+        if not self.enabled:
+            return [[], [], []]
+
+        row_op_infos = [tuple(["Starting Matrix"])] + [row_op.to_tuple() for row_op in self.row_ops]
+
+        if self.log_mode == "ops":
+            # No state of the parent matrix was kept
+            return [row_op_infos, [], []]
+        elif self.log_mode == "snapshot":
+            return [row_op_infos, self._matrix_snapshots, self._constant_matrix_snapshots]
+
+        # Materialize the three list view by replaying every step
+        row_ops_content = [row_op_infos, [], []]
+        matrix = [None] * len(self.parent_matrix)
+        constant_matrix = [None] * len(self.parent_matrix)
+
+        for touched_rows in self.row_deltas:
+            matrix, constant_matrix = self._apply_row_delta(matrix, constant_matrix, touched_rows)
 
-    def update_row_ops_content(self, row_op_info: tuple) -> None:
-        """ Updates self.row_ops_content. """
+            row_ops_content[1].append(matrix)
+            row_ops_content[2].append(constant_matrix if self.parent_constant_matrix is not None else None)
 
-        self.row_ops_content[0].append(row_op_info)
-        self.row_ops_content[1].append(self.deepcopy_matrix_to_str(self.parent_matrix))
+        return row_ops_content
 
-        if self.parent_constant_matrix:
-            self.row_ops_content[2].append(self.deepcopy_matrix_to_str(self.parent_constant_matrix))
+    def snapshot(self, step: int) -> tuple:
+        """
+        Returns the (matrix, constant matrix) pair of str entries as it was
+        after the given step, with step 0 being the starting matrix.
+        """
+
+        if self.log_mode == "snapshot":
+            return self._matrix_snapshots[step], self._constant_matrix_snapshots[step]
+
+        matrix = [None] * len(self.parent_matrix)
+        constant_matrix = [None] * len(self.parent_matrix)
+
+        for touched_rows in self.row_deltas[:step + 1]:
+            matrix, constant_matrix = self._apply_row_delta(matrix, constant_matrix, touched_rows)
+
+        return matrix, constant_matrix if self.parent_constant_matrix is not None else None
+
+    def update_row_ops_content(self, touched_rows) -> None:
+        """ Records the current state of the parent matrix. """
+
+        if self.log_mode == "delta":
+            self.row_deltas.append(self._copy_rows_to_str(touched_rows))
+            return
+        elif self.log_mode == "ops":
+            return
+
+        self._matrix_snapshots.append(self.deepcopy_matrix_to_str(self.parent_matrix))
+
+        if self.parent_constant_matrix is not None:
+            self._constant_matrix_snapshots.append(self.deepcopy_matrix_to_str(self.parent_constant_matrix))
         else:
-            self.row_ops_content[2].append(None)
+            self._constant_matrix_snapshots.append(None)
 
     def deepcopy_matrix_to_str(self, matrix: list) -> list:
         """
         Returns a deep copy of matrix in which each entry is a str.
         """
 
-        matrix_cpy = deepcopy(matrix)
+        return [[str(entry) for entry in row] for row in matrix]
 
-        for i, row in enumerate(matrix_cpy):
-            for j, entry in enumerate(row):
-                matrix_cpy[i][j] = str(entry)
+    def _copy_rows_to_str(self, rows) -> dict:
+        """
+        Returns a dict of row index to a tuple of (matrix row, constant
+        matrix row) with each entry as a str.
+        """
 
-        return matrix_cpy
+        touched_rows = dict()
 
-    # Methods to be called from parent/container class
-    def record_elementary_row_op(self, *args) -> None:
-        # Get the name of function that called
-        # this method
-        caller_function = inspect.stack()[1].function
-
-        # Record all necessary information on the elementary row
-        # operation taking place in the parent class.
-        row_op_info = None
-
-        if caller_function == "swap_rows":
-            row_op_info = ("swap_rows", str(args[0] + 1), str(args[1] + 1))
-        elif caller_function == "multiply_row":
-           row_op_info = ("multiply_row", str(args[0] + 1), str(args[1]))
-        elif caller_function == "row_multiple_to_row":
-            row_op_info = ("row_multiple_to_row", str(args[0] + 1), str(args[1]), str(args[2] + 1))
+        for row in rows:
+            constant_row = None
+            if self.parent_constant_matrix is not None:
+                constant_row = [str(entry) for entry in self.parent_constant_matrix[row]]
+
+            touched_rows[row] = ([str(entry) for entry in self.parent_matrix[row]], constant_row)
+
+        return touched_rows
+
+    @staticmethod
+    def _apply_row_delta(matrix: list, constant_matrix: list, touched_rows: dict) -> tuple:
+        # Rows are never mutated once stored, so a shallow copy of the
+        # previous state is enough to build the next one.
+        matrix = matrix.copy()
+        constant_matrix = constant_matrix.copy()
+
+        for row, (matrix_row, constant_row) in touched_rows.items():
+            matrix[row] = matrix_row
+            constant_matrix[row] = constant_row
+
+        return matrix, constant_matrix
+
+    def add_listener(self, listener) -> None:
+        """
+        Calls listener(row_op, touched_rows) right after every row
+        operation is recorded, touched_rows being a dict of row index to
+        (matrix row, constant matrix row) of str entries as they were right
+        after it, so the steps can be sent on before elimination is done.
+        Listeners are called from the thread doing the row operations, and
+        never by an "off" log.
+        """
+
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        self.listeners.remove(listener)
+
+    def _notify(self, row_op: RowOperation, rows) -> None:
+        # Rows of a delta log are already copied to str by now
+        if self.log_mode == "delta":
+            touched_rows = self.row_deltas[-1]
         else:
-            # The caller function was not a row operation method
-            # logger.warning("Invalid method has called record_elementary_row_op()")
+            touched_rows = self._copy_rows_to_str(rows)
+
+        for listener in self.listeners:
+            listener(row_op, touched_rows)
+
+    # Methods to be called from parent/container class
+    def record_swap_rows(self, row_1: int, row_2: int) -> None:
+        if not self.enabled:
+            return
+
+        self._record(RowOperation("swap_rows", row_1, other_row=row_2))
+
+    def record_multiply_row(self, row: int, constant) -> None:
+        if not self.enabled:
+            return
+
+        self._record(RowOperation("multiply_row", row, scalar=constant))
+
+    def record_row_multiple_to_row(self, row_2: int, scalar, row_1: int) -> None:
+        if not self.enabled:
+            return
+
+        self._record(RowOperation("row_multiple_to_row", row_2, scalar=scalar, other_row=row_1))
+
+    def record_composite_row_op(self, name: str) -> None:
+        if not self.enabled:
+            return
+
+        self._record(RowOperation(name, None))
+
+    def record_replayed_row_op(self, row_op: RowOperation, touched_rows: dict) -> None:
+        """
+        Records row_op in a "delta" log with touched_rows, a dict of row
+        index to (matrix row, constant matrix row) of str entries as they
+        were right after it, for callers that worked the rows out without
+        doing the row operation on the parent matrix.
+        """
+
+        if not self.enabled:
             return
 
-        # A valid row operation method called this function
-        # so update self.row_ops_content
-        self.update_row_ops_content(row_op_info)
+        if self.log_mode != "delta":
+            raise ValueError("Replayed row operations can only be recorded in a delta log")
+
+        self.row_ops.append(row_op)
+        self.row_deltas.append(touched_rows)
+
+        if self.listeners:
+            self._notify(row_op, touched_rows)
+
+    def _record(self, row_op: RowOperation) -> None:
+        self.row_ops.append(row_op)
+
+        touched_rows = row_op.touched_rows
+        if touched_rows is None:
+            touched_rows = range(len(self.parent_matrix))
+
+        self.update_row_ops_content(touched_rows)
+
+        if self.listeners:
+            self._notify(row_op, touched_rows)
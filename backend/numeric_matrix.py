@@ -0,0 +1,290 @@
+from backend.matrix_action_logger import MatrixActionLogger
+from backend.solution import back_substitution
+
+import numpy as np
+
+
+class NumericMatrix():
+    def __init__(self, data: list, dimension: tuple, log_mode: str = "off"):
+        """
+        float64 counterpart of Matrix for large systems, where exact
+        Fractions are too slow. Entries are stored in a NumPy array and
+        elimination uses partial pivoting, so results are only as exact
+        as floating point arithmetic allows.
+
+        Args:
+            data (list): The list representation of a matrix, as anything
+                        float() accepts
+            dimension (tuple): Contains the m by n dimensions for a matrix
+                        in the form of (m, n)
+            log_mode (str, optional): How the action logger stores each
+                        step, see MatrixActionLogger. Default is "off",
+                        as the steps are rarely wanted for large systems.
+        """
+
+        self.data = np.array(data, dtype=np.float64).reshape(dimension)
+        self.m = dimension[0]
+        self.n = dimension[1]
+
+        # Set action logger
+        self.action_logger = MatrixActionLogger(self.data, log_mode=log_mode)
+
+        # Same as Matrix._pivot_point_locations
+        self._pivot_point_locations = dict()
+
+        # Same as Matrix._determinant_scale
+        self._determinant_scale = 1.0
+
+        # Same as Matrix.pivot_callback and Matrix.row_op_count
+        self.pivot_callback = None
+        self.row_op_count = 0
+
+    # Elementary Row Operations
+    def swap_rows(self, row_1, row_2):
+        """
+        Interchange two rows:
+        R_1 <-> R_2
+        """
+        self.data[[row_1, row_2]] = self.data[[row_2, row_1]]
+        self._determinant_scale = -self._determinant_scale
+        self.row_op_count += 1
+
+        # Log action
+        self.action_logger.record_swap_rows(row_1, row_2)
+
+    def multiply_row(self, row, constant):
+        """
+        Multiply a row by a nonzero constant c:
+        c * R_i
+        """
+        if constant == 0:
+            return
+
+        self.data[row] *= constant
+        self._determinant_scale *= constant
+        self.row_op_count += 1
+
+        # Log action
+        self.action_logger.record_multiply_row(row, constant)
+
+    def row_multiple_to_row(self, row_2, scalar, row_1):
+        """
+        Add a multiple of a row to another row:
+        R_2:= R_2 + (scalar)*R_1
+        """
+        self.data[row_2] += scalar * self.data[row_1]
+        self.row_op_count += 1
+
+        # Log action
+        self.action_logger.record_row_multiple_to_row(row_2, scalar, row_1)
+
+    # Elimination Byproducts
+    def rank(self) -> int:
+        """
+        Same as Matrix.rank(), with gaussian_elimination() run first if no
+        pivot points have been found yet.
+        """
+
+        if not self._pivot_point_locations:
+            self.gaussian_elimination()
+
+        return len(self._pivot_point_locations)
+
+    def nullity(self) -> int:
+        return self.n - self.rank()
+
+    def determinant(self) -> float:
+        """ Same as Matrix.determinant(), as a float. """
+
+        if self.m != self.n:
+            raise ValueError("Only square matrices have a determinant")
+
+        if not self._pivot_point_locations:
+            self.gaussian_elimination()
+
+        return float(np.prod(np.diagonal(self.data))) / self._determinant_scale
+
+    def inverse(self):
+        """
+        Same as Matrix.inverse(), as a NumPy array, with pivots within the
+        zero tolerance of the matrix treated as 0.
+        """
+
+        if self.m != self.n:
+            raise ValueError("Only square matrices have an inverse")
+
+        augmented_matrix = NumericAugmentedMatrix(self.data, np.eye(self.n), (self.n, 2 * self.n))
+        augmented_matrix.gaussian_elimination(gauss_jordan=True)
+
+        if augmented_matrix.rank() < self.n:
+            return None
+
+        return augmented_matrix.constant_matrix
+
+    # Helper Methods for Gaussian Elimination
+    def _zero_tolerance(self) -> float:
+        # Entries with an absolute value at or below this are treated
+        # as 0, scaled by the size and magnitude of the matrix
+        largest_entry = np.abs(self.data).max() if self.data.size else 0.0
+
+        return max(self.m, self.n) * np.finfo(np.float64).eps * max(largest_entry, 1.0)
+
+    def _eliminate_entries(self, pivot_point_location: tuple, first_row: int, last_row: int) -> None:
+        """
+        Turn all entries of the pivot column, from first_row up to but not
+        including last_row, into 0's using the normalized pivot point given
+        by pivot_point_location. The pivot row must not be within those rows.
+        """
+
+        pivot_row, pivot_column = pivot_point_location
+        scalars = -self.data[first_row:last_row, pivot_column]
+
+        if self.action_logger.enabled:
+            # Every row operation has to be logged on its own
+            for curr_row, scalar in enumerate(scalars, start=first_row):
+                if scalar != 0:
+                    self.row_multiple_to_row(curr_row, scalar, pivot_row)
+        else:
+            # All rows at once
+            self._add_outer_product(first_row, last_row, scalars, pivot_row)
+
+        # Clear rounding errors left in the pivot column
+        self.data[first_row:last_row, pivot_column] = 0.0
+
+    def _add_outer_product(self, first_row: int, last_row: int, scalars, pivot_row: int) -> None:
+        # R_i:= R_i + (scalars[i])*R_pivot_row, for every row in between
+        # first_row and last_row
+        self.data[first_row:last_row] += np.outer(scalars, self.data[pivot_row])
+        self.row_op_count += last_row - first_row
+
+    # Composite Method: Gaussian Elimination
+    def gaussian_elimination(self, gauss_jordan: bool = False) -> None:
+        """
+        Turn the matrix into REF using gaussian elimination with partial
+        pivoting, where the pivot of each column is the entry with the
+        largest absolute value at or below the current pivot row.
+
+        If gauss_jordan is set to True, then further operations will take
+        place, effectively turning the matrix into RREF.
+
+        Args:
+            gauss_jordan (bool, optional): Performs additional steps to get
+                matrix into RREF. Default value is False.
+        """
+
+        tolerance = self._zero_tolerance()
+        pivots_normalized = 0
+
+        for curr_column in range(self.n):
+            if pivots_normalized == self.m:
+                break
+
+            column = np.abs(self.data[pivots_normalized:, curr_column])
+            largest_entry_row = int(column.argmax())
+
+            if column[largest_entry_row] <= tolerance:
+                # There was no possible pivot point within this column
+                self.data[pivots_normalized:, curr_column] = 0.0
+                continue
+
+            largest_entry_row += pivots_normalized
+
+            if largest_entry_row != pivots_normalized:
+                self.swap_rows(pivots_normalized, largest_entry_row)
+
+            pivot = self.data[pivots_normalized, curr_column]
+            if pivot != 1:
+                self.multiply_row(pivots_normalized, 1 / pivot)
+
+            # Current pivot is normalized, so eliminate entries below it
+            self._eliminate_entries((pivots_normalized, curr_column), pivots_normalized + 1, self.m)
+
+            # Keep track of pivot point location
+            self._pivot_point_locations[pivots_normalized] = (pivots_normalized, curr_column)
+            pivots_normalized += 1
+
+            if self.pivot_callback is not None:
+                self.pivot_callback(pivots_normalized)
+
+        # End of gaussian elimination, matrix is now in REF. Partial
+        # pivoting leaves every zero row under the non-zero rows already.
+
+        # Perform additional steps for gauss-jordan elimination if desired
+        if gauss_jordan:
+            self.reduce_from_echelon()
+
+    def reduce_from_echelon(self) -> None:
+        """
+        Same as Matrix.reduce_from_echelon(), for a matrix turned into REF
+        by gaussian_elimination(), whose pivots are already normalized.
+        """
+
+        for key in reversed(sorted(self._pivot_point_locations.keys())):
+            self._eliminate_entries(self._pivot_point_locations[key], 0, key)
+
+            if self.pivot_callback is not None:
+                self.pivot_callback(len(self._pivot_point_locations))
+            # End of gauss-jordan elimination, matrix is now in RREF
+
+
+class NumericAugmentedMatrix(NumericMatrix):
+    def __init__(self, coefficient_matrix: list, constant_matrix: list, dimension: tuple, log_mode: str = "off"):
+        """
+        Args:
+            coefficient_matrix (list): The list representation of
+                        the coefficient matrix.
+            constant_matrix (list): The list representation of
+                        the m by k constant matrix, with each column
+                        being a separate right-hand side.
+            dimension (tuple): Contains the m by n dimensions for
+                        the whole augmented matrix (coefficient matrix +
+                        constant matrix in the form of (m, n).
+            log_mode (str, optional): How the action logger stores each
+                        step, see MatrixActionLogger. Default is "off".
+        """
+        constant_matrix = np.array(constant_matrix, dtype=np.float64).reshape((dimension[0], -1))
+
+        # Treat coefficient_matrix like NumericMatrix.data
+        super().__init__(coefficient_matrix, dimension=(dimension[0], dimension[1] - constant_matrix.shape[1]), log_mode="off")
+
+        self.constant_matrix = constant_matrix
+
+        self.action_logger = MatrixActionLogger(self.data, parent_constant_matrix=self.constant_matrix, log_mode=log_mode)
+
+    def swap_rows(self, row_1, row_2):
+        # Perform row operation constant matrix
+        self.constant_matrix[[row_1, row_2]] = self.constant_matrix[[row_2, row_1]]
+
+        super().swap_rows(row_1, row_2)
+
+    def multiply_row(self, row, constant):
+        # Perform row operation constant matrix
+        if constant != 0:
+            self.constant_matrix[row] *= constant
+
+        super().multiply_row(row, constant)
+
+    def row_multiple_to_row(self, row_2, scalar, row_1):
+        # Perform row operation constant matrix
+        self.constant_matrix[row_2] += scalar * self.constant_matrix[row_1]
+
+        super().row_multiple_to_row(row_2, scalar, row_1)
+
+    def _add_outer_product(self, first_row: int, last_row: int, scalars, pivot_row: int) -> None:
+        # Perform row operations on constant matrix
+        self.constant_matrix[first_row:last_row] += np.outer(scalars, self.constant_matrix[pivot_row])
+
+        super()._add_outer_product(first_row, last_row, scalars, pivot_row)
+
+    def solve(self) -> dict:
+        """
+        Same as AugmentedMatrix.solve(), with entries within the zero
+        tolerance of the matrix treated as 0.
+        """
+
+        if not self._pivot_point_locations:
+            self.gaussian_elimination()
+
+        pivot_point_locations = [self._pivot_point_locations[key] for key in sorted(self._pivot_point_locations)]
+
+        return back_substitution(self.data, self.constant_matrix, pivot_point_locations, self.n, tolerance=self._zero_tolerance())
@@ -0,0 +1,239 @@
+from collections import OrderedDict
+from fractions import Fraction
+from hashlib import sha256
+from threading import Lock
+
+import json
+import os
+import tempfile
+import time
+
+
+def canonical_key(coefficient_matrix: list, constant_matrix: list, method: str, engine: str,
+                  pivot_strategy: str = None) -> str:
+    """
+    Returns a hash of everything a /system-of-equations response depends
+    on. Entries are encoded as reduced Fractions, so "2", 2 and "4/2" give
+    the same key.
+    """
+
+    encoding = json.dumps([
+        method,
+        engine,
+        pivot_strategy,
+        [[str(Fraction(entry)) for entry in row] for row in coefficient_matrix],
+        [[str(Fraction(entry)) for entry in row] for row in constant_matrix],
+    ], separators=(",", ":"))
+
+    return sha256(encoding.encode()).hexdigest()
+
+
+class MemoryCacheBackend():
+    def __init__(self, max_bytes: int):
+        """
+        Least recently used store of bytes values kept in process.
+
+        Args:
+            max_bytes (int): Largest total size of the stored keys and
+                        values, the least recently used ones being evicted
+                        to make room.
+        """
+
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+
+        self._values = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: str):
+        with self._lock:
+            value = self._values.get(key)
+            if value is not None:
+                self._values.move_to_end(key)
+
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        size = len(key) + len(value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            self._delete(key)
+
+            self._values[key] = value
+            self.size_bytes += size
+
+            while self.size_bytes > self.max_bytes:
+                self._delete(next(iter(self._values)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self.size_bytes = 0
+
+    def _delete(self, key: str) -> None:
+        value = self._values.pop(key, None)
+        if value is not None:
+            self.size_bytes -= len(key) + len(value)
+
+
+class FileCacheBackend():
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Store of bytes values kept as one file per key in directory, so
+        that they are shared between processes and survive restarts. The
+        least recently used files, by modification time, are evicted once
+        the files take up more than max_bytes.
+
+        Args:
+            directory (str): Directory the files are kept in, created if
+                        it does not exist.
+            max_bytes (int): Largest total size of the files.
+        """
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries())
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def get(self, key: str):
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as file:
+                value = file.read()
+
+            # Mark as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        # Write to a temporary file first, so readers never see half a value
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(value)
+
+        os.replace(temporary_path, self._path(key))
+
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for entry in self._entries():
+            self.delete(entry.name[:-len(".cache")])
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.cache")
+
+    def _entries(self) -> list:
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith(".cache")]
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append((entry.stat().st_mtime, entry.stat().st_size, entry.name))
+            except FileNotFoundError:
+                # Evicted by another process
+                continue
+
+        size_bytes = sum(size for _, size, _ in entries)
+
+        for _, size, name in sorted(entries):
+            if size_bytes <= self.max_bytes:
+                break
+
+            self.delete(name[:-len(".cache")])
+            size_bytes -= size
+
+
+class ResultCache():
+    def __init__(self, backend, ttl: float = None):
+        """
+        Cache of JSON serializable results on top of a backend, either a
+        MemoryCacheBackend or FileCacheBackend, or anything else with the
+        same get(), set(), delete() and clear() methods, __len__ and a
+        size_bytes attribute.
+
+        Args:
+            backend: Where the results are stored, as bytes
+            ttl (float, optional): Seconds a result is kept for, forever
+                        if None. Default is None.
+        """
+
+        self.backend = backend
+        self.ttl = ttl
+
+        self._lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str):
+        """ Returns the result stored under key, or None. """
+
+        value = self.backend.get(key)
+
+        result = None
+        if value is not None:
+            expires, result = json.loads(value)
+
+            if expires is not None and expires <= time.time():
+                self.backend.delete(key)
+                result = None
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return result
+
+    def set(self, key: str, result) -> None:
+        expires = time.time() + self.ttl if self.ttl is not None else None
+
+        self.backend.set(key, json.dumps([expires, result], separators=(",", ":")).encode())
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+
+            return {
+                "entries": len(self.backend),
+                "bytes": self.backend.size_bytes,
+                "maxBytes": self.backend.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": self.hits / lookups if lookups else 0.0,
+            }
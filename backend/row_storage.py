@@ -0,0 +1,177 @@
+from fractions import Fraction
+from math import gcd, lcm
+
+
+class RationalRow():
+    __slots__ = ("numerators", "denominator", "_normalized")
+
+    def __init__(self, entries=()):
+        """
+        Row of a matrix stored as a list of integer numerators that share a
+        single positive denominator, instead of one Fraction per entry.
+
+        Row operations work on the integers directly, and the row is only
+        reduced by the gcd of its content once it is read again. Entries are
+        turned into Fractions only when they are read, such as when the row
+        is logged or serialized.
+
+        Args:
+            entries (iterable, optional): The entries of the row, as
+                        anything Fraction() accepts.
+        """
+
+        entries = [Fraction(entry) for entry in entries]
+        denominator = lcm(*(entry.denominator for entry in entries))
+
+        self.numerators = [entry.numerator * (denominator // entry.denominator) for entry in entries]
+        self.denominator = denominator
+        self._normalized = True
+
+    def normalize(self) -> None:
+        """ Divide the numerators and denominator by their gcd. """
+
+        if self._normalized:
+            return
+
+        divisor = gcd(self.denominator, *self.numerators)
+
+        if divisor > 1:
+            self.numerators = [numerator // divisor for numerator in self.numerators]
+            self.denominator //= divisor
+
+        self._normalized = True
+
+    # Row Operations
+    def scale(self, constant) -> None:
+        """ Multiply every entry by constant. """
+
+        constant = Fraction(constant)
+
+        self.numerators = [numerator * constant.numerator for numerator in self.numerators]
+        self.denominator *= constant.denominator
+        self._normalized = False
+
+    def add_multiple(self, other, scalar) -> None:
+        """ Add (scalar) * other to the row, other being a RationalRow. """
+
+        scalar = Fraction(scalar)
+
+        # Bring both rows over the smallest common denominator
+        other_denominator = other.denominator * scalar.denominator
+        denominator = lcm(self.denominator, other_denominator)
+
+        self_factor = denominator // self.denominator
+        other_factor = scalar.numerator * (denominator // other_denominator)
+
+        self.numerators = [
+            numerator * self_factor + other_factor * other_numerator
+            for numerator, other_numerator in zip(self.numerators, other.numerators)
+        ]
+        self.denominator = denominator
+        self._normalized = False
+
+    # Sequence protocol, entries are read back as Fractions
+    def __len__(self) -> int:
+        return len(self.numerators)
+
+    def __getitem__(self, index):
+        self.normalize()
+
+        if isinstance(index, slice):
+            return [Fraction(numerator, self.denominator) for numerator in self.numerators[index]]
+
+        return Fraction(self.numerators[index], self.denominator)
+
+    def __iter__(self):
+        self.normalize()
+
+        for numerator in self.numerators:
+            yield Fraction(numerator, self.denominator)
+
+    def __eq__(self, other) -> bool:
+        try:
+            return len(self) == len(other) and all(entry == other_entry for entry, other_entry in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RationalRow({[str(entry) for entry in self]})"
+
+
+class SparseRow():
+    __slots__ = ("entries", "length")
+
+    def __init__(self, entries=()):
+        """
+        Row of a matrix stored as a dict of column index to Fraction that
+        only holds the non-zero entries. Row operations only visit the
+        non-zero entries, so their cost does not depend on the number of
+        columns.
+
+        Args:
+            entries (iterable, optional): The entries of the row, as
+                        anything Fraction() accepts.
+        """
+
+        self.entries = dict()
+        self.length = 0
+
+        for column, entry in enumerate(entries):
+            entry = Fraction(entry)
+            if entry != 0:
+                self.entries[column] = entry
+
+            self.length += 1
+
+    @property
+    def num_nonzeros(self) -> int:
+        return len(self.entries)
+
+    # Row Operations
+    def scale(self, constant) -> None:
+        """ Multiply every entry by constant. """
+
+        for column in self.entries:
+            self.entries[column] *= constant
+
+    def add_multiple(self, other, scalar) -> None:
+        """ Add (scalar) * other to the row, other being a SparseRow. """
+
+        entries = self.entries
+
+        for column, other_entry in other.entries.items():
+            entry = entries.get(column, 0) + scalar * other_entry
+
+            if entry != 0:
+                entries[column] = entry
+            else:
+                # Cancelled out, drop it to keep the row sparse
+                entries.pop(column, None)
+
+    # Sequence protocol, zero entries are read back as Fraction(0)
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.entries.get(column, Fraction(0)) for column in range(*index.indices(self.length))]
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("SparseRow index out of range")
+
+        return self.entries.get(index, Fraction(0))
+
+    def __iter__(self):
+        for column in range(self.length):
+            yield self.entries.get(column, Fraction(0))
+
+    def __eq__(self, other) -> bool:
+        try:
+            return len(self) == len(other) and all(entry == other_entry for entry, other_entry in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SparseRow({[str(entry) for entry in self]})"
@@ -0,0 +1,306 @@
+from collections import OrderedDict
+from fractions import Fraction
+from threading import Lock
+import secrets
+import sys
+import time
+
+
+class EliminationSession():
+    def __init__(self, matrix, engine: str, structure: str, system_key: str, row_ops_content: list,
+                 pivot_strategy: str = "pedagogical"):
+        """
+        State of a system solved by one request, so that a later request
+        for its RREF only has to run the upward phase of gauss-jordan
+        elimination, and one for an edited copy of it only has to redo the
+        steps that depend on the edits, rather than starting from scratch.
+
+        Args:
+            matrix: The AugmentedMatrix in REF or RREF, along with its
+                        pivot point locations and its step log
+            engine (str): Engine the matrix was eliminated with, only the
+                        "step-logged" one keeping a step log worth reusing
+            structure (str): Structure of the coefficient matrix, as given
+                        by backend.structure.classify_structure()
+            system_key (str): canonical_key() of the system without a
+                        method, to make sure a later request is for the
+                        same system
+            row_ops_content (list): Row operations content of the matrix,
+                        as it was returned to the first request
+            pivot_strategy (str, optional): Pivot strategy the matrix was
+                        eliminated with, see Matrix.PIVOT_STRATEGIES.
+                        Default value is "pedagogical".
+        """
+
+        self.matrix = matrix
+        self.engine = engine
+        self.structure = structure
+        self.system_key = system_key
+        self.row_ops_content = row_ops_content
+        self.pivot_strategy = pivot_strategy
+
+        # Content of the RREF, once a request has asked for it
+        self.reduced_content = None
+        self._lock = Lock()
+
+    def approximate_nbytes(self) -> int:
+        """
+        Rough number of bytes taken by the session as it is, counting
+        every entry of the matrix and every distinct row of its row
+        operations content, whose snapshots share the rows that a step
+        left alone.
+        """
+
+        num_bytes = 0
+
+        for row in self.matrix.data:
+            num_bytes += sum(sys.getsizeof(entry) for entry in row)
+
+        seen_rows = set()
+        for matrices in self.row_ops_content[1:]:
+            for matrix in matrices:
+                for row in matrix:
+                    if id(row) in seen_rows:
+                        continue
+
+                    seen_rows.add(id(row))
+                    num_bytes += sys.getsizeof(row) + sum(sys.getsizeof(entry) for entry in row)
+
+        return num_bytes
+
+    def reduce(self, build_content) -> dict:
+        """
+        Turns the matrix into RREF the first time it is called, returning
+        build_content(session) from then on. Concurrent calls wait for
+        the first one, so the upward phase only ever runs once.
+        """
+
+        with self._lock:
+            if self.reduced_content is None:
+                self.matrix.reduce_from_echelon()
+                self.reduced_content = build_content(self)
+
+            return self.reduced_content
+
+    def resolve(self, matrix, changed_columns: set, gauss_jordan: bool = False) -> int:
+        """
+        Eliminates matrix, an edited copy of the system of the session,
+        reusing the steps of the session up to
+        the first pivot point at or after the leftmost edited column of the
+        coefficient matrix. The scalars of those steps only depend on the
+        columns of the pivots before it, so they do the same to every
+        unedited column, whose entries are taken from the step log of the
+        session. Only the edited columns and the constants are worked out
+        again. Elimination then goes on from that pivot point, which may
+        give a different pivot structure than the session had, picking
+        pivots with the same pivot strategy as the session.
+
+        The reused steps are the ones the session took, which a fresh
+        elimination of matrix may not have picked, but they are the same
+        row operations and give the same REF or RREF.
+
+        Args:
+            matrix (AugmentedMatrix): Starting matrix of the edited system,
+                        with the same dimensions as the session and a
+                        "delta" log
+            changed_columns (set): Columns of the coefficient matrix with
+                        an edited entry. Edited constants do not change
+                        any step.
+            gauss_jordan (bool, optional): Eliminate into RREF rather than
+                        REF. Default value is False.
+
+        Returns:
+            int: Number of steps reused, None if the session has no steps
+                        to reuse and matrix was left as is.
+        """
+
+        if self.structure not in (None, "general"):
+            return None
+
+        if self.matrix.action_logger.log_mode != "delta" or matrix.action_logger.log_mode != "delta":
+            return None
+
+        # Same early return as gaussian_elimination()
+        if (not gauss_jordan and matrix.is_echelon()) or (gauss_jordan and matrix.is_reduced_echelon()):
+            return None
+
+        with self._lock:
+            previous = self.matrix
+
+            first_changed_column = min(changed_columns, default=previous.n)
+            pivots_before = [
+                previous._pivot_point_locations[key] for key in sorted(previous._pivot_point_locations)
+                if previous._pivot_point_locations[key][1] < first_changed_column
+            ]
+
+            pivots_normalized = len(pivots_before)
+
+            # The session matrix was already in REF, or took a structured
+            # fast path, so there are no steps to line the pivots up with
+            if pivots_normalized not in previous._pivot_steps:
+                return None
+
+            steps_reused = previous._pivot_steps[pivots_normalized]
+            row_ops = previous.action_logger.row_ops[:steps_reused]
+
+            # Only the first step after the starting matrix onward
+            row_deltas = previous.action_logger.row_deltas[1:steps_reused + 1]
+            matrix_snapshot, _ = previous.action_logger.snapshot(steps_reused)
+
+            for key in range(pivots_normalized):
+                matrix._pivot_point_locations[key] = previous._pivot_point_locations[key]
+                matrix._pivot_steps[key] = previous._pivot_steps[key]
+
+        changed_columns = sorted(changed_columns)
+        num_changed_columns = len(changed_columns)
+
+        # Edited columns followed by the constants of every row, the only
+        # entries whose steps have to be worked out again
+        changed_entries = [
+            [matrix.data[row][column] for column in changed_columns] + list(matrix.constant_matrix[row])
+            for row in range(matrix.m)
+        ]
+
+        for row_op, touched_rows in zip(row_ops, row_deltas):
+            if row_op.name == "swap_rows":
+                changed_entries[row_op.row], changed_entries[row_op.other_row] = changed_entries[row_op.other_row], changed_entries[row_op.row]
+            elif row_op.name == "multiply_row":
+                changed_entries[row_op.row] = [entry * row_op.scalar for entry in changed_entries[row_op.row]]
+            else:
+                changed_entries[row_op.row] = [
+                    entry + row_op.scalar * other_entry
+                    for entry, other_entry in zip(changed_entries[row_op.row], changed_entries[row_op.other_row])
+                ]
+
+            # Rows of the session step, with the edited entries in place
+            replayed_rows = dict()
+            for row, (matrix_row, _) in touched_rows.items():
+                matrix_row = matrix_row.copy()
+                for column, entry in zip(changed_columns, changed_entries[row]):
+                    matrix_row[column] = str(entry)
+
+                replayed_rows[row] = (matrix_row, [str(entry) for entry in changed_entries[row][num_changed_columns:]])
+
+            matrix.action_logger.record_replayed_row_op(row_op, replayed_rows)
+
+        # Matrix as it is after the reused steps
+        for row in range(matrix.m):
+            matrix.data[row][:] = [Fraction(entry) for entry in matrix_snapshot[row]]
+            for column, entry in zip(changed_columns, changed_entries[row]):
+                matrix.data[row][column] = entry
+
+            matrix.constant_matrix[row][:] = changed_entries[row][num_changed_columns:]
+
+        curr_column = pivots_before[-1][1] + 1 if pivots_before else 0
+
+        normalize_pivot = getattr(matrix, matrix.PIVOT_STRATEGIES[self.pivot_strategy])
+
+        matrix._eliminate_below_pivots(pivots_normalized, curr_column, normalize_pivot)
+        matrix._finish_elimination(gauss_jordan=gauss_jordan)
+
+        return steps_reused
+
+
+class SessionStore():
+    def __init__(self, maxsize: int = 64, ttl: float = 600, max_bytes: int = None):
+        """
+        Least recently used store of EliminationSession objects under
+        random ids. Safe to share between threads.
+
+        Args:
+            maxsize (int, optional): Largest number of sessions kept, the
+                        least recently used one being evicted to make room.
+                        A maxsize of 0 turns sessions off. Default is 64.
+            ttl (float, optional): Seconds a session is kept after it was
+                        last used, forever if None. Default is 600.
+            max_bytes (int, optional): Largest total of
+                        EliminationSession.approximate_nbytes() kept, the
+                        least recently used sessions being evicted to make
+                        room, and larger sessions not being kept at all. No
+                        limit if None. Default is None.
+        """
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        # solve id -> (expiry time, session, approximate bytes)
+        self._sessions = OrderedDict()
+        self._lock = Lock()
+        self._num_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _expires(self) -> float:
+        return time.monotonic() + self.ttl if self.ttl is not None else None
+
+    def create(self, session: EliminationSession) -> str:
+        """
+        Stores session, returning its solve id, or None if sessions are off
+        or the session alone takes more than max_bytes.
+        """
+
+        if self.maxsize <= 0:
+            return None
+
+        num_bytes = session.approximate_nbytes() if self.max_bytes is not None else 0
+        if self.max_bytes is not None and num_bytes > self.max_bytes:
+            return None
+
+        solve_id = secrets.token_urlsafe(16)
+
+        with self._lock:
+            self._sessions[solve_id] = (self._expires(), session, num_bytes)
+            self._num_bytes += num_bytes
+
+            while len(self._sessions) > self.maxsize or (self.max_bytes is not None and self._num_bytes > self.max_bytes):
+                self._num_bytes -= self._sessions.popitem(last=False)[1][2]
+                self.evictions += 1
+
+        return solve_id
+
+    def get(self, solve_id: str) -> EliminationSession:
+        """ Returns the session stored under solve_id, or None if it has expired. """
+
+        with self._lock:
+            entry = self._sessions.get(solve_id)
+
+            if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+                del self._sessions[solve_id]
+                self._num_bytes -= entry[2]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+            # Using a session keeps it alive for another ttl seconds
+            self._sessions[solve_id] = (self._expires(), entry[1], entry[2])
+            self._sessions.move_to_end(solve_id)
+
+            return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._num_bytes = 0
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._sessions),
+                "maxsize": self.maxsize,
+                "bytes": self._num_bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,80 @@
+from threading import Event, Lock
+
+
+class _Call():
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+        # Number of callers waiting on the result besides the one running it
+        self.waiters = 0
+
+
+class SingleFlight():
+    def __init__(self):
+        """
+        Coalesces concurrent calls made with the same key, so that only the
+        first one runs and every other one waits for, and shares, its
+        result. Calls are only coalesced between threads of one process.
+        """
+
+        self._calls = dict()
+        self._lock = Lock()
+
+        # Calls that ran, and calls that shared the result of another
+        self.executions = 0
+        self.deduplicated = 0
+
+    def do(self, key, function):
+        """
+        Returns function(), unless a call with the same key is already in
+        flight, in which case its result is returned once it is done. An
+        exception raised by function() is raised for every caller.
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                is_leader = True
+            else:
+                call.waiters += 1
+                self.deduplicated += 1
+                is_leader = False
+
+        if not is_leader:
+            call.done.wait()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+                self.executions += 1
+
+            call.done.set()
+
+        return call.result
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "deduplicated": self.deduplicated,
+                "inFlight": len(self._calls),
+                "waiting": sum(call.waiters for call in self._calls.values()),
+            }
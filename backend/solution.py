@@ -0,0 +1,102 @@
+from fractions import Fraction
+
+
+def back_substitution(rows, constant_rows, pivot_point_locations: list, n: int, tolerance: float = None) -> dict:
+    """
+    Solves a system of equations already in REF, or RREF, by back
+    substitution, without eliminating the entries above each pivot.
+    Every pivot row is visited once per unknown to its right, so each
+    constant column takes O(n^2) steps.
+
+    Args:
+        rows: The coefficient matrix in REF, as a list of rows or a NumPy
+                    array. Pivots do not have to be 1.
+        constant_rows: The m by k constant matrix, with each column being a
+                    separate right-hand side.
+        pivot_point_locations (list): (row, column) of every pivot point,
+                    top to bottom.
+        n (int): Number of columns of the coefficient matrix
+        tolerance (float, optional): Entries with an absolute value at or
+                    below this are treated as 0, for floating point
+                    matrices. Solved exactly with Fractions if None.
+                    Default is None.
+
+    Returns:
+        dict: With the keys:
+            - "freeVariables": Columns without a pivot, 0-indexed.
+            - "nullspace": A basis of the null space of the coefficient
+              matrix, one vector for each free variable, that every
+              solution can be shifted by.
+            - "solutions": One dict for each constant column, with
+              "consistent" being False if the system has no solution,
+              and "particular" being the solution with every free variable
+              set to 0, None if inconsistent.
+    """
+
+    if tolerance is None:
+        def is_zero(entry):
+            return entry == 0
+
+        def to_number(entry):
+            return Fraction(entry)
+    else:
+        def is_zero(entry):
+            return abs(entry) <= tolerance
+
+        def to_number(entry):
+            return float(entry)
+
+    pivot_columns = {column for _, column in pivot_point_locations}
+    free_variables = [column for column in range(n) if column not in pivot_columns]
+
+    # Non-zero entries to the right of each pivot, looked up once for every
+    # constant column and null space vector
+    pivot_rows = []
+    for pivot_row, pivot_column in pivot_point_locations:
+        row = rows[pivot_row]
+        right_entries = [
+            (column, to_number(row[column])) for column in range(pivot_column + 1, n)
+            if not is_zero(row[column])
+        ]
+
+        pivot_rows.append((pivot_row, pivot_column, to_number(row[pivot_column]), right_entries))
+
+    def substitute(values: list, constants: list) -> list:
+        # Fill in the pivot variables of values from the bottom up
+        for (pivot_row, pivot_column, pivot, right_entries), constant in zip(reversed(pivot_rows), reversed(constants)):
+            value = constant
+            for column, entry in right_entries:
+                if not is_zero(values[column]):
+                    value -= entry * values[column]
+
+            values[pivot_column] = value / pivot
+
+        return values
+
+    zero = to_number(0)
+
+    nullspace = []
+    for free_variable in free_variables:
+        values = [zero] * n
+        values[free_variable] = to_number(1)
+        nullspace.append(substitute(values, [zero] * len(pivot_rows)))
+
+    num_constant_columns = len(constant_rows[0]) if len(constant_rows) else 0
+    rank = len(pivot_point_locations)
+
+    solutions = []
+    for constant_column in range(num_constant_columns):
+        # Any zero row with a non-zero constant makes the system inconsistent
+        consistent = all(
+            is_zero(constant_rows[curr_row][constant_column])
+            for curr_row in range(len(constant_rows)) if curr_row >= rank
+        )
+
+        particular = None
+        if consistent:
+            constants = [to_number(constant_rows[pivot_row][constant_column]) for pivot_row, _ in pivot_point_locations]
+            particular = substitute([zero] * n, constants)
+
+        solutions.append({"consistent": consistent, "particular": particular})
+
+    return {"freeVariables": free_variables, "nullspace": nullspace, "solutions": solutions}
@@ -0,0 +1,204 @@
+from collections import OrderedDict
+from threading import Lock
+import json
+import secrets
+
+
+class StepLog():
+    def __init__(self, row_deltas: dict, checkpoint_interval: int = 32):
+        """
+        Steps of a solve kept as the rows every step changed, along with a
+        copy of the whole matrix every checkpoint_interval steps, so that
+        any step is rebuilt by replaying at most checkpoint_interval - 1
+        steps on top of the checkpoint before it.
+
+        Args:
+            row_deltas (dict): Row operations content encoded by
+                        backend.streaming.encode_row_deltas()
+            checkpoint_interval (int, optional): Number of steps between
+                        checkpoints. Default is 32.
+        """
+
+        if checkpoint_interval < 1:
+            raise ValueError(f"Invalid checkpoint interval: {checkpoint_interval}")
+
+        self.row_deltas = row_deltas
+        self.checkpoint_interval = checkpoint_interval
+
+        # Starting matrix, followed by one entry per step
+        self.row_op_infos = [["Starting Matrix"]] + [step["rowOp"] for step in row_deltas["steps"]]
+        self.num_steps = len(self.row_op_infos)
+
+        # (matrix, constant matrix) after every checkpoint_interval-th step.
+        # Rows are never mutated once stored, so the checkpoints share them.
+        matrix, constant_matrix = row_deltas["matrix"], row_deltas["constMatrix"]
+        self._checkpoints = [(matrix, constant_matrix)]
+
+        for step in range(1, self.num_steps):
+            matrix, constant_matrix = self._apply_step(matrix, constant_matrix, step)
+
+            if step % checkpoint_interval == 0:
+                self._checkpoints.append((matrix, constant_matrix))
+
+    def _apply_step(self, matrix: list, constant_matrix: list, step: int) -> tuple:
+        matrix = matrix.copy()
+        constant_matrix = constant_matrix.copy()
+
+        for row, matrix_row, constant_row in self.row_deltas["steps"][step - 1]["rows"]:
+            matrix[row] = matrix_row
+            constant_matrix[row] = constant_row
+
+        return matrix, constant_matrix
+
+    def steps(self, start: int, stop: int) -> list:
+        """
+        Returns steps start up to, but not including, stop in the same
+        three list form as MatrixActionLogger.row_ops_content.
+        """
+
+        if not 0 <= start <= stop <= self.num_steps:
+            raise ValueError(f"Invalid steps: {start} to {stop}")
+
+        row_ops_content = [self.row_op_infos[start:stop], [], []]
+
+        # Replay from the last checkpoint at or before start
+        step = start - start % self.checkpoint_interval
+        matrix, constant_matrix = self._checkpoints[step // self.checkpoint_interval]
+
+        while step < stop:
+            if step >= start:
+                row_ops_content[1].append(matrix)
+                row_ops_content[2].append(constant_matrix)
+
+            step += 1
+            if step < stop:
+                matrix, constant_matrix = self._apply_step(matrix, constant_matrix, step)
+
+        return row_ops_content
+
+    def to_bytes(self) -> bytes:
+        # Checkpoints are rebuilt on load rather than written out
+        return json.dumps(
+            {"checkpointInterval": self.checkpoint_interval, "rowDeltas": self.row_deltas},
+            separators=(",", ":")
+        ).encode()
+
+    @classmethod
+    def from_bytes(cls, value: bytes):
+        value = json.loads(value)
+
+        return cls(value["rowDeltas"], checkpoint_interval=value["checkpointInterval"])
+
+
+class StepLogStore():
+    def __init__(self, maxsize: int = 32, spill_backend=None):
+        """
+        Least recently used store of StepLog objects under solve ids. Step
+        logs evicted from memory are written to spill_backend, and read
+        back from it once asked for again. Safe to share between threads.
+
+        Args:
+            maxsize (int, optional): Largest number of step logs kept in
+                        memory. A maxsize of 0 turns the store off.
+                        Default is 32.
+            spill_backend (optional): MemoryCacheBackend or
+                        FileCacheBackend, see backend.result_cache, that
+                        evicted step logs are written to, bounding their
+                        size on its own. Evicted step logs are dropped if
+                        None. Default is None.
+        """
+
+        self.maxsize = maxsize
+        self.spill_backend = spill_backend
+
+        # solve id -> StepLog
+        self._step_logs = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        self.spills = 0
+
+    def __len__(self) -> int:
+        return len(self._step_logs)
+
+    def create(self, step_log: StepLog, solve_id: str = None) -> str:
+        """
+        Stores step_log under solve_id, or a new random id if None,
+        returning the id, or None if the store is off.
+        """
+
+        if self.maxsize <= 0:
+            return None
+
+        if solve_id is None:
+            solve_id = secrets.token_urlsafe(16)
+
+        self._put(solve_id, step_log)
+
+        return solve_id
+
+    def get(self, solve_id: str) -> StepLog:
+        """ Returns the step log stored under solve_id, or None if there is none. """
+
+        with self._lock:
+            step_log = self._step_logs.get(solve_id)
+
+            if step_log is not None:
+                self.hits += 1
+                self._step_logs.move_to_end(solve_id)
+
+                return step_log
+
+        value = self.spill_backend.get(solve_id) if self.spill_backend is not None else None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+
+            self.spill_hits += 1
+
+        step_log = StepLog.from_bytes(value)
+        self._put(solve_id, step_log)
+
+        return step_log
+
+    def _put(self, solve_id: str, step_log: StepLog) -> None:
+        evicted = []
+
+        with self._lock:
+            self._step_logs[solve_id] = step_log
+            self._step_logs.move_to_end(solve_id)
+
+            while len(self._step_logs) > self.maxsize:
+                evicted.append(self._step_logs.popitem(last=False))
+
+        # Written outside of the lock, so readers of other step logs never
+        # wait on the disk
+        if self.spill_backend is not None:
+            for evicted_id, evicted_step_log in evicted:
+                self.spill_backend.set(evicted_id, evicted_step_log.to_bytes())
+
+                with self._lock:
+                    self.spills += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._step_logs.clear()
+
+        if self.spill_backend is not None:
+            self.spill_backend.clear()
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._step_logs),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "spillHits": self.spill_hits,
+                "misses": self.misses,
+                "spills": self.spills,
+            }
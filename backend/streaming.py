@@ -0,0 +1,142 @@
+from queue import Queue
+from threading import Thread
+import json
+
+
+# Supported ways of streaming the steps of a solve, mapped to their mimetype
+STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+# Supported ways of sending the steps of a solve in a single response, the
+# "full" rowOperationsContent, the "row-deltas" of encode_row_deltas(), or
+# a "paged" summary with the rest of the steps fetched page by page
+CONTENT_FORMATS = ("full", "row-deltas", "paged")
+
+
+def encode_event(event: dict, stream_format: str) -> str:
+    """
+    Encodes event as one line of JSON for an "ndjson" stream, or as a
+    server-sent event named after its "type" for an "sse" stream.
+    """
+
+    data = json.dumps(event, separators=(",", ":"))
+
+    if stream_format == "sse":
+        return f"event: {event['type']}\ndata: {data}\n\n"
+
+    return data + "\n"
+
+
+def step_event(row_op_info, touched_rows: dict) -> dict:
+    """
+    Event of a single step, with row_op_info being its row operation as
+    in MatrixActionLogger.row_ops_content, and touched_rows a dict of row
+    index to (matrix row, constant matrix row) of the rows it changed.
+    The rows are sent as [row index, matrix row, constant matrix row].
+    """
+
+    return {
+        "type": "step",
+        "rowOp": list(row_op_info),
+        "rows": [[row, matrix_row, constant_row] for row, (matrix_row, constant_row) in touched_rows.items()]
+    }
+
+
+def content_step_events(row_ops_content: list, first_step: int = 1):
+    """
+    Yields the step events of every step of row_ops_content from
+    first_step onward, each with the rows that differ from the step
+    before it.
+    """
+
+    row_op_infos, matrices, constant_matrices = row_ops_content
+
+    for step in range(first_step, len(row_op_infos)):
+        previous_matrix, matrix = matrices[step - 1], matrices[step]
+        previous_constant_matrix, constant_matrix = constant_matrices[step - 1], constant_matrices[step]
+
+        touched_rows = {
+            row: (matrix[row], constant_matrix[row]) for row in range(len(matrix))
+            if matrix[row] != previous_matrix[row] or constant_matrix[row] != previous_constant_matrix[row]
+        }
+
+        yield step_event(row_op_infos[step], touched_rows)
+
+
+def encode_row_deltas(row_ops_content: list) -> dict:
+    """
+    Encodes row_ops_content as its starting "matrix" and "constMatrix",
+    followed by the "steps", each being a step event without its "type",
+    so that every unchanged row is only sent once rather than once per
+    step.
+    """
+
+    steps = []
+    for event in content_step_events(row_ops_content):
+        del event["type"]
+        steps.append(event)
+
+    return {"matrix": row_ops_content[1][0], "constMatrix": row_ops_content[2][0], "steps": steps}
+
+
+def stream_events(solve, starting_matrix: list, starting_constant_matrix: list, build_response):
+    """
+    Runs solve(listener) in a thread of its own, yielding the events of the
+    solve as they come:
+
+    - "start": The starting "matrix" and "constMatrix".
+    - "step": One for every step, see step_event(), with the rows it
+      changed on top of those of the step before.
+    - "result": build_response(solved content) without its
+      "rowOperationsContent", which the steps already make up.
+    - "error": In place of "result" if solve raised, with a "description".
+
+    solve is expected to add listener to the MatrixActionLogger of the
+    matrix it eliminates, see MatrixActionLogger.add_listener(), and to
+    return content as given by solve_system(). Steps that did not go
+    through the listener, such as those of a cached result or of an
+    engine without a step log, are yielded from that content once solve
+    is done.
+    """
+
+    events = Queue()
+
+    def listener(row_op, touched_rows):
+        events.put(step_event(row_op.to_tuple(), touched_rows))
+
+    def run():
+        try:
+            events.put(("result", solve(listener)))
+        except Exception as error:
+            events.put(("error", error))
+
+    # Daemon thread, so that a solve left behind by a closed connection
+    # never holds up shutdown. Its result is still cached.
+    Thread(target=run, daemon=True).start()
+
+    yield {"type": "start", "matrix": starting_matrix, "constMatrix": starting_constant_matrix}
+
+    num_steps = 0
+    while True:
+        event = events.get()
+
+        if isinstance(event, tuple):
+            break
+
+        num_steps += 1
+        yield event
+
+    kind, value = event
+
+    if kind == "error":
+        yield {"type": "error", "description": getattr(value, "description", "Could not solve matrix")}
+        return
+
+    yield from content_step_events(value["rowOperationsContent"], first_step=num_steps + 1)
+
+    response_content = build_response(value)
+    del response_content["rowOperationsContent"]
+
+    yield {"type": "result", **response_content}
@@ -0,0 +1,103 @@
+from backend.row_storage import SparseRow
+
+
+# Structures of a coefficient matrix that have a faster path than general
+# gaussian elimination, see Matrix.gaussian_elimination:
+#
+# - "diagonal": Square, with only non-zero entries on its diagonal.
+# - "permuted_identity": Square, with exactly one non-zero entry in every
+#   row and column, so an identity matrix once its rows are swapped and
+#   scaled.
+# - "upper_triangular": Square, with a non-zero diagonal and only zeros
+#   below it.
+# - "lower_triangular": Square, with a non-zero diagonal and only zeros
+#   above it.
+# - "banded": Square, with a non-zero diagonal and every other non-zero
+#   entry close to the diagonal, see BANDED_MAX_WIDTH_RATIO.
+# - "general": Anything else.
+STRUCTURES = ("diagonal", "permuted_identity", "upper_triangular", "lower_triangular", "banded", "general")
+
+# A matrix is only "banded" if its band, the diagonal plus the number of
+# diagonals with non-zero entries below and above it, is at most this
+# fraction of its number of columns.
+BANDED_MAX_WIDTH_RATIO = 0.25
+
+
+def _nonzero_columns(row) -> list:
+    # Column indices of the non-zero entries of a row, in order
+    if isinstance(row, SparseRow):
+        return sorted(row.entries)
+
+    return [column for column, entry in enumerate(row) if entry != 0]
+
+
+def bandwidths(data: list) -> tuple:
+    """
+    Returns (lower bandwidth, upper bandwidth) of a matrix, being the
+    number of diagonals below and above the main diagonal holding non-zero
+    entries.
+    """
+
+    lower_bandwidth = 0
+    upper_bandwidth = 0
+
+    for curr_row, row in enumerate(data):
+        columns = _nonzero_columns(row)
+
+        if columns:
+            lower_bandwidth = max(lower_bandwidth, curr_row - columns[0])
+            upper_bandwidth = max(upper_bandwidth, columns[-1] - curr_row)
+
+    return lower_bandwidth, upper_bandwidth
+
+
+def classify_structure(data: list, m: int, n: int) -> str:
+    """
+    Returns which of STRUCTURES the m by n matrix data has, checking the
+    more specific ones first. Every entry is looked at once.
+    """
+
+    if m != n or m == 0:
+        return "general"
+
+    lower_bandwidth = 0
+    upper_bandwidth = 0
+    nonzero_diagonal = True
+
+    # Only used for permuted identity matrices
+    single_entry_columns = set()
+    single_entry_rows = True
+
+    for curr_row, row in enumerate(data):
+        columns = _nonzero_columns(row)
+
+        # Zero rows can not be part of any of the structures
+        if not columns:
+            return "general"
+
+        lower_bandwidth = max(lower_bandwidth, curr_row - columns[0])
+        upper_bandwidth = max(upper_bandwidth, columns[-1] - curr_row)
+
+        if row[curr_row] == 0:
+            nonzero_diagonal = False
+
+        if len(columns) == 1:
+            single_entry_columns.add(columns[0])
+        else:
+            single_entry_rows = False
+
+    if lower_bandwidth == 0 and upper_bandwidth == 0:
+        # No zero rows, so every diagonal entry is non-zero
+        return "diagonal"
+    elif single_entry_rows and len(single_entry_columns) == n:
+        return "permuted_identity"
+    elif not nonzero_diagonal:
+        return "general"
+    elif lower_bandwidth == 0:
+        return "upper_triangular"
+    elif upper_bandwidth == 0:
+        return "lower_triangular"
+    elif lower_bandwidth + upper_bandwidth + 1 <= BANDED_MAX_WIDTH_RATIO * n:
+        return "banded"
+
+    return "general"
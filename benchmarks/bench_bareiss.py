@@ -0,0 +1,61 @@
+"""
+Compares Matrix.bareiss_elimination against Matrix.gaussian_elimination
+on random integer systems, both with logging off.
+
+Usage:
+    python -m benchmarks.bench_bareiss [max seconds for gaussian_elimination]
+"""
+from backend.matrix import AugmentedMatrix
+
+import random
+import sys
+import time
+
+
+# Number of unknowns of the square systems to benchmark
+SIZES = [10, 25, 50, 100, 200]
+
+
+def random_system(n: int, seed: int = 52) -> tuple:
+    rng = random.Random(seed)
+
+    coefficient_matrix = [[rng.randint(-9, 9) for _ in range(n)] for _ in range(n)]
+    constant_matrix = [[rng.randint(-9, 9)] for _ in range(n)]
+
+    return coefficient_matrix, constant_matrix
+
+
+def bench(n: int, engine: str) -> tuple:
+    coefficient_matrix, constant_matrix = random_system(n)
+    augmented_matrix = AugmentedMatrix(coefficient_matrix, constant_matrix, dimension=(n, n + 1), log_mode="off")
+
+    start = time.perf_counter()
+    getattr(augmented_matrix, engine)(gauss_jordan=True)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, augmented_matrix.constant_matrix
+
+
+def main() -> None:
+    # gaussian_elimination is skipped for the remaining sizes once
+    # it takes longer than this
+    max_seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 60
+
+    for n in SIZES:
+        bareiss_elapsed, bareiss_result = bench(n, "bareiss_elimination")
+
+        if max_seconds is None:
+            print(f"{n}x{n} bareiss={bareiss_elapsed:.3f}s gaussian=skipped")
+            continue
+
+        gaussian_elapsed, gaussian_result = bench(n, "gaussian_elimination")
+
+        print(f"{n}x{n} bareiss={bareiss_elapsed:.3f}s gaussian={gaussian_elapsed:.3f}s "
+              f"speedup={gaussian_elapsed / bareiss_elapsed:.1f}x identical={bareiss_result == gaussian_result}")
+
+        if gaussian_elapsed > max_seconds:
+            max_seconds = None
+
+
+if __name__ == "__main__":
+    main()
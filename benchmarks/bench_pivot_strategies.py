@@ -0,0 +1,65 @@
+"""
+Compares the pivot strategies of Matrix.gaussian_elimination on random
+dense integer, dense rational and sparse integer systems.
+
+Reports the time taken, the number of row operations, and the largest and
+total bits taken by the numerators and denominators of the resulting
+entries, as a measure of coefficient growth.
+
+Usage:
+    python -m benchmarks.bench_pivot_strategies
+"""
+from backend.matrix import Matrix
+
+from fractions import Fraction
+import random
+import time
+
+
+# Number of unknowns of the square systems to benchmark
+SIZES = [10, 30, 60]
+
+KINDS = ["integer", "rational", "sparse"]
+
+
+def random_matrix(n: int, kind: str, seed: int = 52) -> list:
+    rng = random.Random(seed)
+
+    if kind == "integer":
+        return [[rng.randint(-99, 99) for _ in range(n)] for _ in range(n)]
+    elif kind == "rational":
+        return [[Fraction(rng.randint(-99, 99), rng.randint(1, 99)) for _ in range(n)] for _ in range(n)]
+
+    # Roughly three non-zero entries per row, with a non-zero diagonal
+    # so the system is likely to have full rank
+    return [
+        [rng.randint(-9, 9) or 1 if row == column or rng.random() < 3 / n else 0 for column in range(n)]
+        for row in range(n)
+    ]
+
+
+def bench(n: int, kind: str, pivot_strategy: str) -> tuple:
+    # An "ops" log only keeps the row operations, to count them
+    matrix = Matrix(random_matrix(n, kind), (n, n), log_mode="ops")
+
+    start = time.perf_counter()
+    matrix.gaussian_elimination(pivot_strategy=pivot_strategy)
+    elapsed = time.perf_counter() - start
+
+    total_bit_length = sum(Matrix._entry_bit_length(entry) for row in matrix.data for entry in row)
+
+    return elapsed, len(matrix.action_logger.row_ops), matrix.max_entry_bit_length(), total_bit_length
+
+
+def main() -> None:
+    for kind in KINDS:
+        for n in SIZES:
+            for pivot_strategy in Matrix.PIVOT_STRATEGIES:
+                elapsed, num_row_ops, max_bit_length, total_bit_length = bench(n, kind, pivot_strategy)
+
+                print(f"{kind:<8} {n}x{n} pivot_strategy={pivot_strategy:<17} time={elapsed:.3f}s "
+                      f"row ops={num_row_ops} max bits={max_bit_length} total bits={total_bit_length}")
+
+
+if __name__ == "__main__":
+    main()
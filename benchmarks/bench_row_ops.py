@@ -0,0 +1,79 @@
+"""
+Measures the average cost of a single row operation, including the cost
+of recording it, on 10x10 and 100x100 systems for every log mode.
+
+Usage:
+    python -m benchmarks.bench_row_ops
+"""
+from backend.matrix import AugmentedMatrix
+
+from fractions import Fraction
+import random
+import time
+
+
+# Dimensions (m, number of unknowns) of the systems to benchmark
+SIZES = [(10, 10), (100, 100)]
+
+# Log modes to benchmark
+LOG_MODES = ["snapshot", "delta", "off"]
+
+# Number of row operations timed per system
+NUM_ROW_OPS = 2000
+
+
+def random_system(m: int, n: int, rng: random.Random) -> tuple:
+    coefficient_matrix = [[Fraction(rng.randint(-9, 9)) for _ in range(n)] for _ in range(m)]
+    constant_matrix = [[Fraction(rng.randint(-9, 9))] for _ in range(m)]
+
+    return coefficient_matrix, constant_matrix
+
+
+def random_row_ops(m: int, rng: random.Random) -> list:
+    # Scalars of -1 and 1 keep the entries small, so the timings
+    # are not dominated by Fraction arithmetic.
+    row_ops = []
+
+    for _ in range(NUM_ROW_OPS):
+        row_1, row_2 = rng.sample(range(m), 2)
+        row_op = rng.choice(["swap_rows", "multiply_row", "row_multiple_to_row"])
+
+        if row_op == "swap_rows":
+            row_ops.append((row_op, (row_1, row_2)))
+        elif row_op == "multiply_row":
+            row_ops.append((row_op, (row_1, -1)))
+        else:
+            row_ops.append((row_op, (row_1, rng.choice([-1, 1]), row_2)))
+
+    return row_ops
+
+
+def bench(m: int, n: int, log_mode: str) -> float:
+    rng = random.Random(52)
+    coefficient_matrix, constant_matrix = random_system(m, n, rng)
+    row_ops = random_row_ops(m, rng)
+
+    augmented_matrix = AugmentedMatrix(coefficient_matrix, constant_matrix, dimension=(m, n + 1), log_mode=log_mode)
+
+    start = time.perf_counter()
+    for row_op, args in row_ops:
+        getattr(augmented_matrix, row_op)(*args)
+    elapsed = time.perf_counter() - start
+
+    return elapsed / len(row_ops)
+
+
+def main() -> None:
+    for m, n in SIZES:
+        for log_mode in LOG_MODES:
+            try:
+                per_row_op = bench(m, n, log_mode)
+            except ValueError:
+                # Log mode is not supported
+                continue
+
+            print(f"{m}x{n} log_mode={log_mode:<8} per row op={per_row_op * 1e6:.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares the "list" and "common_denominator" row storages of Matrix on
+random integer systems, with logging off.
+
+Reports the time taken by gaussian_elimination, the peak memory traced
+while it runs, and the memory taken per entry by the resulting rows.
+
+Usage:
+    python -m benchmarks.bench_row_storage
+"""
+from backend.matrix import Matrix
+from backend.row_storage import RationalRow
+
+import random
+import sys
+import time
+import tracemalloc
+
+
+# Number of unknowns of the square systems to benchmark
+SIZES = [10, 30, 60]
+
+ROW_STORAGES = ["list", "common_denominator"]
+
+
+def random_matrix(n: int, seed: int = 52) -> list:
+    rng = random.Random(seed)
+
+    return [[rng.randint(-9, 9) for _ in range(n)] for _ in range(n)]
+
+
+def row_size(row) -> int:
+    # Size of the row object and every object it holds on to
+    if isinstance(row, RationalRow):
+        return (
+            sys.getsizeof(row) + sys.getsizeof(row.numerators) + sys.getsizeof(row.denominator) +
+            sum(sys.getsizeof(numerator) for numerator in row.numerators)
+        )
+
+    return sys.getsizeof(row) + sum(
+        sys.getsizeof(entry) + sys.getsizeof(entry.numerator) + sys.getsizeof(entry.denominator)
+        for entry in row
+    )
+
+
+def bench(n: int, row_storage: str) -> tuple:
+    matrix = Matrix(random_matrix(n), (n, n), log_mode="off", row_storage=row_storage)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    matrix.gaussian_elimination()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bytes_per_entry = sum(row_size(row) for row in matrix.data) / (n * n)
+
+    return elapsed, peak, bytes_per_entry
+
+
+def main() -> None:
+    for n in SIZES:
+        for row_storage in ROW_STORAGES:
+            elapsed, peak, bytes_per_entry = bench(n, row_storage)
+
+            print(f"{n}x{n} row_storage={row_storage:<18} time={elapsed:.3f}s "
+                  f"peak={peak / 1024:.0f}KiB bytes per entry={bytes_per_entry:.0f}")
+
+
+if __name__ == "__main__":
+    main()
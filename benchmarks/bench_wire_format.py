@@ -0,0 +1,97 @@
+"""
+Compares the size of the "full" and "row-deltas" content formats of
+/system-of-equations responses, see backend.streaming.encode_row_deltas(),
+on some systems of tests/unit/test_matrix.py and on random square systems,
+solved with a "delta" log. The entries of large dense systems grow too
+much for a step log to be worth sending, so the largest ones are sparse.
+
+Reports the number of steps and the JSON payload of the row operations
+content in each format, before and after gzip.
+
+Usage:
+    python -m benchmarks.bench_wire_format
+"""
+from backend.matrix import AugmentedMatrix
+from backend.streaming import encode_row_deltas
+
+from copy import deepcopy
+import gzip
+import json
+import random
+
+
+# Number of unknowns of the random square systems to benchmark, dense and
+# sparse ones
+DENSE_SIZES = [10, 30]
+SPARSE_SIZES = [30, 100]
+
+# Systems of tests/unit/test_matrix.py, as (coefficient matrix, constant matrix)
+TEST_SYSTEMS = {
+    "single solution": ([[2, 1], [1, 3]], [[8], [13]]),
+    "no solution": ([[1, -2], [2, -4]], [[1], [3]]),
+    "larger system": (
+        [
+            [4, 8, 6, 8, 9, 3],
+            [9, 4, 4, 6, 3, 2],
+            [7, 8, 5, 6, 7, 8],
+            [3, 4, 5, 6, 4, 65],
+            [9, 8, 6, 5, 6, 5],
+            [4, 5, 6, 7, 5, 6],
+        ],
+        [[1], [2], [3], [4], [5], [6]]
+    ),
+}
+
+
+def random_system(n: int, sparse: bool, seed: int = 52) -> tuple:
+    rng = random.Random(seed)
+
+    if sparse:
+        # Roughly three non-zero entries per row, with a non-zero diagonal
+        # so the system is likely to have full rank
+        coeff_matrix = [
+            [rng.randint(-9, 9) or 1 if row == column or rng.random() < 3 / n else 0 for column in range(n)]
+            for row in range(n)
+        ]
+    else:
+        coeff_matrix = [[rng.randint(-9, 9) for _ in range(n)] for _ in range(n)]
+
+    return coeff_matrix, [[rng.randint(-9, 9)] for _ in range(n)]
+
+
+def payload_sizes(content) -> tuple:
+    payload = json.dumps(content, separators=(",", ":")).encode()
+
+    return len(payload), len(gzip.compress(payload))
+
+
+def bench(coeff_matrix: list, const_matrix: list, gauss_jordan: bool) -> tuple:
+    m, n = len(coeff_matrix), len(coeff_matrix[0])
+
+    matrix = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode="delta")
+    matrix.gaussian_elimination(gauss_jordan=gauss_jordan)
+
+    row_ops_content = matrix.action_logger.row_ops_content
+
+    return len(row_ops_content[0]), payload_sizes(row_ops_content), payload_sizes(encode_row_deltas(row_ops_content))
+
+
+def main() -> None:
+    systems = (
+        list(TEST_SYSTEMS.items()) +
+        [(f"dense {n}x{n}", random_system(n, sparse=False)) for n in DENSE_SIZES] +
+        [(f"sparse {n}x{n}", random_system(n, sparse=True)) for n in SPARSE_SIZES]
+    )
+
+    for name, (coeff_matrix, const_matrix) in systems:
+        for gauss_jordan in [False, True]:
+            num_steps, (full, full_gzip), (row_deltas, row_deltas_gzip) = bench(coeff_matrix, const_matrix, gauss_jordan)
+            method = "gauss-jordan" if gauss_jordan else "gaussian"
+
+            print(f"{name:<15} {method:<12} steps={num_steps:<6} full={full / 1024:.1f}KiB "
+                  f"row-deltas={row_deltas / 1024:.1f}KiB ({row_deltas / full:.1%}) "
+                  f"gzip full={full_gzip / 1024:.1f}KiB row-deltas={row_deltas_gzip / 1024:.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import { useContext, useEffect, useRef } from "react";
 
 import { SystemsOfEquationsContext } from "../../pages/systemsOfEquations/SystemsOfEquationsContext.jsx"
+import { fillStepPage } from "../../pages/systemsOfEquations/SystemsOfEquationsContext.jsx"
+import { fetchStepPage } from "../../pages/systemsOfEquations/SubmitMatrix.js"
 import styles from "../../pages/systemsOfEquations/SystemsOfEquations.module.css"
 
 import PropTypes from "prop-types";
@@ -55,6 +57,24 @@ function getRowOpDescription(rowOpNum, rowOpInfo){
             </>
         }
     }
+    else if (rowOpInfo[0] == "bareiss_elimination"){
+        // Every row operation was done at once by the fraction-free engine
+        rowOpText = "Fraction-Free Elimination";
+    }
+    else if (rowOpInfo[0] == "lu_replay"){
+        // The row operations of a cached factorization of the same
+        // coefficient matrix were replayed on the constants
+        rowOpText = "Cached LU Factorization";
+    }
+    else if (rowOpInfo[0] == "structured_elimination"){
+        // Every row operation was done at once by a fast path for the
+        // structure of the matrix, such as a triangular one
+        rowOpText = "Structured Elimination";
+    }
+    else if (rowOpInfo[0] == "numeric_elimination"){
+        // Every row operation was done at once by the floating point engine
+        rowOpText = "Numeric Elimination";
+    }
 
     return rowOpText;
 }
@@ -84,8 +104,22 @@ function RowOperationsContent(){
 
 
     // Logic for handling a click on a row operation button
-    const handleClick = (rowOpNum) => {
+    const handleClick = async (rowOpNum) => {
         setSelectedRowOp((prevData) => ({curr: rowOpNum, prev: prevData.curr, last: prevData.last}));
+
+        // Steps of large systems are only fetched once viewed. They are
+        // filled in place rather than through setSolvedContent, which
+        // would rebuild every button.
+        if (solvedContent[1][rowOpNum] === undefined){
+            const stepPage = await fetchStepPage(rowOpNum);
+
+            if (!stepPage){
+                alert("Unable to display step");
+                return;
+            }
+
+            fillStepPage(solvedContent, stepPage);
+        }
         
         // Get dimensions for matrix through solved content
         let m = null;
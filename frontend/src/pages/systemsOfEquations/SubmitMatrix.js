@@ -1,3 +1,113 @@
+import { applyRowDelta, decodeStepPage } from "./SystemsOfEquationsContext.jsx";
+
+// Id of the last system solved by the backend, sent back so that a
+// following Gauss-Jordan request on the same system only runs the upward
+// phase of elimination, and a few edited entries only redo the steps that
+// depend on them
+let lastSolveId = null;
+
+// Entries of the last system solved by the backend
+let lastEntryValues = null;
+
+// Systems with more coefficient entries than this only get the matrices of
+// the first few steps, with the others fetched once viewed, see
+// fetchStepPage(). Smaller ones have every step streamed.
+const PAGED_MIN_ENTRIES = 36;
+
+// Returns the page of steps of the last system solved starting at step,
+// or null if the backend no longer keeps them
+export async function fetchStepPage(step){
+    const response = await fetch(`/solves/${lastSolveId}/steps?from=${step}`);
+
+    if (!response.ok){
+        return null;
+    }
+
+    return await response.json();
+}
+
+// Returns the entries that differ from the last system solved, as
+// {row, column, value} with the constant column after the coefficient
+// ones, or null if the dimensions changed or nothing did
+function getChangedEntries(entryValues){
+    if (!lastEntryValues || lastEntryValues["matrix"].length != entryValues["matrix"].length){
+        return null;
+    }
+
+    const changedEntries = [];
+
+    for (let i = 0; i < entryValues["matrix"].length; i++){
+        const row = entryValues["matrix"][i].concat(entryValues["constMatrix"][i]);
+        const lastRow = lastEntryValues["matrix"][i].concat(lastEntryValues["constMatrix"][i]);
+
+        if (row.length != lastRow.length){
+            return null;
+        }
+
+        for (let j = 0; j < row.length; j++){
+            if (row[j] != lastRow[j]){
+                changedEntries.push({row: i, column: j, value: row[j]});
+            }
+        }
+    }
+
+    return changedEntries.length ? changedEntries : null;
+}
+
+// Reads the NDJSON stream of a solve, showing the steps as they arrive
+// rather than once the whole elimination is done. Returns the "result"
+// event, with everything but the steps, or null if solving failed.
+async function readSolveStream(response, setSolvedContent){
+    const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+    const solvedContent = [[], [], []];
+
+    let buffer = "";
+    let result = null;
+
+    while (true){
+        const {value, done} = await reader.read();
+
+        if (done){
+            break;
+        }
+
+        // Keep the last, possibly partial, line for the next chunk
+        const lines = (buffer + value).split("\n");
+        buffer = lines.pop();
+
+        for (const line of lines){
+            if (!line){
+                continue;
+            }
+
+            const event = JSON.parse(line);
+
+            if (event.type == "start"){
+                solvedContent[0].push(["Starting Matrix"]);
+                solvedContent[1].push(event.matrix);
+                solvedContent[2].push(event.constMatrix);
+            }
+            else if (event.type == "step"){
+                // Each step only holds the rows it changed
+                applyRowDelta(solvedContent, event);
+            }
+            else if (event.type == "result"){
+                result = event;
+            }
+            else{
+                return null;
+            }
+        }
+
+        // Show the steps read so far, once per chunk rather than per step
+        if (solvedContent[0].length){
+            setSolvedContent(solvedContent.map((part) => part.slice()));
+        }
+    }
+
+    return result;
+}
+
 export async function submitData(matrixData, solvingMethod, setSolvedContent){
     const entryValues = matrixData.current.getEntryValues();
     const dimensions = matrixData.current.getDimensions();
@@ -11,6 +121,9 @@ export async function submitData(matrixData, solvingMethod, setSolvedContent){
     // Check if one or more entries are empty
 
     
+    const paged = dimensions["m"] * (dimensions["n"] - 1) > PAGED_MIN_ENTRIES;
+    const responseFormat = paged ? {contentFormat: "paged"} : {stream: "ndjson"};
+
     // Create payload to send to backend
     const data = {
         matrix: entryValues["matrix"],
@@ -18,32 +131,64 @@ export async function submitData(matrixData, solvingMethod, setSolvedContent){
         m: dimensions["m"],
         n: dimensions["n"],
         method: solvingMethod,
+        solveId: lastSolveId,
+        ...responseFormat,
     }
 
 
-    // Hit backend endpoint for solved content
-    const response = await fetch("/system-of-equations", {
-        method: "POST",
-        headers: {
-            'Content-Type': 'application/json',  // Indicates that the data is JSON
-          },        
-        body: JSON.stringify(data)
-    })
+    const changedEntries = lastSolveId ? getChangedEntries(entryValues) : null;
+
+    let response = null;
+
+    // Only send the edited entries of the last system solved
+    if (changedEntries){
+        response = await fetch(`/system-of-equations/${lastSolveId}/changes`, {
+            method: "POST",
+            headers: {
+                'Content-Type': 'application/json',
+              },
+            body: JSON.stringify({method: solvingMethod, changedEntries: changedEntries, ...responseFormat})
+        })
+    }
+
+    // Hit backend endpoint for solved content, also when the last system
+    // solved is no longer kept by the backend
+    if (!response || response.status == 404){
+        response = await fetch("/system-of-equations", {
+            method: "POST",
+            headers: {
+                'Content-Type': 'application/json',  // Indicates that the data is JSON
+              },        
+            body: JSON.stringify(data)
+        })
+    }
 
     if (!response.ok){
         // Invalid entries were submitted
         return null;
     }
     
-    const fetchedData = await response.json()
-    const solvedContent = fetchedData.rowOperationsContent
+    let fetchedData = null;
+
+    if (paged){
+        fetchedData = await response.json();
+        setSolvedContent(decodeStepPage(fetchedData));
+    }
+    else{
+        fetchedData = await readSolveStream(response, setSolvedContent);
+    }
 
-    if (!solvedContent){
+    if (!fetchedData){
         alert("Error, could not solve matrix");
         return;
     }
-    else{
-        setSolvedContent(solvedContent);
+
+    // Steps done before the solve went over its budget are still shown
+    if (fetchedData.stopped){
+        alert(`Solving stopped early: ${fetchedData.stopped.description}`);
     }
+
+    lastSolveId = fetchedData.solveId ?? null;
+    lastEntryValues = structuredClone(entryValues);
   
 }
\ No newline at end of file
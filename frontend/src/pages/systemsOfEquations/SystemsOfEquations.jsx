@@ -63,6 +63,16 @@ function SystemsOfEquations(){
                     />
                         Gauss-Jordan Elimination
                     </label>
+                    <label>
+                    <input
+                        type="radio"
+                        name="method"
+                        value="back-substitution"
+                        checked={solvingMethod == "back-substitution"}
+                        onChange={() => setSolvingMethod("back-substitution")}
+                    />
+                        Back Substitution
+                    </label>
                     <button
                         type="button"
                         onClick={() => setSolvingMethod('')}
@@ -4,6 +4,60 @@ import PropTypes from "prop-types";
 
 export const SystemsOfEquationsContext = createContext(null);
 
+// Adds a step sent in the row-delta format, a {rowOp, rows} object with
+// only the rows it changed as [row index, matrix row, constant matrix row],
+// to solvedContent, whose last matrix holds every row left as it was
+export function applyRowDelta(solvedContent, rowDelta){
+    const matrix = solvedContent[1][solvedContent[1].length - 1].slice();
+    const constMatrix = solvedContent[2][solvedContent[2].length - 1].slice();
+
+    for (const [row, matrixRow, constRow] of rowDelta.rows){
+        matrix[row] = matrixRow;
+        constMatrix[row] = constRow;
+    }
+
+    solvedContent[0].push(rowDelta.rowOp);
+    solvedContent[1].push(matrix);
+    solvedContent[2].push(constMatrix);
+}
+
+// Turns the "rowOperations" and first "stepPage" of a "paged" response into
+// solvedContent, with the matrices of every other step left undefined until
+// their page is fetched
+export function decodeStepPage(fetchedData){
+    const numSteps = fetchedData.stepPage.numSteps;
+    const solvedContent = [fetchedData.rowOperations, new Array(numSteps), new Array(numSteps)];
+
+    fillStepPage(solvedContent, fetchedData.stepPage);
+
+    return solvedContent;
+}
+
+// Adds the matrices of a page of steps, as returned by
+// GET /solves/<id>/steps, to solvedContent
+export function fillStepPage(solvedContent, stepPage){
+    for (let step = stepPage.from; step < stepPage.to; step++){
+        solvedContent[1][step] = stepPage.rowOperationsContent[1][step - stepPage.from];
+        solvedContent[2][step] = stepPage.rowOperationsContent[2][step - stepPage.from];
+    }
+}
+
+// Turns the "rowOperationsDeltas" of a "row-deltas" response back into
+// the solvedContent of a "full" one
+export function decodeRowDeltas(rowOperationsDeltas){
+    const solvedContent = [
+        [["Starting Matrix"]],
+        [rowOperationsDeltas.matrix],
+        [rowOperationsDeltas.constMatrix]
+    ];
+
+    for (const step of rowOperationsDeltas.steps){
+        applyRowDelta(solvedContent, step);
+    }
+
+    return solvedContent;
+}
+
 export const SystemsOfEquationsProvider = ({ children }) =>  {
     // State management for page: 
     // - solvingMethod: Handles the selection logic for radio buttons
@@ -0,0 +1,613 @@
+from backend import app as app_module
+from backend.app import app
+from backend.jobs import JobQueue
+
+import json
+import time
+
+import pytest
+
+
+@pytest.fixture
+def client():
+    # Every test starts without results or sessions of the ones before it
+    if app_module.result_cache is not None:
+        app_module.result_cache.clear()
+    app_module.sessions.clear()
+    app_module.lu_cache.clear()
+    app_module.step_logs.clear()
+
+    return app.test_client()
+
+
+def system(matrix, const_matrix, method="gaussian-elimination", **kwargs):
+    return {
+        "matrix": matrix,
+        "constMatrix": const_matrix,
+        "m": len(matrix),
+        "n": len(matrix[0]) + len(const_matrix[0]),
+        "method": method,
+        **kwargs
+    }
+
+
+def read_events(response, stream_format):
+    text = response.get_data(as_text=True)
+
+    if stream_format == "ndjson":
+        return [json.loads(line) for line in text.splitlines()]
+
+    return [json.loads(event.split("data: ", 1)[1]) for event in text.split("\n\n") if event]
+
+
+def rebuild_content(events):
+    # Row operations content of the start and step events, see
+    # backend.streaming.stream_events()
+    row_ops_content = [[["Starting Matrix"]], [events[0]["matrix"]], [events[0]["constMatrix"]]]
+
+    for event in events[1:]:
+        if event["type"] != "step":
+            continue
+
+        matrix, constant_matrix = list(row_ops_content[1][-1]), list(row_ops_content[2][-1])
+        for row, matrix_row, constant_row in event["rows"]:
+            matrix[row], constant_matrix[row] = matrix_row, constant_row
+
+        row_ops_content[0].append(event["rowOp"])
+        row_ops_content[1].append(matrix)
+        row_ops_content[2].append(constant_matrix)
+
+    return row_ops_content
+
+
+class TestSystemOfEquations():
+    def test_solve(self, client):
+        response = client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [[5], [6]], method="gauss-jordan-elimination"))
+
+        assert response.status_code == 200
+        assert response.json["engine"]["name"] == "step-logged"
+        assert response.json["rowOperationsContent"][1][-1] == [["1", "0"], ["0", "1"]]
+        assert response.json["solution"]["solutions"][0]["particular"] == ["-4", "9/2"]
+
+    @pytest.mark.parametrize("body", [
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), matrix=[[1, "1/0"], [3, 4]]),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), matrix="not a matrix"),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), matrix=[[1, 2], 3]),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), matrix=[[1, 2], [3, {}]]),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), constMatrix=[["1/0"], [6]]),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), constMatrix=5),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), constVectors=[5, 6]),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), m="two"),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), n=3000),
+        dict(system([[1, 2], [3, 4]], [[5], [6]]), n=3, constMatrix=[[5, 1], [6, 1]]),
+        {key: value for key, value in system([[1, 2], [3, 4]], [[5], [6]]).items() if key != "matrix"},
+        {key: value for key, value in system([[1, 2], [3, 4]], [[5], [6]]).items() if key != "constMatrix"},
+    ])
+    def test_invalid_system(self, client, body):
+        assert client.post("/system-of-equations", json=body).status_code == 400
+
+    def test_requested_engine(self, client):
+        """Engines should only be used for matrices within their size limits."""
+
+        matrix = [[i * j + 1 for j in range(20)] for i in range(20)]
+        const_matrix = [[1] for _ in range(20)]
+
+        response = client.post("/system-of-equations", json=system(matrix, const_matrix, engine="numeric"))
+        assert response.status_code == 200
+        assert response.json["engine"] == {"name": "numeric", "reason": "requested"}
+
+        response = client.post("/system-of-equations", json=system(matrix, const_matrix, engine="exact"))
+        assert response.status_code == 200
+
+        response = client.post("/system-of-equations", json=system(matrix, const_matrix, engine="step-logged"))
+        assert response.status_code == 400
+
+        response = client.post("/system-of-equations", json=system([[1]], [[1]], engine="step-logged"))
+        assert response.status_code == 200
+
+        response = client.post("/system-of-equations", json=system([[1]], [[1]], engine="fast"))
+        assert response.status_code == 400
+
+    def test_pivot_strategy(self, client):
+        body = system([[0, 2], [3, 4]], [[5], [6]])
+
+        assert client.post("/system-of-equations", json=dict(body, pivotStrategy="markowitz")).status_code == 200
+
+        for pivot_strategy in ("best", ["markowitz"], {"name": "markowitz"}):
+            assert client.post("/system-of-equations", json=dict(body, pivotStrategy=pivot_strategy)).status_code == 400
+
+    def test_float_overflow(self, client, monkeypatch):
+        """Entries out of the range of a float should be turned away by the numeric engine, picked or not."""
+
+        matrix = [["1e400", 2], [3, 4]]
+
+        response = client.post("/system-of-equations", json=system(matrix, [[5], [6]], engine="numeric"))
+        assert response.status_code == 400
+
+        response = client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [["-1e400"], [6]], engine="numeric"))
+        assert response.status_code == 400
+
+        response = client.post("/rank", json={"matrix": matrix, "engine": "numeric"})
+        assert response.status_code == 400
+
+        # Picked by size
+        monkeypatch.setitem(app.config, "STEP_LOG_MAX_ENTRIES", 1)
+        monkeypatch.setitem(app.config, "EXACT_MAX_ENTRIES", 1)
+
+        response = client.post("/system-of-equations", json=system(matrix, [[5], [6]]))
+        assert response.status_code == 400
+
+        response = client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [[5], [6]]))
+        assert response.json["engine"]["name"] == "numeric"
+
+        # The exact engines are fine with them
+        monkeypatch.undo()
+
+        response = client.post("/system-of-equations", json=system(matrix, [[5], [6]]))
+        assert response.status_code == 200
+
+    def test_lu_replay(self, client):
+        """Exact solves should be labelled as replays of a cached LU factorization."""
+
+        matrix = [[(i + 1) ** j for j in range(12)] for i in range(12)]
+        const_matrix = [[i] for i in range(12)]
+
+        response = client.post("/system-of-equations", json=system(matrix, const_matrix, method="gauss-jordan-elimination"))
+
+        assert response.json["engine"]["name"] == "exact"
+        assert response.json["rowOperationsContent"][0] == [["Starting Matrix"], ["lu_replay"]]
+
+
+class TestMatrixProperties():
+    def test_properties(self, client):
+        assert client.post("/rank", json={"matrix": [[1, 2], [2, 4]]}).json["rank"] == 1
+        assert client.post("/determinant", json={"matrix": [[1, 2], [3, 4]]}).json["determinant"] == "-2"
+        assert client.post("/inverse", json={"matrix": [[2, 0], [0, 4]]}).json["inverse"] == [["1/2", "0"], ["0", "1/4"]]
+
+    @pytest.mark.parametrize("route", ["/rank", "/determinant", "/inverse"])
+    @pytest.mark.parametrize("body", [
+        {}, {"matrix": None}, {"matrix": []}, {"matrix": [1, 2]}, {"matrix": [[1, 2], [3]]},
+        {"matrix": [[1, "x"], [3, 4]]}, [[1, 2], [3, 4]], "matrix",
+    ])
+    def test_invalid_body(self, client, route, body):
+        assert client.post(route, json=body).status_code == 400
+
+    def test_not_json(self, client):
+        assert client.post("/rank", data="matrix", content_type="text/plain").status_code == 400
+        assert client.post("/system-of-equations", json=[1, 2]).status_code == 400
+
+
+class TestResultCache():
+    def test_cached_solve_id(self, client):
+        """Cached results should keep the solveId of their session for as long as it is kept."""
+
+        body = system([[1, 2], [3, 4]], [[5], [6]])
+
+        solve_id = client.post("/system-of-equations", json=body).json["solveId"]
+        assert solve_id is not None
+
+        response = client.post("/system-of-equations", json=body)
+        assert response.json["solveId"] == solve_id
+        assert client.get("/stats/result-cache").json["hits"] >= 1
+
+        # The cached solveId can be resumed from
+        response = client.post("/system-of-equations", json=dict(body, method="gauss-jordan-elimination", solveId=solve_id))
+        assert response.json["solveId"] == solve_id
+        assert response.json["rowOperationsContent"][1][-1] == [["1", "0"], ["0", "1"]]
+
+        app_module.sessions.clear()
+
+        # Without its session, a cached result has nothing to resume from
+        response = client.post("/system-of-equations", json=body)
+        assert response.status_code == 200
+        assert response.json["solveId"] is None
+
+        response = client.post(f"/system-of-equations/{solve_id}/changes", json={
+            "method": "gaussian-elimination", "changedEntries": [{"row": 0, "column": 0, "value": 2}]
+        })
+        assert response.status_code == 404
+
+
+class TestResume():
+    def test_step_logged(self, client):
+        """Gauss-jordan with the solveId of a REF should only add the steps of the upward phase."""
+
+        body = system([[0, 2, 1], [1, 1, 1], [2, 1, 3]], [[1], [2], [3]])
+
+        ref_response = client.post("/system-of-equations", json=body).json
+        ref_row_op_infos, ref_matrices, _ = ref_response["rowOperationsContent"]
+
+        response = client.post("/system-of-equations", json=dict(body, method="gauss-jordan-elimination", solveId=ref_response["solveId"]))
+        row_op_infos, matrices, _ = response.json["rowOperationsContent"]
+
+        assert response.status_code == 200
+        assert row_op_infos[:len(ref_row_op_infos)] == ref_row_op_infos
+        assert matrices[:len(ref_matrices)] == ref_matrices
+
+        # Only entries above the pivots are eliminated
+        upward_row_op_infos = row_op_infos[len(ref_row_op_infos):]
+        assert upward_row_op_infos
+        assert all(row_op_info[0] == "row_multiple_to_row" and row_op_info[1] < row_op_info[3] for row_op_info in upward_row_op_infos)
+
+        assert matrices[-1] == [["1", "0", "0"], ["0", "1", "0"], ["0", "0", "1"]]
+        assert response.json["solveId"] == ref_response["solveId"]
+
+    def test_exact(self, client):
+        """Only step-logged solves should be kept as sessions."""
+
+        matrix = [[(i + 1) ** j for j in range(12)] for i in range(12)]
+        response = client.post("/system-of-equations", json=system(matrix, [[i] for i in range(12)]))
+
+        assert response.json["engine"]["name"] == "exact"
+        assert response.json["solveId"] is None
+
+    def test_other_system(self, client):
+        """A solveId of another system should be ignored."""
+
+        solve_id = client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [[5], [6]])).json["solveId"]
+
+        response = client.post("/system-of-equations", json=system([[1, 2], [3, 5]], [[5], [6]], method="gauss-jordan-elimination", solveId=solve_id))
+
+        assert response.status_code == 200
+        assert response.json["rowOperationsContent"][1][0] == [["1", "2"], ["3", "5"]]
+        assert response.json["solveId"] != solve_id
+
+
+class TestChanges():
+    def test_changes(self, client):
+        """Edited systems should give the same result as solving them from scratch."""
+
+        body = system([[1, 2, 3], [2, 5, 3], [1, 0, 8]], [[1], [2], [3]])
+        solve_id = client.post("/system-of-equations", json=body).json["solveId"]
+
+        response = client.post(f"/system-of-equations/{solve_id}/changes", json={
+            "method": "gaussian-elimination", "changedEntries": [{"row": 2, "column": 2, "value": "9"}]
+        })
+
+        expected = client.post("/system-of-equations", json=system([[1, 2, 3], [2, 5, 3], [1, 0, 9]], [[1], [2], [3]])).json
+
+        assert response.status_code == 200
+        assert response.json["engine"] == {"name": "step-logged", "reason": "previous solve"}
+        assert response.json["stepsReused"] > 0
+        assert response.json["rowOperationsContent"][1][-1] == expected["rowOperationsContent"][1][-1]
+        assert response.json["solution"] == expected["solution"]
+
+    def test_unknown_solve_id(self, client):
+        response = client.post("/system-of-equations/unknown/changes", json={
+            "method": "gaussian-elimination", "changedEntries": []
+        })
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("body", [
+        {"changedEntries": [{"row": 0, "column": 0, "value": 2}]},
+        {"method": "lu", "changedEntries": [{"row": 0, "column": 0, "value": 2}]},
+        {"method": "gaussian-elimination"},
+        {"method": "gaussian-elimination", "changedEntries": 5},
+        {"method": "gaussian-elimination", "changedEntries": [{"row": 0, "column": 9, "value": 2}]},
+        {"method": "gaussian-elimination", "changedEntries": [{"row": 0, "column": 0, "value": "1/0"}]},
+        {"method": "gaussian-elimination", "changedEntries": [{"row": 0, "column": 0}]},
+    ])
+    def test_invalid_changes(self, client, body):
+        solve_id = client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [[5], [6]])).json["solveId"]
+
+        assert client.post(f"/system-of-equations/{solve_id}/changes", json=body).status_code == 400
+
+
+class TestStreaming():
+    @pytest.mark.parametrize("stream_format", ["ndjson", "sse"])
+    @pytest.mark.parametrize("engine", ["step-logged", "exact", "numeric"])
+    def test_stream(self, client, stream_format, engine):
+        """Streamed steps should add up to the content of a plain response."""
+
+        body = system([[0, 2, 1], [1, 1, 1], [2, 1, 3]], [[1], [2], [3]], method="gauss-jordan-elimination", engine=engine)
+        expected = client.post("/system-of-equations", json=body).json
+
+        # Not served from the result cache
+        if app_module.result_cache is not None:
+            app_module.result_cache.clear()
+
+        response = client.post("/system-of-equations", json=dict(body, stream=stream_format))
+        events = read_events(response, stream_format)
+
+        assert response.status_code == 200
+        assert response.mimetype == app_module.STREAM_FORMATS[stream_format]
+        assert [events[0]["type"], events[-1]["type"]] == ["start", "result"]
+        assert rebuild_content(events) == expected["rowOperationsContent"]
+        assert events[-1]["solution"] == expected["solution"]
+        assert "rowOperationsContent" not in events[-1]
+
+    def test_cached(self, client):
+        """Cached results should be streamed as well."""
+
+        body = system([[1, 2], [3, 4]], [[5], [6]])
+        expected = client.post("/system-of-equations", json=body).json
+
+        events = read_events(client.post("/system-of-equations", json=dict(body, stream="ndjson")), "ndjson")
+
+        assert rebuild_content(events) == expected["rowOperationsContent"]
+
+    def test_changes(self, client):
+        solve_id = client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [[5], [6]])).json["solveId"]
+
+        response = client.post(f"/system-of-equations/{solve_id}/changes", json={
+            "method": "gaussian-elimination", "changedEntries": [{"row": 1, "column": 1, "value": 5}], "stream": "ndjson"
+        })
+        events = read_events(response, "ndjson")
+
+        assert events[-1]["type"] == "result"
+        assert events[-1]["stepsReused"] > 0
+        assert rebuild_content(events)[1][0] == [["1", "2"], ["3", "5"]]
+
+    @pytest.mark.parametrize("stream_format", ["xml", ["ndjson"], {"format": "sse"}])
+    def test_invalid_stream_format(self, client, stream_format):
+        response = client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [[5], [6]], stream=stream_format))
+
+        assert response.status_code == 400
+
+    def test_error(self, client, monkeypatch):
+        """A solve that raises should end the stream with an error event."""
+
+        def fail(*args, **kwargs):
+            raise ValueError()
+
+        monkeypatch.setattr(app_module, "solve_system_of_equations", fail)
+
+        events = read_events(client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [[5], [6]], stream="ndjson")), "ndjson")
+
+        assert [event["type"] for event in events] == ["start", "error"]
+        assert events[-1]["description"] == "Could not solve matrix"
+
+
+class TestContentFormats():
+    def test_row_deltas(self, client):
+        """Row deltas should decode to the full row operations content."""
+
+        body = system([[0, 2, 1], [1, 1, 1], [2, 1, 3]], [[1], [2], [3]], method="gauss-jordan-elimination")
+        expected = client.post("/system-of-equations", json=body).json
+
+        response = client.post("/system-of-equations", json=dict(body, contentFormat="row-deltas"))
+        row_deltas = response.json["rowOperationsDeltas"]
+
+        events = [{"type": "start", "matrix": row_deltas["matrix"], "constMatrix": row_deltas["constMatrix"]}]
+        events += [dict(step, type="step") for step in row_deltas["steps"]]
+
+        assert "rowOperationsContent" not in response.json
+        assert rebuild_content(events) == expected["rowOperationsContent"]
+        assert response.json["solution"] == expected["solution"]
+
+    def test_invalid_content_format(self, client):
+        response = client.post("/system-of-equations", json=system([[1, 2], [3, 4]], [[5], [6]], contentFormat="csv"))
+
+        assert response.status_code == 400
+
+
+class TestStepPages():
+    def paged_response(self, client):
+        body = system([[0, 2, 1, 4], [1, 1, 1, 2], [2, 1, 3, 1], [1, 3, 2, 2]], [[1], [2], [3], [4]], method="gauss-jordan-elimination")
+        expected = client.post("/system-of-equations", json=body).json
+
+        return client.post("/system-of-equations", json=dict(body, contentFormat="paged")).json, expected
+
+    def test_pages(self, client, monkeypatch):
+        """Every page should hold the same steps as the full content."""
+
+        monkeypatch.setitem(app.config, "STEP_PAGE_SIZE", 3)
+        response, expected = self.paged_response(client)
+        row_op_infos, matrices, constant_matrices = expected["rowOperationsContent"]
+
+        assert response["rowOperations"] == row_op_infos
+        assert response["stepPage"]["from"] == 0
+        assert response["stepPage"]["rowOperationsContent"][1] == matrices[:3]
+
+        for start in range(0, len(row_op_infos), 3):
+            page = client.get(f"/solves/{response['solveId']}/steps?from={start}&to={start + 3}").json
+
+            assert page["numSteps"] == len(row_op_infos)
+            assert page["rowOperationsContent"] == [row_op_infos[start:start + 3], matrices[start:start + 3], constant_matrices[start:start + 3]]
+
+        # "to" defaults to a page past "from"
+        page = client.get(f"/solves/{response['solveId']}/steps?from=1").json
+        assert [page["from"], page["to"]] == [1, 4]
+
+    def test_resume(self, client):
+        """Pages of a resumed solve should hold its RREF steps rather than those of the REF it resumed."""
+
+        body = system([[0, 2, 1, 4], [1, 1, 1, 2], [2, 1, 3, 1], [1, 3, 2, 2]], [[1], [2], [3], [4]], contentFormat="paged")
+        ref_response = client.post("/system-of-equations", json=body).json
+
+        response = client.post("/system-of-equations", json=dict(
+            body, method="gauss-jordan-elimination", solveId=ref_response["solveId"]
+        )).json
+        row_op_infos, matrices, constant_matrices = client.post("/system-of-equations", json=dict(
+            body, method="gauss-jordan-elimination", contentFormat="full"
+        )).json["rowOperationsContent"]
+
+        assert response["solveId"] == ref_response["solveId"]
+        assert response["rowOperations"] == row_op_infos
+
+        page = client.get(f"/solves/{response['solveId']}/steps?from={len(row_op_infos) - 1}").json
+
+        assert page["numSteps"] == len(row_op_infos)
+        assert page["rowOperationsContent"] == [row_op_infos[-1:], matrices[-1:], constant_matrices[-1:]]
+
+    def test_max_page_size(self, client, monkeypatch):
+        monkeypatch.setitem(app.config, "STEP_PAGE_MAX_SIZE", 2)
+        response, _ = self.paged_response(client)
+
+        page = client.get(f"/solves/{response['solveId']}/steps?from=0&to=100").json
+
+        assert page["to"] == 2
+
+    def test_unknown_solve_id(self, client):
+        assert client.get("/solves/unknown/steps?from=0").status_code == 404
+
+    @pytest.mark.parametrize("query", ["from=a", "from=0&to=b", "from=-1", "from=1000", "from=2&to=2"])
+    def test_invalid_range(self, client, query):
+        response, _ = self.paged_response(client)
+
+        assert client.get(f"/solves/{response['solveId']}/steps?{query}").status_code == 400
+
+
+class TestBudget():
+    matrix = [[2, 1, 3, 1], [4, 3, 1, 2], [1, 5, 2, 3], [3, 2, 4, 5]]
+    const_matrix = [[1], [2], [3], [4]]
+
+    @pytest.mark.parametrize("budget", [
+        "fast", {"maxRowOps": 0}, {"maxRowOps": True}, {"maxRowOps": "5"}, {"maxRowOps": 1.5},
+        {"maxSeconds": -1}, {"maxEntryBits": None, "maxSeconds": "1"},
+    ])
+    def test_invalid(self, client, budget):
+        assert client.post("/system-of-equations", json=system(self.matrix, self.const_matrix, budget=budget)).status_code == 400
+
+    @pytest.mark.parametrize("engine", ["step-logged", "exact", "numeric"])
+    def test_stopped(self, client, engine):
+        """Stopped solves should answer with the steps so far, and be neither cached nor kept."""
+
+        body = system(self.matrix, self.const_matrix, engine=engine, budget={"maxRowOps": 2})
+        response = client.post("/system-of-equations", json=body)
+
+        assert response.status_code == 200
+        assert response.json["solution"] is None
+        assert response.json["solveId"] is None
+        assert response.json["stopped"]["reason"] == "rowOps"
+        assert 0 < response.json["stopped"]["pivotsDone"] < response.json["stopped"]["totalPivots"] == 4
+
+        if engine == "step-logged":
+            # Every step up to the last pivot, a pivot taking at most a
+            # row operation for every row
+            assert len(response.json["rowOperationsContent"][0]) - 1 <= 2 + 4
+
+        response = client.post("/system-of-equations", json=dict(body, budget=None))
+
+        assert response.json["solution"] is not None
+        assert response.json["stopped"] is None
+
+    def test_gauss_jordan(self, client):
+        """The upward phase of gauss-jordan elimination should be held to the budget as well."""
+
+        ref_content = client.post("/system-of-equations", json=system(self.matrix, self.const_matrix)).json["rowOperationsContent"]
+        ref_row_ops = len(ref_content[0]) - 1
+
+        response = client.post("/system-of-equations", json=system(
+            self.matrix, self.const_matrix, method="gauss-jordan-elimination", budget={"maxRowOps": ref_row_ops}
+        ))
+
+        assert response.json["solution"] is None
+        assert response.json["stopped"]["pivotsDone"] == response.json["stopped"]["totalPivots"]
+        assert len(response.json["rowOperationsContent"][0]) - 1 < ref_row_ops + 4
+
+    def test_structured(self, client):
+        """Structured fast paths should be held to the budget as well."""
+
+        response = client.post("/system-of-equations", json=system(
+            [[2, 1, 1, 1], [0, 3, 1, 1], [0, 0, 5, 1], [0, 0, 0, 7]], self.const_matrix,
+            method="gauss-jordan-elimination", budget={"maxRowOps": 1}
+        ))
+
+        assert response.json["structure"] == "upper_triangular"
+        assert response.json["stopped"]["reason"] == "rowOps"
+
+    def test_no_resume(self, client):
+        """Budgeted requests should solve from the start rather than resume a session."""
+
+        solve_id = client.post("/system-of-equations", json=system(self.matrix, self.const_matrix)).json["solveId"]
+
+        response = client.post("/system-of-equations", json=system(
+            self.matrix, self.const_matrix, method="gauss-jordan-elimination", solveId=solve_id, budget={"maxRowOps": 2}
+        ))
+
+        assert response.json["stopped"]["reason"] == "rowOps"
+
+        # The session is still there to be resumed
+        response = client.post("/system-of-equations", json=system(
+            self.matrix, self.const_matrix, method="gauss-jordan-elimination", solveId=solve_id
+        ))
+
+        assert response.json["solveId"] == solve_id
+        assert response.json["solution"] is not None
+
+    def test_app_limit(self, client, monkeypatch):
+        """Limits of the app should apply to requests without a budget, and cap looser ones."""
+
+        monkeypatch.setitem(app.config, "SOLVE_MAX_ROW_OPS", 2)
+
+        for budget in (None, {"maxRowOps": 100}):
+            response = client.post("/system-of-equations", json=system(self.matrix, self.const_matrix, budget=budget))
+            assert response.json["stopped"]["description"] == "Stopped after 2 row operations"
+
+    def test_stream(self, client):
+        body = system(self.matrix, self.const_matrix, budget={"maxRowOps": 2})
+        expected = client.post("/system-of-equations", json=body).json
+
+        response = client.post("/system-of-equations", json=dict(body, stream="ndjson"))
+        events = read_events(response, "ndjson")
+
+        assert response.status_code == 200
+        assert events[-1]["type"] == "result"
+        assert events[-1]["solution"] is None
+        assert events[-1]["stopped"]["reason"] == "rowOps"
+        assert events[-1]["stopped"] == expected["stopped"]
+        assert rebuild_content(events) == expected["rowOperationsContent"]
+
+
+class TestJobs():
+    @pytest.fixture
+    def jobs(self, monkeypatch):
+        jobs = JobQueue(max_workers=1, max_queue_depth=2)
+        monkeypatch.setattr(app_module, "jobs", jobs)
+
+        yield jobs
+        jobs.shutdown()
+
+    def wait_for_job(self, client, job_id):
+        deadline = time.monotonic() + 30
+
+        while time.monotonic() < deadline:
+            job = client.get(f"/jobs/{job_id}").json
+            if job["status"] not in ("queued", "running"):
+                return job
+
+            time.sleep(0.01)
+
+        raise TimeoutError("Job never finished")
+
+    @pytest.mark.parametrize("engine", ["step-logged", "exact", "numeric"])
+    def test_solve(self, client, jobs, engine):
+        """Jobs should give the same response content as a plain solve."""
+
+        body = system([[0, 2, 1], [1, 1, 1], [2, 1, 3]], [[1], [2], [3]], method="gauss-jordan-elimination", engine=engine)
+        expected = client.post("/system-of-equations", json=body).json
+
+        response = client.post("/jobs", json=body)
+        assert response.status_code == 202
+        assert response.json["progress"]["totalPivots"] == 3
+
+        job = self.wait_for_job(client, response.json["jobId"])
+
+        assert job["status"] == "done"
+        assert job["progress"] == {"pivotsDone": 3, "totalPivots": 3}
+        # Jobs never replay the LU cache of the app, so only the steps may differ in name
+        assert job["result"]["rowOperationsContent"][1:] == expected["rowOperationsContent"][1:]
+        assert job["result"]["solution"] == expected["solution"]
+        assert job["result"]["engine"] == expected["engine"]
+
+    def test_delete(self, client, jobs):
+        job_id = client.post("/jobs", json=system([[1, 2], [3, 4]], [[5], [6]])).json["jobId"]
+        self.wait_for_job(client, job_id)
+
+        assert client.delete(f"/jobs/{job_id}").status_code == 204
+        assert client.get(f"/jobs/{job_id}").status_code == 404
+        assert client.delete(f"/jobs/{job_id}").status_code == 404
+
+    def test_queue_full(self, client, monkeypatch):
+        monkeypatch.setattr(app_module, "jobs", JobQueue(max_queue_depth=0))
+
+        assert client.post("/jobs", json=system([[1, 2], [3, 4]], [[5], [6]])).status_code == 503
+        assert client.get("/stats/jobs").json["rejected"] == 1
+
+    def test_invalid(self, client, jobs):
+        assert client.post("/jobs", json=system([[1, "1/0"], [3, 4]], [[5], [6]])).status_code == 400
+        assert client.post("/jobs", json=system([[1, 2], [3, 4]], [[5], [6]], method="lu")).status_code == 400
+        assert client.get("/jobs/unknown").status_code == 404
+        assert jobs.stats["submitted"] == 0
@@ -0,0 +1,120 @@
+from backend.blocks import density, find_blocks, solve_by_blocks
+from backend.matrix import AugmentedMatrix
+from backend.numeric_matrix import NumericAugmentedMatrix
+
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from fractions import Fraction
+import random
+
+import numpy as np
+import pytest
+
+
+def random_block_system(rng, num_blocks):
+    """
+    Block diagonal system with its rows and columns shuffled, returned as
+    (coefficient matrix, constant matrix, m, n).
+    """
+
+    sizes = [(rng.randint(1, 4), rng.randint(1, 4)) for _ in range(num_blocks)]
+    m, n = sum(rows for rows, _ in sizes), sum(columns for _, columns in sizes)
+
+    coeff_matrix = [[0] * n for _ in range(m)]
+    first_row = first_column = 0
+
+    for rows, columns in sizes:
+        for curr_row in range(first_row, first_row + rows):
+            for curr_column in range(first_column, first_column + columns):
+                coeff_matrix[curr_row][curr_column] = rng.choice([0, 1, -1, rng.randint(-9, 9), Fraction(rng.randint(-9, 9), rng.randint(1, 9))])
+
+        first_row += rows
+        first_column += columns
+
+    row_order, column_order = list(range(m)), list(range(n))
+    rng.shuffle(row_order)
+    rng.shuffle(column_order)
+
+    coeff_matrix = [[coeff_matrix[row][column] for column in column_order] for row in row_order]
+    const_matrix = [[rng.randint(-9, 9)] for _ in range(m)]
+
+    return coeff_matrix, const_matrix, m, n
+
+
+class TestFindBlocks():
+    def test_blocks(self):
+        coeff_matrix = [
+            [1, 0, 2, 0],
+            [0, 3, 0, 0],
+            [4, 0, 0, 0],
+            [0, 0, 0, 0],
+        ]
+
+        assert find_blocks(coeff_matrix, 4, 4) == [([0, 2], [0, 2]), ([1], [1])]
+        assert find_blocks(np.array(coeff_matrix, dtype=np.float64), 4, 4) == [([0, 2], [0, 2]), ([1], [1])]
+        assert density(coeff_matrix, 4, 4) == 4 / 16
+
+    def test_connected(self):
+        assert find_blocks([[1, 1], [0, 1]], 2, 2) == [([0, 1], [0, 1])]
+
+
+class TestSolveByBlocks():
+    @pytest.mark.parametrize("engine", ["step-logged", "exact"])
+    def test_vary_systems(self, engine):
+        """Should give the same RREF as eliminating the whole matrix."""
+
+        rng = random.Random(52)
+
+        for i in range(50):
+            coeff_matrix, const_matrix, m, n = random_block_system(rng, rng.randint(1, 4))
+
+            A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            log_mode = "delta" if engine == "step-logged" else "off"
+            B = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode=log_mode)
+            solve_by_blocks(B, engine, find_blocks(B.data, m, n), gauss_jordan=True)
+
+            assert B.data == A.data
+            assert B.is_reduced_echelon()
+
+            # Constants of inconsistent rows depend on the row operations
+            # taken, so only compare consistent systems
+            rank = len(B._pivot_point_locations)
+            if all(row[0] == 0 for row in A.constant_matrix[rank:]):
+                assert B.constant_matrix == A.constant_matrix
+
+            C = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode="off")
+            solve_by_blocks(C, engine, find_blocks(C.data, m, n))
+            assert C.is_echelon()
+
+            if engine == "step-logged":
+                # The last step of the log is the stitched matrix
+                snapshots = B.action_logger.row_ops_content[1]
+                assert snapshots[0] == B.action_logger.deepcopy_matrix_to_str(coeff_matrix)
+                assert snapshots[-1] == B.action_logger.deepcopy_matrix_to_str(B.data)
+
+    def test_numeric(self):
+        rng = random.Random(52)
+        coeff_matrix, const_matrix, m, n = random_block_system(rng, 4)
+
+        A = NumericAugmentedMatrix(coeff_matrix, const_matrix, (m, n + 1))
+        A.gaussian_elimination(gauss_jordan=True)
+
+        B = NumericAugmentedMatrix(coeff_matrix, const_matrix, (m, n + 1))
+        solve_by_blocks(B, "numeric", find_blocks(B.data, m, n), gauss_jordan=True)
+
+        assert np.allclose(B.data, A.data)
+
+    def test_process_pool(self):
+        rng = random.Random(52)
+        coeff_matrix, const_matrix, m, n = random_block_system(rng, 4)
+
+        A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode="off")
+        A.bareiss_elimination(gauss_jordan=True)
+
+        B = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode="off")
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            solve_by_blocks(B, "exact", find_blocks(B.data, m, n), gauss_jordan=True, executor=executor, parallel_min_entries=1)
+
+        assert B.data == A.data
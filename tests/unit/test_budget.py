@@ -0,0 +1,174 @@
+from backend.budget import BudgetExceeded, SolveBudget
+from backend.matrix import AugmentedMatrix
+from backend.numeric_matrix import NumericAugmentedMatrix
+
+from fractions import Fraction
+import random
+
+import pytest
+
+
+def random_system(rng, m, n):
+    coeff_matrix = [[Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(n)] for _ in range(m)]
+    const_matrix = [[Fraction(rng.randint(-9, 9))] for _ in range(m)]
+
+    return coeff_matrix, const_matrix
+
+
+class TestSolveBudget():
+    def test_unlimited(self):
+        """An unlimited budget should give the same RREF as no budget."""
+
+        rng = random.Random(52)
+
+        for i in range(20):
+            m, n = rng.randint(1, 6), rng.randint(1, 6)
+            coeff_matrix, const_matrix = random_system(rng, m, n)
+
+            A = AugmentedMatrix([row.copy() for row in coeff_matrix], [row.copy() for row in const_matrix], (m, n + 1))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            B = AugmentedMatrix(coeff_matrix, const_matrix, (m, n + 1))
+            budget = SolveBudget(max_seconds=60, max_row_ops=10 ** 9, max_entry_bits=10 ** 9)
+            budget.watch(B)
+            B.gaussian_elimination(gauss_jordan=True)
+
+            assert budget.limited
+            assert A.data == B.data
+            assert A.constant_matrix == B.constant_matrix
+
+    @pytest.mark.parametrize("method", ["gaussian_elimination", "bareiss_elimination"])
+    def test_max_row_ops(self, method):
+        """Elimination should stop at the first pivot past the row operation limit."""
+
+        rng = random.Random(52)
+        coeff_matrix, const_matrix = random_system(rng, 8, 8)
+
+        A = AugmentedMatrix(coeff_matrix, const_matrix, (8, 9), log_mode="off")
+        SolveBudget(max_row_ops=10).watch(A)
+
+        with pytest.raises(BudgetExceeded) as error:
+            getattr(A, method)()
+
+        assert error.value.reason == "rowOps"
+        assert 0 < error.value.pivots_done < 8
+        assert A.row_op_count > 10
+
+    @pytest.mark.parametrize("method", ["gaussian_elimination", "bareiss_elimination"])
+    def test_max_entry_bits(self, method):
+        rng = random.Random(52)
+        coeff_matrix, const_matrix = random_system(rng, 8, 8)
+
+        A = AugmentedMatrix(coeff_matrix, const_matrix, (8, 9), log_mode="off")
+        SolveBudget(max_entry_bits=30).watch(A)
+
+        with pytest.raises(BudgetExceeded) as error:
+            getattr(A, method)()
+
+        assert error.value.reason == "entryBits"
+        assert A.max_entry_bit_length() > 30
+
+    def test_upward_phase(self):
+        """The upward phase of gauss-jordan elimination should be held to the budget as well."""
+
+        rng = random.Random(52)
+        coeff_matrix, const_matrix = random_system(rng, 6, 6)
+
+        A = AugmentedMatrix([row.copy() for row in coeff_matrix], [row.copy() for row in const_matrix], (6, 7), log_mode="off")
+        A.gaussian_elimination()
+
+        # Just enough row operations for the REF
+        B = AugmentedMatrix(coeff_matrix, const_matrix, (6, 7), log_mode="off")
+        SolveBudget(max_row_ops=A.row_op_count).watch(B)
+
+        with pytest.raises(BudgetExceeded) as error:
+            B.gaussian_elimination(gauss_jordan=True)
+
+        assert error.value.reason == "rowOps"
+        assert error.value.pivots_done == 6
+        assert B.is_echelon()
+        assert not B.is_reduced_echelon()
+
+    @pytest.mark.parametrize("structure, matrix_data", [
+        ("diagonal", [[2, 0, 0, 0], [0, 3, 0, 0], [0, 0, 5, 0], [0, 0, 0, 7]]),
+        ("upper_triangular", [[2, 1, 1, 1], [0, 3, 1, 1], [0, 0, 5, 1], [0, 0, 0, 7]]),
+        ("lower_triangular", [[2, 0, 0, 0], [1, 3, 0, 0], [1, 1, 5, 0], [1, 1, 1, 7]]),
+        ("banded", [[2, 1, 0, 0], [1, 3, 1, 0], [0, 1, 5, 1], [0, 0, 1, 7]]),
+    ])
+    def test_structured(self, structure, matrix_data):
+        """Structured fast paths should stop at the first pivot past the row operation limit."""
+
+        A = AugmentedMatrix(matrix_data, [[1], [2], [3], [4]], (4, 5), log_mode="off")
+        SolveBudget(max_row_ops=1).watch(A)
+
+        with pytest.raises(BudgetExceeded) as error:
+            A.gaussian_elimination(gauss_jordan=True, structure=structure)
+
+        assert error.value.reason == "rowOps"
+        assert error.value.pivots_done < 4
+        assert not A.is_reduced_echelon()
+
+    def test_max_seconds(self):
+        A = AugmentedMatrix([[1, 2], [3, 4]], [[5], [6]], (2, 3))
+        SolveBudget(max_seconds=0).watch(A)
+
+        with pytest.raises(BudgetExceeded) as error:
+            A.gaussian_elimination()
+
+        assert error.value.reason == "time"
+        assert error.value.pivots_done == 1
+
+    def test_steps_so_far(self):
+        """A stopped matrix should keep every step logged up to the last pivot."""
+
+        rng = random.Random(52)
+        coeff_matrix, const_matrix = random_system(rng, 6, 6)
+
+        A = AugmentedMatrix(coeff_matrix, const_matrix, (6, 7), log_mode="delta")
+        SolveBudget(max_row_ops=3).watch(A)
+
+        with pytest.raises(BudgetExceeded):
+            A.gaussian_elimination()
+
+        row_op_infos, matrices, _ = A.action_logger.row_ops_content
+        assert len(row_op_infos) == A.row_op_count + 1
+        assert matrices[-1] == A.action_logger.deepcopy_matrix_to_str(A.data)
+
+    def test_numeric(self):
+        """Numeric matrices should count vectorized row operations, and ignore entry bits."""
+
+        A = NumericAugmentedMatrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]], [[1], [2], [3]], (3, 4))
+        SolveBudget(max_entry_bits=1).watch(A)
+        A.gaussian_elimination()
+
+        assert A.row_op_count > 0
+
+        B = NumericAugmentedMatrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]], [[1], [2], [3]], (3, 4))
+        SolveBudget(max_row_ops=1).watch(B)
+
+        with pytest.raises(BudgetExceeded) as error:
+            B.gaussian_elimination()
+
+        assert error.value.reason == "rowOps"
+
+        # The upward phase is held to the budget as well
+        C = NumericAugmentedMatrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]], [[1], [2], [3]], (3, 4))
+        C.gaussian_elimination()
+
+        D = NumericAugmentedMatrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]], [[1], [2], [3]], (3, 4))
+        SolveBudget(max_row_ops=C.row_op_count).watch(D)
+
+        with pytest.raises(BudgetExceeded) as error:
+            D.gaussian_elimination(gauss_jordan=True)
+
+        assert error.value.pivots_done == 3
+
+    def test_pivot_callback(self):
+        """The pivot callback given to watch() should still be called."""
+
+        A = AugmentedMatrix([[1, 2], [3, 4]], [[5], [6]], (2, 3))
+        pivots_done = []
+        SolveBudget(max_seconds=60).watch(A, pivot_callback=pivots_done.append)
+        A.gaussian_elimination()
+
+        assert pivots_done == [1, 2]
@@ -0,0 +1,28 @@
+from backend.engine_selection import select_engine
+
+from fractions import Fraction
+
+import pytest
+
+
+class TestSelectEngine():
+    @pytest.fixture
+    def thresholds(self):
+        return {"step_log_max_entries": 4, "exact_max_entries": 9, "exact_max_entries_non_integer": 6}
+
+    def test_small_matrix(self, thresholds):
+        engine, _ = select_engine([[1, 2], [3, 4]], 2, 2, **thresholds)
+        assert engine == "step-logged"
+
+    def test_medium_integer_matrix(self, thresholds):
+        engine, _ = select_engine([[1, 2, 3], [4, 5, 6], [7, 8, 9]], 3, 3, **thresholds)
+        assert engine == "exact"
+
+    def test_medium_non_integer_matrix(self, thresholds):
+        engine, reason = select_engine([[1, 2, 3], [4, Fraction(1, 2), 6], [7, 8, 9]], 3, 3, **thresholds)
+        assert engine == "numeric"
+        assert "non-integer" in reason
+
+    def test_large_matrix(self, thresholds):
+        engine, _ = select_engine([[1] * 4 for _ in range(4)], 4, 4, **thresholds)
+        assert engine == "numeric"
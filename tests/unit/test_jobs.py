@@ -0,0 +1,189 @@
+from backend.jobs import JobCancelled, JobQueue
+from backend.matrix import AugmentedMatrix
+from backend.numeric_matrix import NumericAugmentedMatrix
+
+from fractions import Fraction
+import random
+import time
+
+import pytest
+
+
+def solve_job(coeff_matrix, const_matrix, m, n, progress):
+    A = AugmentedMatrix(coeff_matrix, const_matrix, (m, n + 1), log_mode="off")
+    A.pivot_callback = progress
+    A.gaussian_elimination(gauss_jordan=True)
+
+    return A.action_logger.deepcopy_matrix_to_str(A.data)
+
+
+def slow_job(num_pivots, progress):
+    for pivots_done in range(1, num_pivots + 1):
+        time.sleep(0.01)
+        progress(pivots_done)
+
+    return num_pivots
+
+
+def failing_job(progress):
+    raise ZeroDivisionError()
+
+
+def wait_for(job_queue, job_id, statuses, timeout=30):
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        job = job_queue.get(job_id)
+        if job["status"] in statuses:
+            return job
+
+        time.sleep(0.01)
+
+    raise TimeoutError(f"Job never got to {statuses}")
+
+
+@pytest.fixture
+def job_queue():
+    job_queue = JobQueue(max_workers=1, max_queue_depth=2)
+    yield job_queue
+    job_queue.shutdown()
+
+
+class TestPivotCallback():
+    @pytest.mark.parametrize("method", ["gaussian_elimination", "bareiss_elimination"])
+    def test_pivots_done(self, method):
+        """Every pivot should be reported once, in order."""
+
+        rng = random.Random(52)
+
+        for i in range(20):
+            m, n = rng.randint(1, 6), rng.randint(1, 6)
+            coeff_matrix = [[Fraction(rng.randint(-3, 3)) for _ in range(n)] for _ in range(m)]
+            const_matrix = [[Fraction(rng.randint(-9, 9))] for _ in range(m)]
+
+            A = AugmentedMatrix(coeff_matrix, const_matrix, (m, n + 1), log_mode="off")
+            pivots_done = []
+            A.pivot_callback = pivots_done.append
+            getattr(A, method)()
+
+            assert pivots_done == list(range(1, len(A._pivot_point_locations) + 1))
+
+    def test_gauss_jordan(self):
+        """The upward phase and structured fast paths should report their pivots as well."""
+
+        A = AugmentedMatrix([[1, 2], [3, 4]], [[5], [6]], (2, 3))
+        pivots_done = []
+        A.pivot_callback = pivots_done.append
+        A.gaussian_elimination(gauss_jordan=True)
+
+        assert pivots_done == [1, 2, 2, 2]
+
+        B = AugmentedMatrix([[2, 1, 1], [0, 3, 1], [0, 0, 5]], [[1], [2], [3]], (3, 4))
+        pivots_done = []
+        B.pivot_callback = pivots_done.append
+        B.gaussian_elimination(gauss_jordan=True, structure="upper_triangular")
+
+        assert pivots_done == [1, 2, 3]
+
+    def test_numeric(self):
+        A = NumericAugmentedMatrix([[0, 2], [1, 1], [3, 3]], [[1], [2], [3]], (3, 3))
+        pivots_done = []
+        A.pivot_callback = pivots_done.append
+        A.gaussian_elimination()
+
+        assert pivots_done == [1, 2]
+
+    def test_raise(self):
+        """Raising from the callback should stop elimination."""
+
+        A = AugmentedMatrix([[1, 2], [3, 4]], [[5], [6]], (2, 3))
+
+        def cancel(pivots_done):
+            raise JobCancelled()
+
+        A.pivot_callback = cancel
+
+        with pytest.raises(JobCancelled):
+            A.gaussian_elimination()
+
+        assert len(A._pivot_point_locations) == 1
+
+
+class TestJobQueue():
+    def test_done(self, job_queue):
+        coeff_matrix = [[Fraction(1), Fraction(2)], [Fraction(3), Fraction(4)]]
+        const_matrix = [[Fraction(5)], [Fraction(6)]]
+
+        job_id = job_queue.submit(solve_job, (coeff_matrix, const_matrix, 2, 2), total_pivots=2, context="context")
+        job = wait_for(job_queue, job_id, ("done",))
+
+        assert job["result"] == [["1", "0"], ["0", "1"]]
+        assert job["pivotsDone"] == job["totalPivots"] == 2
+        assert job["context"] == "context"
+
+    def test_failed(self, job_queue):
+        job_id = job_queue.submit(failing_job, (), total_pivots=1)
+
+        assert wait_for(job_queue, job_id, ("done", "failed"))["status"] == "failed"
+
+    def test_progress_and_cancel(self, job_queue):
+        """A running job should report its progress, and stop at the next pivot once cancelled."""
+
+        job_id = job_queue.submit(slow_job, (10000,), total_pivots=10000)
+
+        deadline = time.monotonic() + 30
+        while job_queue.get(job_id)["pivotsDone"] == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        job = job_queue.get(job_id)
+        assert job["status"] == "running"
+        assert 0 < job["pivotsDone"] < 10000
+
+        assert job_queue.delete(job_id)
+        assert job_queue.get(job_id)["status"] == "cancelled"
+
+        # The worker is free again once the job stopped
+        job_queue._jobs[job_id].future.exception(timeout=30)
+        assert isinstance(job_queue._jobs[job_id].future.exception(), JobCancelled)
+        assert job_queue.stats["cancelled"] == 1
+
+    def test_queue_depth(self, job_queue):
+        """Jobs past max_queue_depth should be turned away, and queued ones cancelled before they start."""
+
+        running_id = job_queue.submit(slow_job, (10000,), total_pivots=10000)
+        queued_id = job_queue.submit(slow_job, (1,), total_pivots=1)
+
+        assert job_queue.submit(slow_job, (1,), total_pivots=1) is None
+        assert job_queue.stats["rejected"] == 1
+
+        assert job_queue.delete(queued_id)
+        assert job_queue.delete(running_id)
+
+        for job_id in (running_id, queued_id):
+            assert job_queue.get(job_id)["status"] == "cancelled"
+            assert job_queue.get(job_id)["result"] is None
+
+        # Room is made once the jobs stop
+        job_queue._jobs[running_id].future.exception(timeout=30)
+        assert job_queue.submit(slow_job, (1,), total_pivots=1) is not None
+
+    def test_delete_finished(self, job_queue):
+        job_id = job_queue.submit(slow_job, (1,), total_pivots=1)
+        wait_for(job_queue, job_id, ("done",))
+
+        assert job_queue.delete(job_id)
+        assert job_queue.get(job_id) is None
+        assert not job_queue.delete(job_id)
+
+    def test_ttl(self):
+        job_queue = JobQueue(max_workers=1, ttl=0)
+
+        try:
+            job_id = job_queue.submit(slow_job, (1,), total_pivots=1)
+            job_queue._jobs[job_id].future.result(timeout=30)
+            time.sleep(0.01)
+
+            assert job_queue.get(job_id) is None
+        finally:
+            job_queue.shutdown()
@@ -0,0 +1,114 @@
+from backend.lu_cache import LUCache, LUFactorization, apply_row_ops, coefficient_matrix_key
+from backend.matrix import AugmentedMatrix, Matrix
+
+from copy import deepcopy
+from fractions import Fraction
+import random
+
+
+class TestLUFactorization():
+    def test_row_ops_replay_to_upper(self):
+        """Bareiss with an "ops" log should record every step it takes."""
+
+        rng = random.Random(52)
+
+        for i in range(100):
+            m, n = rng.randint(1, 6), rng.randint(1, 6)
+            matrix_data = [[rng.choice([0, 1, -2, rng.randint(-20, 20), Fraction(rng.randint(-9, 9), rng.randint(1, 9))]) for _ in range(n)] for _ in range(m)]
+
+            factorization = LUFactorization.factorize(matrix_data, (m, n))
+
+            rows = deepcopy(matrix_data)
+            apply_row_ops(factorization.row_ops, rows)
+            assert rows == factorization.upper
+            assert Matrix(rows, (m, n), log_mode="off").is_echelon()
+
+    def test_vary_systems(self):
+        """Should give the same RREF as gaussian_elimination on [A | B]."""
+
+        rng = random.Random(52)
+
+        for i in range(150):
+            m, n, k = rng.randint(1, 6), rng.randint(1, 6), rng.randint(1, 3)
+            coeff_matrix = [[rng.choice([0, 1, -1, rng.randint(-9, 9), Fraction(rng.randint(-9, 9), rng.randint(1, 9))]) for _ in range(n)] for _ in range(m)]
+            const_matrix = [[rng.randint(-9, 9) for _ in range(k)] for _ in range(m)]
+
+            A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + k))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            factorization = LUFactorization.factorize(coeff_matrix, (m, n))
+            coefficient_rows, constant_rows = factorization.solve(const_matrix, gauss_jordan=True)
+            assert coefficient_rows == A.data
+
+            # Each constant column is only solved the same way if it is
+            # consistent, otherwise the row operations taken matter
+            rank = len(factorization.pivot_point_locations)
+            for column in range(k):
+                consistent = all(row[column] == 0 for row in A.constant_matrix[rank:])
+                assert all(row[column] == 0 for row in constant_rows[rank:]) == consistent
+
+                if consistent:
+                    assert [row[column] for row in constant_rows] == [row[column] for row in A.constant_matrix]
+
+            coefficient_rows, _ = factorization.solve(const_matrix)
+            assert Matrix(coefficient_rows, (m, n), log_mode="off").is_echelon()
+
+    def test_already_echelon(self):
+        factorization = LUFactorization.factorize([[2, 4], [0, 3]], (2, 2))
+
+        assert factorization.row_ops == []
+        assert factorization.solve([[2], [3]]) == ([[2, 4], [0, 3]], [[2], [3]])
+        assert factorization.solve([[2], [3]], gauss_jordan=True) == ([[1, 0], [0, 1]], [[-1], [1]])
+
+    def test_lazy_reduced(self):
+        """The RREF should only be built once a gauss-jordan solve asks for it."""
+
+        rng = random.Random(52)
+
+        for i in range(50):
+            m, n = rng.randint(1, 6), rng.randint(1, 6)
+            matrix_data = [[rng.choice([0, 1, rng.randint(-9, 9), Fraction(rng.randint(-9, 9), rng.randint(1, 9))]) for _ in range(n)] for _ in range(m)]
+
+            factorization = LUFactorization.factorize(matrix_data, (m, n))
+            factorization.solve([[1] for _ in range(m)])
+            assert factorization._reduced is None
+
+            A = Matrix(deepcopy(matrix_data), (m, n), log_mode="off")
+            A.gaussian_elimination(gauss_jordan=True)
+
+            assert factorization.reduced == A.data
+            assert factorization.back_substitution(factorization.upper) == A.data
+
+
+class TestLUCache():
+    def test_key(self):
+        assert coefficient_matrix_key([[1, 2], [3, 4]]) == coefficient_matrix_key([["1", Fraction(2)], [3.0, "4/1"]])
+        assert coefficient_matrix_key([[1, 2], [3, 4]]) != coefficient_matrix_key([[1, 2, 3, 4]])
+
+    def test_hits_and_misses(self):
+        cache = LUCache(maxsize=2)
+
+        first = cache.get_or_factorize([[1, 2], [3, 4]], (2, 2))
+        assert cache.get_or_factorize([[1, 2], [3, 4]], (2, 2)) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_least_recently_used_eviction(self):
+        cache = LUCache(maxsize=2)
+
+        cache.get_or_factorize([[1]], (1, 1))
+        cache.get_or_factorize([[2]], (1, 1))
+        cache.get_or_factorize([[1]], (1, 1))
+        cache.get_or_factorize([[3]], (1, 1))
+
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.get(coefficient_matrix_key([[2]])) is None
+        assert cache.get(coefficient_matrix_key([[1]])) is not None
+
+        assert cache.stats == {"size": 2, "maxsize": 2, "hits": 2, "misses": 4, "evictions": 1, "hitRatio": 2 / 6}
+
+    def test_disabled(self):
+        cache = LUCache(maxsize=0)
+
+        cache.get_or_factorize([[1]], (1, 1))
+        assert len(cache) == 0
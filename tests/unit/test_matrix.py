@@ -1,7 +1,8 @@
-from app.matrix import Matrix, AugmentedMatrix
+from backend.matrix import Matrix, AugmentedMatrix
 
 from fractions import Fraction
 import random
+import sys
 from copy import deepcopy
 
 # Used for checking if matrices are in REF or RREF.
@@ -54,6 +55,38 @@ class TestElementaryRowOperations():
         assert sample_matrix.data == expected
 
 
+class TestEchelonChecks():
+    def test_is_echelon(self):
+        assert Matrix([[1, 2], [0, 3]], (2, 2)).is_echelon()
+        assert Matrix([[0, 2], [0, 0]], (2, 2)).is_echelon()
+        assert not Matrix([[0, 0], [0, 3]], (2, 2)).is_echelon()
+        assert not Matrix([[0, 1], [1, 0]], (2, 2)).is_echelon()
+        assert not Matrix([[1, 1], [0, 1], [0, 1]], (3, 2)).is_echelon()
+
+    def test_is_reduced_echelon(self):
+        assert Matrix([[1, 0, 2], [0, 1, 3]], (2, 3)).is_reduced_echelon()
+        assert Matrix([[0, 1, 5], [0, 0, 0]], (2, 3)).is_reduced_echelon()
+        assert not Matrix([[1, 2], [0, 1]], (2, 2)).is_reduced_echelon()
+        assert not Matrix([[2, 0], [0, 1]], (2, 2)).is_reduced_echelon()
+        assert not Matrix([[0, 0], [0, 1]], (2, 2)).is_reduced_echelon()
+
+    def test_vary_matrices(self):
+        """Should agree with SymPy on random matrices of mostly 0's and 1's."""
+
+        # Separate generator so the random data of other tests stays the same
+        rng = random.Random(52)
+
+        for i in range(300):
+            m, n = rng.randint(1, 5), rng.randint(1, 5)
+            matrix_data = [list(rng.choice([0, 0, 0, 1, 2]) for _ in range(n)) for _ in range(m)]
+
+            A = Matrix(matrix_data, (m, n))
+            sympy_matrix = SympyMatrix(matrix_data)
+
+            assert A.is_echelon() == sympy_matrix.is_echelon
+            assert A.is_reduced_echelon() == (sympy_matrix == sympy_matrix.rref()[0])
+
+
 class TestGaussianElimination():
 
     # Test Helper Methods for Matrix.gaussian_elimination()
@@ -364,6 +397,190 @@ class TestGaussianElimination():
             B.gaussian_elimination(gauss_jordan=True)
             assert SympyMatrix(B.data) == SympyMatrix(matrix_data).rref()[0]
 
+    def test_gaussian_elimination_more_pivots_than_recursion_limit(self):
+        """
+        Should normalize more pivots than Python's recursion limit
+        allows frames for.
+        """
+
+        n = sys.getrecursionlimit() + 100
+
+        # Ones along the diagonal with a 2 under each of them
+        matrix_data = [[1 if i == j else (2 if j == i - 1 else 0) for j in range(n)] for i in range(n)]
+
+        A = Matrix(matrix_data, (n, n), log_mode="off")
+        A.gaussian_elimination()
+
+        assert len(A._pivot_point_locations) == n
+        assert A.data == [[1 if i == j else 0 for j in range(n)] for i in range(n)]
+
+    def test_reduce_from_echelon(self):
+        """Should give the same RREF as a full gauss-jordan elimination."""
+
+        rng = random.Random(52)
+
+        for i in range(100):
+            m, n = rng.randint(1, 8), rng.randint(1, 8)
+            matrix_data = [[rng.choice([0, rng.randint(-9, 9)]) for _ in range(n)] for _ in range(m)]
+
+            A = Matrix(deepcopy(matrix_data), (m, n))
+            A.gaussian_elimination()
+            A.reduce_from_echelon()
+
+            assert SympyMatrix(A.data) == SympyMatrix(matrix_data).rref()[0]
+
+    def test_reduce_from_echelon_unnormalized_pivots(self):
+        A = AugmentedMatrix([[2, 4, 1], [0, 0, 3]], [[1], [6]], (2, 4))
+        A.reduce_from_echelon()
+
+        assert A.data == [[1, 2, 0], [0, 0, 1]]
+        assert A.constant_matrix == [[Fraction(-1, 2)], [2]]
+
+    def test_reduce_from_echelon_not_echelon(self):
+        A = Matrix([[0, 1], [1, 0]], (2, 2))
+
+        with pytest.raises(ValueError):
+            A.reduce_from_echelon()
+
+
+class TestBareissElimination():
+    def test_integer_entries_until_normalized(self):
+        A = Matrix([[2, 4], [6, 3]], (2, 2))
+        A.bareiss_elimination(gauss_jordan=True)
+
+        assert A.data == [[1, 0], [0, 1]]
+        assert A.action_logger.row_ops_content[0] == [("Starting Matrix",), ("bareiss_elimination",)]
+
+    def test_vary_matrices(self):
+        """Should give the same RREF as gaussian_elimination."""
+
+        # Separate generator so the random data of other tests stays the same
+        rng = random.Random(52)
+
+        for i in range(200):
+            m, n = rng.randint(1, 8), rng.randint(1, 8)
+
+            # Mostly small entries so that rank deficient matrices come up
+            matrix_data = [
+                list(rng.choice([0, 1, -1, 2, rng.randint(-50, 50), Fraction(rng.randint(-9, 9), rng.randint(1, 9))]) for _ in range(n))
+                for _ in range(m)
+            ]
+
+            A = Matrix(deepcopy(matrix_data), (m, n))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            B = Matrix(deepcopy(matrix_data), (m, n))
+            B.bareiss_elimination(gauss_jordan=True)
+            assert B.data == A.data
+            assert B._pivot_point_locations == A._pivot_point_locations
+
+            C = Matrix(deepcopy(matrix_data), (m, n))
+            C.bareiss_elimination()
+            assert C.is_echelon()
+            assert all(C.data[row][column] == 1 for row, column in C._pivot_point_locations.values())
+
+    def test_augmented_matrix(self):
+        coeff_matrix = [
+            [4, 8, 6, 8, 9, 3],
+            [9, 4, 4, 6, 3, 2],
+            [7, 8, 5, 6, 7, 8],
+            [3, 4, 5, 6, 4, 65],
+            [9, 8, 6, 5, 6, 5],
+            [4, 5, 6, 7, 5, 6],
+        ]
+        const_matrix = [[1], [2], [3], [4], [5], [6]]
+
+        A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), dimension=(6, 7))
+        A.gaussian_elimination(gauss_jordan=True)
+
+        B = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), dimension=(6, 7))
+        B.bareiss_elimination(gauss_jordan=True)
+
+        assert B.data == A.data
+        assert B.constant_matrix == A.constant_matrix
+
+
+class TestEliminationByproducts():
+    @pytest.mark.parametrize("elimination", ["gaussian", "gauss_jordan", "bareiss", "bareiss_gauss_jordan"])
+    def test_vary_matrices(self, elimination):
+        """Should give the same determinant and rank as SymPy."""
+
+        rng = random.Random(52)
+
+        for i in range(100):
+            n = rng.randint(1, 6)
+            m = n if i % 4 else rng.randint(1, 6)
+            matrix_data = [[rng.choice([0, 0, 1, -1, 2, 7, Fraction(-3, 4)]) for _ in range(n)] for _ in range(m)]
+
+            A = Matrix(deepcopy(matrix_data), (m, n), log_mode="off")
+
+            if elimination.startswith("bareiss"):
+                A.bareiss_elimination(gauss_jordan=elimination.endswith("gauss_jordan"))
+            else:
+                A.gaussian_elimination(gauss_jordan=elimination == "gauss_jordan")
+
+            assert A.rank() == SympyMatrix(matrix_data).rank()
+            assert A.nullity() == n - A.rank()
+
+            if m == n:
+                assert A.determinant() == SympyMatrix(matrix_data).det()
+
+    def test_determinant_before_elimination(self):
+        A = Matrix([[0, 2], [3, 4]], (2, 2))
+
+        assert A.determinant() == -6
+        assert A.is_echelon()
+
+    def test_determinant_not_square(self):
+        with pytest.raises(ValueError):
+            Matrix([[1, 2]], (1, 2)).determinant()
+
+    def test_inverse(self):
+        matrix_data = [[2, 1, 0], [1, 3, 1], [0, 1, 4]]
+
+        A = Matrix(deepcopy(matrix_data), (3, 3))
+
+        assert SympyMatrix(A.inverse()) == SympyMatrix(matrix_data).inv()
+        assert A.data == matrix_data
+        assert Matrix([[1, 2], [2, 4]], (2, 2)).inverse() is None
+
+
+class TestPivotStrategies():
+    @pytest.mark.parametrize("pivot_strategy", list(Matrix.PIVOT_STRATEGIES))
+    def test_vary_matrices(self, pivot_strategy):
+        """Should give a REF, and the same RREF as SymPy."""
+
+        rng = random.Random(52)
+
+        for i in range(100):
+            m, n = rng.randint(1, 7), rng.randint(1, 7)
+            matrix_data = [[rng.choice([0, 0, 1, -1, rng.randint(-50, 50), Fraction(rng.randint(-9, 9), rng.randint(1, 9))]) for _ in range(n)] for _ in range(m)]
+
+            A = Matrix(deepcopy(matrix_data), (m, n))
+            A.gaussian_elimination(pivot_strategy=pivot_strategy)
+            assert SympyMatrix(A.data).is_echelon
+
+            B = Matrix(deepcopy(matrix_data), (m, n))
+            B.gaussian_elimination(gauss_jordan=True, pivot_strategy=pivot_strategy)
+            assert SympyMatrix(B.data) == SympyMatrix(matrix_data).rref()[0]
+
+    def test_smallest_bit_size(self):
+        matrix_data = [[14, 9], [2, 5]]
+
+        A = Matrix(deepcopy(matrix_data), (2, 2))
+        A.gaussian_elimination()
+
+        B = Matrix(deepcopy(matrix_data), (2, 2))
+        B.gaussian_elimination(pivot_strategy="smallest_bit_size")
+
+        # Dividing by 2 rather than 14 keeps the entries small
+        assert B.data == [[1, Fraction(5, 2)], [0, 1]]
+        assert B.max_entry_bit_length() < A.max_entry_bit_length()
+
+    def test_invalid_pivot_strategy(self):
+        with pytest.raises(ValueError):
+            Matrix([[1, 2], [3, 4]], (2, 2)).gaussian_elimination(pivot_strategy="largest")
+
 
 class TestSolveSystemOfEquations:
 
@@ -507,3 +724,33 @@ class TestSolveSystemOfEquations:
 
         assert aug_matrix.data == expected_coeff_matrix
         assert aug_matrix.constant_matrix == expected_const_matrix
+
+    def test_multiple_constant_vectors(self):
+        coeff_matrix = [
+            [2, 1],
+            [1, 3]
+        ]
+        const_matrix = [[8, 2], [13, 1]]
+        expected_const_matrix = [[Fraction(11, 5), 1], [Fraction(18, 5), 0]]
+
+        aug_matrix = AugmentedMatrix(coeff_matrix, const_matrix, dimension=(2, 4))
+        aug_matrix.gaussian_elimination(gauss_jordan=True)
+
+        assert aug_matrix.data == [[1, 0], [0, 1]]
+        assert aug_matrix.constant_matrix == expected_const_matrix
+
+    def test_inverse_through_identity_constant_matrix(self):
+        coeff_matrix = [
+            [4, 8, 6, 8, 9, 3],
+            [9, 4, 4, 6, 3, 2],
+            [7, 8, 5, 6, 7, 8],
+            [3, 4, 5, 6, 4, 65],
+            [9, 8, 6, 5, 6, 5],
+            [4, 5, 6, 7, 5, 6],
+        ]
+        identity = [[Fraction(int(i == j)) for j in range(6)] for i in range(6)]
+
+        aug_matrix = AugmentedMatrix(deepcopy(coeff_matrix), identity, dimension=(6, 12))
+        aug_matrix.gaussian_elimination(gauss_jordan=True)
+
+        assert SympyMatrix(aug_matrix.constant_matrix) == SympyMatrix(coeff_matrix).inv()
@@ -0,0 +1,133 @@
+from backend.matrix import Matrix, AugmentedMatrix
+from backend.matrix_action_logger import RowOperation
+
+from fractions import Fraction
+import random
+from copy import deepcopy
+
+import pytest
+
+
+# Set seed to ensure reproducibility of tests
+random.seed(52)
+
+
+class TestDeltaEncodedLog():
+    @pytest.fixture
+    def sample_coefficient_matrix(self):
+        return [
+            [0, 1, -1],
+            [-3, -1, 2],
+            [-2, 1, 2]
+        ]
+
+    @pytest.fixture
+    def sample_constant_matrix(self):
+        return [[Fraction(1)], [Fraction(2)], [Fraction(3)]]
+
+    def test_invalid_log_mode(self, sample_coefficient_matrix):
+        with pytest.raises(ValueError):
+            Matrix(sample_coefficient_matrix, (3, 3), log_mode="invalid")
+
+    def test_only_touched_rows_are_stored(self, sample_coefficient_matrix, sample_constant_matrix):
+        A = AugmentedMatrix(sample_coefficient_matrix, sample_constant_matrix, dimension=(3, 4), log_mode="delta")
+
+        A.swap_rows(0, 1)
+        A.multiply_row(2, 3)
+        A.row_multiple_to_row(1, 2, 0)
+
+        # Starting matrix holds every row
+        assert list(A.action_logger.row_deltas[0].keys()) == [0, 1, 2]
+        assert list(A.action_logger.row_deltas[1].keys()) == [0, 1]
+        assert list(A.action_logger.row_deltas[2].keys()) == [2]
+        assert list(A.action_logger.row_deltas[3].keys()) == [1]
+
+    def test_materialized_view_matches_snapshots(self, sample_coefficient_matrix, sample_constant_matrix):
+        A = AugmentedMatrix(deepcopy(sample_coefficient_matrix), deepcopy(sample_constant_matrix), dimension=(3, 4))
+        A.gaussian_elimination(gauss_jordan=True)
+
+        B = AugmentedMatrix(deepcopy(sample_coefficient_matrix), deepcopy(sample_constant_matrix), dimension=(3, 4), log_mode="delta")
+        B.gaussian_elimination(gauss_jordan=True)
+
+        assert B.action_logger.row_ops_content == A.action_logger.row_ops_content
+
+    def test_snapshot(self, sample_coefficient_matrix, sample_constant_matrix):
+        A = AugmentedMatrix(deepcopy(sample_coefficient_matrix), deepcopy(sample_constant_matrix), dimension=(3, 4))
+        A.gaussian_elimination()
+
+        B = AugmentedMatrix(deepcopy(sample_coefficient_matrix), deepcopy(sample_constant_matrix), dimension=(3, 4), log_mode="delta")
+        B.gaussian_elimination()
+
+        for step in range(len(A.action_logger.row_ops_content[0])):
+            assert B.action_logger.snapshot(step) == A.action_logger.snapshot(step)
+
+    def test_vary_matrices(self):
+        """Delta logs should materialize into the same steps as snapshot logs."""
+
+        for i in range(50):
+            m, n = random.randint(1, 10), random.randint(1, 10)
+            matrix_data = [list(random.randint(-100, 100) for _ in range(n)) for _ in range(m)]
+
+            A = Matrix(deepcopy(matrix_data), (m, n))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            B = Matrix(deepcopy(matrix_data), (m, n), log_mode="delta")
+            B.gaussian_elimination(gauss_jordan=True)
+
+            assert B.action_logger.row_ops_content == A.action_logger.row_ops_content
+
+
+class TestRowOperationRecords():
+    @pytest.fixture
+    def sample_matrix(self):
+        return AugmentedMatrix([
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 9]
+        ], [[1], [2], [3]], dimension=(3, 4))
+
+    def test_records(self, sample_matrix):
+        sample_matrix.swap_rows(0, 1)
+        sample_matrix.multiply_row(2, Fraction(1, 7))
+        sample_matrix.row_multiple_to_row(1, -4, 0)
+
+        assert sample_matrix.action_logger.row_ops == [
+            RowOperation("swap_rows", 0, other_row=1),
+            RowOperation("multiply_row", 2, scalar=Fraction(1, 7)),
+            RowOperation("row_multiple_to_row", 1, scalar=-4, other_row=0)
+        ]
+
+        assert sample_matrix.action_logger.row_ops_content[0] == [
+            ("Starting Matrix",),
+            ("swap_rows", "1", "2"),
+            ("multiply_row", "3", "1/7"),
+            ("row_multiple_to_row", "2", "-4", "1")
+        ]
+
+    def test_logging_off(self):
+        A = AugmentedMatrix([[2, 1], [1, 3]], [[8], [13]], dimension=(2, 3), log_mode="off")
+        A.gaussian_elimination(gauss_jordan=True)
+
+        assert A.data == [[1, 0], [0, 1]]
+        assert A.constant_matrix == [[Fraction(11, 5)], [Fraction(18, 5)]]
+        assert A.action_logger.row_ops == []
+        assert A.action_logger.row_ops_content == [[], [], []]
+
+    @pytest.mark.parametrize("log_mode", ["snapshot", "delta", "ops"])
+    def test_listener(self, sample_matrix, log_mode):
+        A = AugmentedMatrix([[2, 1], [1, 3]], [[8], [13]], dimension=(2, 3), log_mode=log_mode)
+
+        calls = []
+        A.action_logger.add_listener(lambda row_op, touched_rows: calls.append((row_op, touched_rows)))
+
+        A.swap_rows(0, 1)
+        A.multiply_row(1, Fraction(1, 2))
+
+        assert calls == [
+            (RowOperation("swap_rows", 0, other_row=1), {0: (["1", "3"], ["13"]), 1: (["2", "1"], ["8"])}),
+            (RowOperation("multiply_row", 1, scalar=Fraction(1, 2)), {1: (["1", "1/2"], ["4"])}),
+        ]
+
+        A.action_logger.remove_listener(A.action_logger.listeners[0])
+        A.swap_rows(0, 1)
+        assert len(calls) == 2
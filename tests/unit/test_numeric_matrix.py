@@ -0,0 +1,105 @@
+from backend.matrix import Matrix
+from backend.numeric_matrix import NumericMatrix, NumericAugmentedMatrix
+
+from fractions import Fraction
+import random
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+
+class TestNumericElementaryRowOperations():
+    @pytest.fixture
+    def sample_matrix(self):
+        return NumericMatrix([
+            [1, 2, 3],
+            [4, 5, 6],
+            [7, 8, 9]
+        ], (3, 3), log_mode="snapshot")
+
+    def test_swap_rows(self, sample_matrix):
+        sample_matrix.swap_rows(0, 1)
+
+        assert sample_matrix.data.tolist() == [[4, 5, 6], [1, 2, 3], [7, 8, 9]]
+        assert sample_matrix.action_logger.row_ops_content[0][-1] == ("swap_rows", "1", "2")
+
+    def test_multiply_row(self, sample_matrix):
+        sample_matrix.multiply_row(0, 0.5)
+
+        assert sample_matrix.data.tolist() == [[0.5, 1, 1.5], [4, 5, 6], [7, 8, 9]]
+        assert sample_matrix.action_logger.row_ops_content[1][-1][0] == ["0.5", "1.0", "1.5"]
+
+    def test_add_multiple_of_row(self, sample_matrix):
+        sample_matrix.row_multiple_to_row(2, -7, 0)
+
+        assert sample_matrix.data.tolist() == [[1, 2, 3], [4, 5, 6], [0, -6, -12]]
+
+
+class TestNumericGaussianElimination():
+    def test_partial_pivoting(self):
+        # A tiny first pivot would lose all precision without pivoting
+        A = NumericAugmentedMatrix([[1e-20, 1], [1, 1]], [[1], [2]], dimension=(2, 3), log_mode="delta")
+        A.gaussian_elimination(gauss_jordan=True)
+
+        assert np.allclose(A.constant_matrix, [[1], [1]])
+        assert A.action_logger.row_ops_content[0][1] == ("swap_rows", "1", "2")
+
+    def test_vary_matrices(self):
+        """Should give the same RREF as the exact engine, up to rounding."""
+
+        rng = random.Random(52)
+
+        for i in range(100):
+            m, n = rng.randint(1, 8), rng.randint(1, 8)
+            matrix_data = [list(rng.choice([0, 1, -1, 2, rng.randint(-50, 50)]) for _ in range(n)) for _ in range(m)]
+
+            A = Matrix(deepcopy(matrix_data), (m, n))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            # Logged and vectorized elimination
+            for log_mode in ("delta", "off"):
+                B = NumericMatrix(matrix_data, (m, n), log_mode=log_mode)
+                B.gaussian_elimination(gauss_jordan=True)
+
+                assert np.allclose(B.data, np.array(A.data, dtype=np.float64))
+
+    def test_elimination_byproducts(self):
+        rng = np.random.default_rng(52)
+        matrix_data = rng.standard_normal((50, 50))
+
+        A = NumericMatrix(matrix_data, (50, 50))
+        A.gaussian_elimination()
+
+        assert A.rank() == 50
+        assert np.isclose(A.determinant(), np.linalg.det(matrix_data))
+        assert np.allclose(NumericMatrix(matrix_data, (50, 50)).inverse(), np.linalg.inv(matrix_data))
+
+        B = NumericMatrix([[1, 2], [2, 4]], (2, 2))
+
+        assert B.rank() == 1
+        assert B.determinant() == 0
+        assert B.inverse() is None
+
+    def test_solve_large_system(self):
+        rng = np.random.default_rng(52)
+        coefficient_matrix = rng.standard_normal((300, 300))
+        solution = rng.standard_normal(300)
+
+        A = NumericAugmentedMatrix(coefficient_matrix, (coefficient_matrix @ solution).reshape(300, 1), dimension=(300, 301))
+        A.gaussian_elimination(gauss_jordan=True)
+
+        assert np.allclose(A.data, np.identity(300))
+        assert np.allclose(A.constant_matrix[:, 0], solution)
+
+    def test_fraction_entries(self):
+        A = NumericAugmentedMatrix([[Fraction(1, 2), 0], [0, 4]], [[Fraction(1, 4)], [1]], dimension=(2, 3))
+        A.gaussian_elimination(gauss_jordan=True)
+
+        assert A.constant_matrix.tolist() == [[0.5], [0.25]]
+
+    def test_multiple_constant_vectors(self):
+        A = NumericAugmentedMatrix([[2, 1], [1, 3]], [[8, 1, 0], [13, 0, 1]], dimension=(2, 5))
+        A.gaussian_elimination(gauss_jordan=True)
+
+        assert np.allclose(A.constant_matrix, [[2.2, 0.6, -0.2], [3.6, -0.2, 0.4]])
@@ -0,0 +1,85 @@
+from backend.result_cache import FileCacheBackend, MemoryCacheBackend, ResultCache, canonical_key
+
+from fractions import Fraction
+import time
+
+import pytest
+
+
+class TestCanonicalKey():
+    def test_equal_entries(self):
+        key = canonical_key([[1, 2], [3, 4]], [[5], [6]], "gaussian-elimination", "step-logged")
+
+        assert canonical_key([["1", "4/2"], [3.0, Fraction(4)]], [[5], ["6"]], "gaussian-elimination", "step-logged") == key
+        assert canonical_key([[1, 2], [3, 4]], [[5], [6]], "gauss-jordan-elimination", "step-logged") != key
+        assert canonical_key([[1, 2], [3, 4]], [[5], [6]], "gaussian-elimination", "exact") != key
+        assert canonical_key([[1, 2, 3, 4]], [[5, 6]], "gaussian-elimination", "step-logged") != key
+        assert canonical_key([[1, 2], [3, 4]], [[5], [6]], "gaussian-elimination", "step-logged", "markowitz") != key
+
+
+class TestMemoryCacheBackend():
+    def test_byte_cap(self):
+        backend = MemoryCacheBackend(max_bytes=20)
+
+        backend.set("a", b"123456789")
+        backend.set("b", b"123456789")
+        assert backend.size_bytes == 20
+
+        # Least recently used value goes first
+        backend.get("a")
+        backend.set("c", b"123")
+        assert backend.get("b") is None
+        assert backend.get("a") == b"123456789"
+        assert backend.size_bytes == 14
+
+        # Too large to ever be stored
+        backend.set("d", b"0" * 20)
+        assert backend.get("d") is None
+        assert len(backend) == 2
+
+
+class TestFileCacheBackend():
+    def test_byte_cap(self, tmp_path):
+        backend = FileCacheBackend(str(tmp_path), max_bytes=20)
+
+        backend.set("a", b"0123456789")
+        assert backend.get("a") == b"0123456789"
+
+        backend.set("b", b"0123456789")
+        backend.set("c", b"0123456789")
+        assert len(backend) == 2
+        assert backend.size_bytes == 20
+
+        backend.clear()
+        assert len(backend) == 0
+
+
+class TestResultCache():
+    @pytest.fixture(params=["memory", "file"])
+    def backend(self, request, tmp_path):
+        if request.param == "memory":
+            return MemoryCacheBackend(max_bytes=1024)
+
+        return FileCacheBackend(str(tmp_path), max_bytes=1024)
+
+    def test_hits_and_misses(self, backend):
+        cache = ResultCache(backend)
+
+        assert cache.get("key") is None
+        cache.set("key", [[["Starting Matrix"]], [[["1"]]], [None]])
+        assert cache.get("key") == [[["Starting Matrix"]], [[["1"]]], [None]]
+
+        stats = cache.stats
+        assert (stats["hits"], stats["misses"], stats["hitRatio"]) == (1, 1, 0.5)
+        assert stats["entries"] == 1
+        assert stats["bytes"] > 0
+
+    def test_ttl(self, backend, monkeypatch):
+        cache = ResultCache(backend, ttl=10)
+        cache.set("key", "result")
+
+        now = time.time()
+        monkeypatch.setattr("backend.result_cache.time.time", lambda: now + 11)
+
+        assert cache.get("key") is None
+        assert len(backend) == 0
@@ -0,0 +1,145 @@
+from backend.matrix import Matrix, AugmentedMatrix
+from backend.row_storage import RationalRow, SparseRow
+
+from fractions import Fraction
+import random
+from copy import deepcopy
+
+import pytest
+
+
+class TestRationalRow():
+    @pytest.fixture
+    def sample_row(self):
+        return RationalRow([Fraction(1, 2), Fraction(-2, 3), 4])
+
+    def test_common_denominator(self, sample_row):
+        assert sample_row.numerators == [3, -4, 24]
+        assert sample_row.denominator == 6
+        assert sample_row == [Fraction(1, 2), Fraction(-2, 3), 4]
+
+    def test_scale(self, sample_row):
+        sample_row.scale(Fraction(-6, 5))
+
+        assert sample_row == [Fraction(-3, 5), Fraction(4, 5), Fraction(-24, 5)]
+
+    def test_add_multiple(self, sample_row):
+        sample_row.add_multiple(RationalRow([1, Fraction(1, 3), 0]), Fraction(-1, 2))
+
+        assert sample_row == [0, Fraction(-5, 6), 4]
+
+    def test_lazy_normalization(self, sample_row):
+        sample_row.scale(4)
+
+        # Numerators are only reduced once the row is read
+        assert sample_row.numerators == [12, -16, 96]
+        assert sample_row.denominator == 6
+        assert sample_row[1] == Fraction(-8, 3)
+        assert sample_row.numerators == [6, -8, 48]
+        assert sample_row.denominator == 3
+
+    def test_slice(self, sample_row):
+        assert sample_row[1:] == [Fraction(-2, 3), 4]
+
+
+class TestCommonDenominatorMatrix():
+    def test_invalid_row_storage(self):
+        with pytest.raises(ValueError):
+            Matrix([[1]], (1, 1), row_storage="invalid")
+
+    def test_vary_matrices(self):
+        """Should take the same steps as a matrix of Fraction lists."""
+
+        rng = random.Random(52)
+
+        for i in range(100):
+            m, n = rng.randint(1, 8), rng.randint(1, 8)
+            matrix_data = [
+                list(rng.choice([0, 1, -1, rng.randint(-50, 50), Fraction(rng.randint(-9, 9), rng.randint(1, 9))]) for _ in range(n))
+                for _ in range(m)
+            ]
+            constant_data = [[rng.randint(-9, 9)] for _ in range(m)]
+
+            A = AugmentedMatrix(deepcopy(matrix_data), deepcopy(constant_data), dimension=(m, n + 1))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            B = AugmentedMatrix(deepcopy(matrix_data), deepcopy(constant_data), dimension=(m, n + 1), row_storage="common_denominator")
+            B.gaussian_elimination(gauss_jordan=True)
+
+            assert B.data == A.data
+            assert B.constant_matrix == A.constant_matrix
+            assert B.action_logger.row_ops_content == A.action_logger.row_ops_content
+
+
+class TestSparseRow():
+    @pytest.fixture
+    def sample_row(self):
+        return SparseRow([0, Fraction(1, 2), 0, -3])
+
+    def test_only_nonzeros_stored(self, sample_row):
+        assert sample_row.entries == {1: Fraction(1, 2), 3: -3}
+        assert sample_row == [0, Fraction(1, 2), 0, -3]
+        assert sample_row[-1] == -3
+        assert sample_row[1:3] == [Fraction(1, 2), 0]
+
+    def test_add_multiple(self, sample_row):
+        sample_row.add_multiple(SparseRow([1, 1, 0, 0]), Fraction(-1, 2))
+
+        # Cancelled entries are dropped
+        assert sample_row.entries == {0: Fraction(-1, 2), 3: -3}
+
+    def test_scale(self, sample_row):
+        sample_row.scale(-2)
+
+        assert sample_row == [0, -1, 0, 6]
+
+
+class TestSparseMatrix():
+    def test_vary_matrices(self):
+        """Should take the same steps as a matrix of Fraction lists."""
+
+        rng = random.Random(52)
+
+        for i in range(100):
+            m, n = rng.randint(1, 8), rng.randint(1, 8)
+            matrix_data = [
+                list(rng.choice([0, 0, 0, 1, -1, rng.randint(-50, 50), Fraction(rng.randint(-9, 9), rng.randint(1, 9))]) for _ in range(n))
+                for _ in range(m)
+            ]
+            constant_data = [[rng.randint(-9, 9)] for _ in range(m)]
+
+            A = AugmentedMatrix(deepcopy(matrix_data), deepcopy(constant_data), dimension=(m, n + 1))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            B = AugmentedMatrix(deepcopy(matrix_data), deepcopy(constant_data), dimension=(m, n + 1), row_storage="sparse")
+            B.gaussian_elimination(gauss_jordan=True)
+
+            assert B.data == A.data
+            assert B.constant_matrix == A.constant_matrix
+            assert B.action_logger.row_ops_content == A.action_logger.row_ops_content
+
+            C = AugmentedMatrix(deepcopy(matrix_data), deepcopy(constant_data), dimension=(m, n + 1), row_storage="sparse")
+            C.bareiss_elimination(gauss_jordan=True)
+            assert C.data == A.data
+            assert all(isinstance(row, SparseRow) for row in C.data)
+
+    def test_markowitz(self):
+        # Arrow matrix, eliminating with the dense first row fills in
+        # every row below it
+        n = 6
+        matrix_data = [[1] * n] + [[1] + [0] * (row - 1) + [2] + [0] * (n - row - 1) for row in range(1, n)]
+
+        A = Matrix(deepcopy(matrix_data), (n, n), row_storage="sparse")
+        A.gaussian_elimination(gauss_jordan=True)
+
+        B = Matrix(deepcopy(matrix_data), (n, n), row_storage="sparse", log_mode="off")
+        B.gaussian_elimination(gauss_jordan=True, pivot_strategy="markowitz")
+        assert B.data == A.data
+
+        C = Matrix(deepcopy(matrix_data), (n, n), row_storage="sparse", log_mode="off")
+        C.gaussian_elimination(pivot_strategy="markowitz")
+
+        # First pivot row is one of the sparse ones, which only fills in
+        # the dense row
+        assert C.data[0] == [1, 2, 0, 0, 0, 0]
+        assert sum(row.num_nonzeros for row in C.data) < n * (n + 1) // 2
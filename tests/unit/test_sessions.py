@@ -0,0 +1,207 @@
+from backend.matrix import AugmentedMatrix
+from backend.sessions import EliminationSession, SessionStore
+
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from fractions import Fraction
+import random
+
+
+def echelon_session(matrix):
+    matrix.gaussian_elimination()
+
+    return EliminationSession(matrix, "step-logged", "general", "key", matrix.action_logger.row_ops_content)
+
+
+class TestEliminationSession():
+    def test_reduce(self):
+        coeff_matrix = [[1, 2, 3], [2, 5, 3], [1, 0, 8]]
+        const_matrix = [[1], [2], [3]]
+
+        A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (3, 4), log_mode="delta")
+        session = echelon_session(A)
+        num_ref_steps = len(session.row_ops_content[0])
+
+        content = session.reduce(lambda session: session.matrix.action_logger.row_ops_content)
+
+        B = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (3, 4), log_mode="delta")
+        B.gaussian_elimination(gauss_jordan=True)
+
+        # Steps of the upward phase are appended to those of the REF
+        assert content == B.action_logger.row_ops_content
+        assert content[0][:num_ref_steps] == session.row_ops_content[0]
+        assert A.data == B.data
+
+    def test_reduce_once(self):
+        A = AugmentedMatrix([[1, 2], [3, 4]], [[1], [2]], (2, 3))
+        session = echelon_session(A)
+
+        calls = []
+
+        def build_content(session):
+            calls.append(session)
+            return {"data": session.matrix.data}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: session.reduce(build_content), range(8)))
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert A.data == [[1, 0], [0, 1]]
+
+    def test_resolve_vary_systems(self):
+        """Should give the same REF and RREF as a fresh elimination."""
+
+        rng = random.Random(52)
+        num_reused = 0
+
+        for i in range(200):
+            m, n = rng.randint(1, 6), rng.randint(1, 6)
+            coeff_matrix = [[Fraction(rng.choice([0, 0, 1, -2, 3, 5])) for _ in range(n)] for _ in range(m)]
+            const_matrix = [[Fraction(rng.randint(-9, 9))] for _ in range(m)]
+            gauss_jordan = rng.choice([False, True])
+
+            A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode="delta")
+            A.gaussian_elimination(gauss_jordan=rng.choice([False, True]))
+            session = EliminationSession(A, "step-logged", "general", "key", A.action_logger.row_ops_content)
+
+            changed_columns = set()
+            for _ in range(rng.randint(1, 2)):
+                row, column = rng.randrange(m), rng.randrange(n + 1)
+
+                if column < n:
+                    coeff_matrix[row][column] = Fraction(rng.randint(-9, 9))
+                    changed_columns.add(column)
+                else:
+                    const_matrix[row][0] = Fraction(rng.randint(-9, 9))
+
+            B = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode="delta")
+            steps_reused = session.resolve(B, changed_columns, gauss_jordan=gauss_jordan)
+
+            C = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode="delta")
+            C.gaussian_elimination(gauss_jordan=gauss_jordan)
+
+            if steps_reused is None:
+                continue
+
+            num_reused += steps_reused > 0
+
+            if gauss_jordan:
+                assert B.data == C.data
+            else:
+                assert B.is_echelon()
+                assert sorted(B._pivot_point_locations.values()) == sorted(C._pivot_point_locations.values())
+
+            assert B.solve()["solutions"] == C.solve()["solutions"]
+
+            # Every logged step, replayed or not, leads up to the final matrix
+            row_ops_content = B.action_logger.row_ops_content
+            assert row_ops_content[1][0] == B.action_logger.deepcopy_matrix_to_str(coeff_matrix)
+            assert row_ops_content[1][-1] == B.action_logger.deepcopy_matrix_to_str(B.data)
+            assert row_ops_content[2][-1] == B.action_logger.deepcopy_matrix_to_str(B.constant_matrix)
+
+            D = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + 1), log_mode="off")
+            for row_op in B.action_logger.row_ops:
+                if row_op.name == "swap_rows":
+                    D.swap_rows(row_op.row, row_op.other_row)
+                elif row_op.name == "multiply_row":
+                    D.multiply_row(row_op.row, row_op.scalar)
+                else:
+                    D.row_multiple_to_row(row_op.row, row_op.scalar, row_op.other_row)
+
+            assert D.data == B.data and D.constant_matrix == B.constant_matrix
+
+        assert num_reused > 50
+
+    def test_resolve_constants(self):
+        """Edited constants should reuse every step before the zero rows are moved."""
+
+        A = AugmentedMatrix([[0, 2, 4], [1, 1, 1], [2, 2, 2]], [[2], [1], [2]], (3, 4), log_mode="delta")
+        session = echelon_session(A)
+
+        B = AugmentedMatrix([[0, 2, 4], [1, 1, 1], [2, 2, 2]], [[2], [1], [5]], (3, 4), log_mode="delta")
+        steps_reused = session.resolve(B, set())
+
+        assert steps_reused == A._pivot_steps[2] == len(A.action_logger.row_ops)
+        assert B.data == A.data
+        assert B.constant_matrix == [[1], [1], [3]]
+
+    def test_resolve_pivot_strategy(self):
+        """Should go on picking pivots the way the session did."""
+
+        coeff_matrix = [[14, 9, 1], [2, 5, 3], [6, 4, 7]]
+        const_matrix = [[1], [2], [3]]
+
+        A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (3, 4), log_mode="delta")
+        A.gaussian_elimination(pivot_strategy="smallest_bit_size")
+        session = EliminationSession(
+            A, "step-logged", "general", "key", A.action_logger.row_ops_content, pivot_strategy="smallest_bit_size"
+        )
+
+        coeff_matrix[2][2] = 9
+
+        B = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (3, 4), log_mode="delta")
+        assert session.resolve(B, {2}) > 0
+
+        # Pivots only depend on the columns up to their own, so a fresh
+        # elimination takes the same steps
+        C = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (3, 4), log_mode="delta")
+        C.gaussian_elimination(pivot_strategy="smallest_bit_size")
+
+        assert B.data == C.data
+        assert B.constant_matrix == C.constant_matrix
+        assert B.action_logger.row_ops == C.action_logger.row_ops
+
+
+class TestSessionStore():
+    def test_create_and_get(self):
+        store = SessionStore(maxsize=2)
+        session = echelon_session(AugmentedMatrix([[1]], [[1]], (1, 2)))
+
+        solve_id = store.create(session)
+
+        assert store.get(solve_id) is session
+        assert store.get("unknown") is None
+        assert store.stats == {"size": 1, "maxsize": 2, "bytes": 0, "maxBytes": None, "hits": 1, "misses": 1, "evictions": 0}
+
+    def test_evict_least_recently_used(self):
+        store = SessionStore(maxsize=2)
+        sessions = [echelon_session(AugmentedMatrix([[i + 1]], [[1]], (1, 2))) for i in range(3)]
+
+        first_id = store.create(sessions[0])
+        second_id = store.create(sessions[1])
+        store.get(first_id)
+        third_id = store.create(sessions[2])
+
+        assert store.get(second_id) is None
+        assert store.get(first_id) is sessions[0]
+        assert store.get(third_id) is sessions[2]
+        assert store.evictions == 1
+
+    def test_max_bytes(self):
+        """Sessions should be evicted once they take more than max_bytes, and larger ones never kept."""
+
+        sessions = [echelon_session(AugmentedMatrix([[i + 1, 2], [3, 4]], [[1], [2]], (2, 3), log_mode="delta")) for i in range(3)]
+        num_bytes = max(session.approximate_nbytes() for session in sessions)
+
+        store = SessionStore(max_bytes=2 * num_bytes)
+        solve_ids = [store.create(session) for session in sessions]
+
+        assert store.get(solve_ids[0]) is None
+        assert store.get(solve_ids[2]) is sessions[2]
+        assert 0 < store.stats["bytes"] <= 2 * num_bytes
+
+        assert SessionStore(max_bytes=num_bytes // 2).create(sessions[0]) is None
+
+    def test_expired(self):
+        store = SessionStore(ttl=-1)
+        solve_id = store.create(echelon_session(AugmentedMatrix([[1]], [[1]], (1, 2))))
+
+        assert store.get(solve_id) is None
+        assert len(store) == 0
+
+    def test_off(self):
+        store = SessionStore(maxsize=0)
+
+        assert store.create(echelon_session(AugmentedMatrix([[1]], [[1]], (1, 2)))) is None
+        assert len(store) == 0
@@ -0,0 +1,58 @@
+from backend.single_flight import SingleFlight
+
+from threading import Event, Thread
+
+import pytest
+
+
+class TestSingleFlight():
+    def test_concurrent_calls_share_result(self):
+        single_flight = SingleFlight()
+        started = Event()
+        release = Event()
+        calls = []
+
+        def solve():
+            calls.append(1)
+            started.set()
+            release.wait()
+            return "result"
+
+        results = []
+        leader = Thread(target=lambda: results.append(single_flight.do("key", solve)))
+        leader.start()
+        started.wait()
+
+        waiters = [Thread(target=lambda: results.append(single_flight.do("key", solve))) for _ in range(4)]
+        for waiter in waiters:
+            waiter.start()
+
+        # Every waiter has to be waiting before the leader finishes
+        while single_flight.stats["waiting"] < 4:
+            pass
+
+        release.set()
+        for thread in [leader] + waiters:
+            thread.join()
+
+        assert results == ["result"] * 5
+        assert len(calls) == 1
+        assert single_flight.stats == {"executions": 1, "deduplicated": 4, "inFlight": 0, "waiting": 0}
+
+    def test_sequential_calls_run_again(self):
+        single_flight = SingleFlight()
+
+        assert single_flight.do("key", lambda: 1) == 1
+        assert single_flight.do("key", lambda: 2) == 2
+        assert single_flight.stats["executions"] == 2
+
+    def test_error(self):
+        single_flight = SingleFlight()
+
+        def solve():
+            raise ValueError("Invalid")
+
+        with pytest.raises(ValueError):
+            single_flight.do("key", solve)
+
+        assert single_flight.stats["inFlight"] == 0
@@ -0,0 +1,80 @@
+from backend.matrix import AugmentedMatrix
+from backend.numeric_matrix import NumericAugmentedMatrix
+
+from copy import deepcopy
+from fractions import Fraction
+import random
+
+import numpy as np
+
+
+def multiply(matrix_data, vector):
+    return [sum(Fraction(entry) * value for entry, value in zip(row, vector)) for row in matrix_data]
+
+
+class TestSolve():
+    def test_unique_solution(self):
+        A = AugmentedMatrix([[2, 1], [1, 3]], [[8], [13]], (2, 3))
+        solution = A.solve()
+
+        assert solution == {
+            "freeVariables": [],
+            "nullspace": [],
+            "solutions": [{"consistent": True, "particular": [Fraction(11, 5), Fraction(18, 5)]}]
+        }
+
+        # Stops at REF
+        assert A.is_echelon()
+        assert not A.is_reduced_echelon()
+
+    def test_free_variables(self):
+        A = AugmentedMatrix([[1, 2, 0, 1], [0, 0, 1, 3]], [[4], [5]], (2, 5))
+        solution = A.solve()
+
+        assert solution["freeVariables"] == [1, 3]
+        assert solution["nullspace"] == [[-2, 1, 0, 0], [-1, 0, -3, 1]]
+        assert solution["solutions"][0]["particular"] == [4, 0, 5, 0]
+
+    def test_inconsistent(self):
+        A = AugmentedMatrix([[1, 2], [2, 4]], [[1, 1], [2, 3]], (2, 4))
+        solution = A.solve()
+
+        assert solution["solutions"] == [
+            {"consistent": True, "particular": [1, 0]},
+            {"consistent": False, "particular": None},
+        ]
+
+    def test_vary_systems(self):
+        rng = random.Random(52)
+
+        for i in range(200):
+            m, n, k = rng.randint(1, 6), rng.randint(1, 6), rng.randint(1, 2)
+            coeff_matrix = [[rng.choice([0, 1, -1, rng.randint(-9, 9), Fraction(rng.randint(-9, 9), rng.randint(1, 9))]) for _ in range(n)] for _ in range(m)]
+            const_matrix = [[rng.randint(-9, 9) for _ in range(k)] for _ in range(m)]
+
+            A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + k))
+            solution = A.solve()
+
+            for vector in solution["nullspace"]:
+                assert multiply(coeff_matrix, vector) == [0] * m
+
+            B = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (m, n + k))
+            B.gaussian_elimination(gauss_jordan=True)
+
+            rank = sum(1 for row in B.data if any(row))
+            assert len(solution["freeVariables"]) == n - rank
+
+            for column, constant_solution in enumerate(solution["solutions"]):
+                consistent = all(row[column] == 0 for row in B.constant_matrix[rank:])
+                assert constant_solution["consistent"] == consistent
+
+                if consistent:
+                    assert multiply(coeff_matrix, constant_solution["particular"]) == [row[column] for row in const_matrix]
+
+    def test_numeric(self):
+        A = NumericAugmentedMatrix([[2, 1, 1], [4, 2, 2]], [[3], [6]], (2, 4))
+        solution = A.solve()
+
+        assert solution["freeVariables"] == [1, 2]
+        assert np.allclose(solution["solutions"][0]["particular"], [1.5, 0, 0])
+        assert np.allclose(solution["nullspace"], [[-0.5, 1, 0], [-0.5, 0, 1]])
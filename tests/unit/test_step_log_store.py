@@ -0,0 +1,104 @@
+from backend.matrix import AugmentedMatrix
+from backend.result_cache import FileCacheBackend, MemoryCacheBackend
+from backend.step_log_store import StepLog, StepLogStore
+from backend.streaming import encode_row_deltas
+
+from fractions import Fraction
+import random
+
+import pytest
+
+
+def solved_row_ops_content(rng, m, n):
+    coeff_matrix = [[rng.choice([0, 1, -2, 3, Fraction(1, 2)]) for _ in range(n)] for _ in range(m)]
+    const_matrix = [[rng.randint(-9, 9)] for _ in range(m)]
+
+    A = AugmentedMatrix(coeff_matrix, const_matrix, (m, n + 1), log_mode="delta")
+    A.gaussian_elimination(gauss_jordan=True)
+
+    return A.action_logger.row_ops_content
+
+
+def as_lists(row_ops_content):
+    # Row operations go through JSON as lists rather than tuples
+    return [[list(row_op_info) for row_op_info in row_ops_content[0]], row_ops_content[1], row_ops_content[2]]
+
+
+class TestStepLog():
+    @pytest.mark.parametrize("checkpoint_interval", [1, 3, 32])
+    def test_vary_ranges(self, checkpoint_interval):
+        """Every range of steps should match the row operations content."""
+
+        rng = random.Random(52)
+
+        for i in range(20):
+            row_ops_content = as_lists(solved_row_ops_content(rng, rng.randint(1, 5), rng.randint(1, 5)))
+            step_log = StepLog(encode_row_deltas(row_ops_content), checkpoint_interval=checkpoint_interval)
+
+            num_steps = len(row_ops_content[0])
+            assert step_log.num_steps == num_steps
+            assert step_log.row_op_infos == row_ops_content[0]
+
+            for _ in range(10):
+                start = rng.randrange(num_steps)
+                stop = rng.randint(start, num_steps)
+
+                assert step_log.steps(start, stop) == [part[start:stop] for part in row_ops_content]
+
+    def test_invalid_range(self):
+        step_log = StepLog(encode_row_deltas([[("Starting Matrix",)], [[["1"]]], [[["2"]]]]))
+
+        with pytest.raises(ValueError):
+            step_log.steps(0, 2)
+
+    def test_bytes(self):
+        row_ops_content = as_lists(solved_row_ops_content(random.Random(52), 4, 4))
+        step_log = StepLog(encode_row_deltas(row_ops_content), checkpoint_interval=2)
+
+        loaded = StepLog.from_bytes(step_log.to_bytes())
+
+        assert loaded.checkpoint_interval == 2
+        assert loaded.steps(0, loaded.num_steps) == row_ops_content
+
+
+class TestStepLogStore():
+    @pytest.fixture
+    def step_log(self):
+        return StepLog(encode_row_deltas(as_lists(solved_row_ops_content(random.Random(52), 3, 3))))
+
+    def test_evict_least_recently_used(self, step_log):
+        store = StepLogStore(maxsize=2)
+
+        first = store.create(step_log)
+        second = store.create(step_log)
+        store.get(first)
+        store.create(step_log, "third")
+
+        assert store.get(second) is None
+        assert store.get(first) is step_log
+        assert store.get("third") is step_log
+        assert store.stats["misses"] == 1
+
+    @pytest.mark.parametrize("spill_backend", ["memory", "file"])
+    def test_spill(self, step_log, spill_backend, tmp_path):
+        if spill_backend == "memory":
+            spill_backend = MemoryCacheBackend(max_bytes=1024 * 1024)
+        else:
+            spill_backend = FileCacheBackend(str(tmp_path), max_bytes=1024 * 1024)
+
+        store = StepLogStore(maxsize=1, spill_backend=spill_backend)
+
+        first = store.create(step_log)
+        store.create(step_log)
+
+        assert len(store) == 1
+        assert store.stats["spills"] == 1
+
+        # Read back from the spill backend, evicting the other step log
+        loaded = store.get(first)
+        assert loaded.steps(0, loaded.num_steps) == step_log.steps(0, step_log.num_steps)
+        assert store.stats["spillHits"] == 1
+        assert store.stats["spills"] == 2
+
+    def test_off(self, step_log):
+        assert StepLogStore(maxsize=0).create(step_log) is None
@@ -0,0 +1,130 @@
+from backend.matrix import AugmentedMatrix
+from backend.streaming import content_step_events, encode_event, encode_row_deltas, stream_events
+
+from fractions import Fraction
+from threading import Event
+import json
+import random
+
+import pytest
+
+
+def solved_content(matrix):
+    return {"rowOperationsContent": matrix.action_logger.row_ops_content, "solution": None}
+
+
+def rebuild_content(events):
+    """Row operations content made up by the start and step events."""
+
+    row_op_infos, matrices, constant_matrices = [], [], []
+
+    for event in events:
+        if event["type"] == "start":
+            row_op_infos.append(("Starting Matrix",))
+            matrices.append(event["matrix"])
+            constant_matrices.append(event["constMatrix"])
+        elif event["type"] == "step":
+            matrix, constant_matrix = matrices[-1].copy(), constant_matrices[-1].copy()
+            for row, matrix_row, constant_row in event["rows"]:
+                matrix[row] = matrix_row
+                constant_matrix[row] = constant_row
+
+            row_op_infos.append(tuple(event["rowOp"]))
+            matrices.append(matrix)
+            constant_matrices.append(constant_matrix)
+
+    return [row_op_infos, matrices, constant_matrices]
+
+
+class TestStreamEvents():
+    @pytest.fixture
+    def starting_system(self):
+        return [[2, 1, 1], [4, 3, 3], [8, 7, 9]], [[4], [10], [24]]
+
+    def test_steps_as_they_happen(self, starting_system):
+        coeff_matrix, const_matrix = starting_system
+        A = AugmentedMatrix(coeff_matrix, const_matrix, (3, 4), log_mode="delta")
+        starting_content = A.action_logger.row_ops_content
+
+        eliminated = Event()
+        finish = Event()
+
+        def solve(listener):
+            A.action_logger.add_listener(listener)
+            A.gaussian_elimination(gauss_jordan=True)
+            eliminated.set()
+
+            # Hold off returning until the steps were read
+            finish.wait()
+            return solved_content(A)
+
+        events = stream_events(solve, starting_content[1][0], starting_content[2][0], dict)
+        assert next(events)["type"] == "start"
+
+        num_steps = len(A.action_logger.row_ops_content[0]) if eliminated.wait(5) else 0
+        step_events = [next(events) for _ in range(num_steps - 1)]
+        assert all(event["type"] == "step" for event in step_events)
+
+        finish.set()
+        result = list(events)
+
+        assert result == [{"type": "result", "solution": None}]
+        assert rebuild_content([{"type": "start", "matrix": starting_content[1][0], "constMatrix": starting_content[2][0]}, *step_events]) == A.action_logger.row_ops_content
+
+    def test_steps_from_content(self, starting_system):
+        """Steps that were not logged through the listener come from the solved content."""
+
+        coeff_matrix, const_matrix = starting_system
+        A = AugmentedMatrix(coeff_matrix, const_matrix, (3, 4), log_mode="delta")
+        starting_content = A.action_logger.row_ops_content
+        A.gaussian_elimination()
+
+        events = list(stream_events(lambda listener: solved_content(A), starting_content[1][0], starting_content[2][0], dict))
+
+        assert rebuild_content(events) == A.action_logger.row_ops_content
+        assert events[-1]["type"] == "result"
+
+    def test_error(self):
+        def solve(listener):
+            raise ValueError("Invalid")
+
+        events = list(stream_events(solve, [["1"]], [["1"]], dict))
+
+        assert events[-1] == {"type": "error", "description": "Could not solve matrix"}
+
+
+class TestEncodeRowDeltas():
+    def test_vary_systems(self):
+        """Should decode back into the row operations content."""
+
+        rng = random.Random(52)
+
+        for i in range(50):
+            m, n = rng.randint(1, 6), rng.randint(1, 6)
+            coeff_matrix = [[rng.choice([0, 1, -2, 3, Fraction(1, 2)]) for _ in range(n)] for _ in range(m)]
+            const_matrix = [[rng.randint(-9, 9)] for _ in range(m)]
+
+            A = AugmentedMatrix(coeff_matrix, const_matrix, (m, n + 1), log_mode="delta")
+            A.gaussian_elimination(gauss_jordan=rng.choice([False, True]))
+
+            row_ops_content = A.action_logger.row_ops_content
+            row_deltas = encode_row_deltas(row_ops_content)
+
+            events = [{"type": "start", "matrix": row_deltas["matrix"], "constMatrix": row_deltas["constMatrix"]}]
+            events += [{"type": "step", **step} for step in row_deltas["steps"]]
+
+            assert rebuild_content(events) == row_ops_content
+
+
+class TestEncodeEvent():
+    def test_formats(self):
+        event = next(content_step_events([[("Starting Matrix",), ("swap_rows", "1", "2")], [[["0"], ["1"]], [["1"], ["0"]]], [[None, None], [None, None]]]))
+
+        assert json.loads(encode_event(event, "ndjson")) == {
+            "type": "step",
+            "rowOp": ["swap_rows", "1", "2"],
+            "rows": [[0, ["1"], None], [1, ["0"], None]]
+        }
+
+        assert encode_event(event, "sse").startswith("event: step\ndata: {")
+        assert encode_event(event, "sse").endswith("}\n\n")
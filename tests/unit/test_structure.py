@@ -0,0 +1,118 @@
+from backend.matrix import AugmentedMatrix, Matrix
+from backend.structure import bandwidths, classify_structure
+
+from copy import deepcopy
+from fractions import Fraction
+import random
+
+import pytest
+
+
+def random_matrix(rng, n, structure):
+    def entry():
+        return rng.choice([1, -1, 2, rng.randint(-9, 9) or 3, Fraction(rng.randint(1, 9), rng.randint(2, 9))])
+
+    matrix_data = [[0] * n for _ in range(n)]
+
+    if structure == "permuted_identity":
+        columns = list(range(n))
+        rng.shuffle(columns)
+        if columns == sorted(columns):
+            columns.reverse()
+        for curr_row, column in enumerate(columns):
+            matrix_data[curr_row][column] = entry()
+
+        return matrix_data
+
+    for curr_row in range(n):
+        for curr_column in range(n):
+            if structure == "upper_triangular" and curr_column > curr_row:
+                matrix_data[curr_row][curr_column] = entry()
+            elif structure == "lower_triangular" and curr_column < curr_row:
+                matrix_data[curr_row][curr_column] = entry()
+            elif structure == "banded" and 0 < abs(curr_column - curr_row) <= 1:
+                matrix_data[curr_row][curr_column] = entry()
+
+        matrix_data[curr_row][curr_row] = entry()
+
+    return matrix_data
+
+
+class TestClassifyStructure():
+    @pytest.mark.parametrize("matrix_data, structure", [
+        ([[2, 0], [0, 3]], "diagonal"),
+        ([[0, 2, 0], [0, 0, 1], [5, 0, 0]], "permuted_identity"),
+        ([[1, 2], [0, 3]], "upper_triangular"),
+        ([[1, 0], [2, 3]], "lower_triangular"),
+        ([[1, 2], [3, 4]], "general"),
+        ([[0, 1], [1, 1]], "general"),
+        ([[1, 0], [0, 0]], "general"),
+        ([[1, 2, 3]], "general"),
+    ])
+    def test_structures(self, matrix_data, structure):
+        assert classify_structure(matrix_data, len(matrix_data), len(matrix_data[0])) == structure
+
+    def test_banded(self):
+        matrix_data = random_matrix(random.Random(52), 12, "banded")
+
+        assert bandwidths(matrix_data) == (1, 1)
+        assert classify_structure(matrix_data, 12, 12) == "banded"
+
+        # Too wide of a band for its size
+        assert classify_structure([row[:4] for row in matrix_data[:4]], 4, 4) == "general"
+
+
+class TestStructuredElimination():
+    @pytest.mark.parametrize("structure", ["diagonal", "permuted_identity", "upper_triangular", "lower_triangular", "banded"])
+    def test_vary_matrices(self, structure):
+        """Should give the same RREF as general gaussian_elimination."""
+
+        rng = random.Random(52)
+
+        for i in range(30):
+            n = rng.randint(12, 16) if structure == "banded" else rng.randint(2, 8)
+            coeff_matrix = random_matrix(rng, n, structure)
+            const_matrix = [[rng.randint(-9, 9)] for _ in range(n)]
+            assert classify_structure(coeff_matrix, n, n) == structure
+
+            A = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (n, n + 1))
+            A.gaussian_elimination(gauss_jordan=True)
+
+            B = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (n, n + 1))
+            B.gaussian_elimination(gauss_jordan=True, structure=structure)
+
+            assert B.data == A.data
+            assert B.constant_matrix == A.constant_matrix
+            assert len(B.action_logger.row_ops) <= len(A.action_logger.row_ops)
+
+            C = AugmentedMatrix(deepcopy(coeff_matrix), deepcopy(const_matrix), (n, n + 1))
+            C.gaussian_elimination(structure=structure)
+            assert C.is_echelon()
+
+    def test_minimal_row_ops(self):
+        A = Matrix([[2, 0, 0], [3, 1, 0], [0, 4, 5]], (3, 3))
+        A.gaussian_elimination(structure="lower_triangular")
+
+        assert A.action_logger.row_ops_content[0] == [
+            ("Starting Matrix",),
+            ("multiply_row", "1", "1/2"),
+            ("row_multiple_to_row", "2", "-3", "1"),
+            ("row_multiple_to_row", "3", "-4", "2"),
+            ("multiply_row", "3", "1/5"),
+        ]
+        assert A.data == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+
+    def test_banded_zero_pivot(self):
+        # Non-zero diagonal, but the second pivot turns into a 0
+        n = 8
+        matrix_data = [[0] * n for _ in range(n)]
+        for curr_row in range(n):
+            matrix_data[curr_row][curr_row] = 1
+        matrix_data[0][1] = matrix_data[1][0] = 1
+
+        A = Matrix(deepcopy(matrix_data), (n, n))
+        A.gaussian_elimination(gauss_jordan=True)
+
+        B = Matrix(deepcopy(matrix_data), (n, n))
+        B.gaussian_elimination(gauss_jordan=True, structure="banded")
+        assert B.data == A.data